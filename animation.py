@@ -0,0 +1,134 @@
+"""
+스프라이트 애니메이션 (상태별 프레임 선택, 공유 시계, 미리 뒤집은 프레임 캐시)
+"""
+import pygame
+from piskel_loader import PiskelLoader
+
+# 애니메이션 상태
+ANIM_IDLE = 'idle'
+ANIM_WALK = 'walk'
+ANIM_JUMP = 'jump'
+ANIM_ATTACK = 'attack'
+
+# 상태별 기본 프레임 번호 (Piskel 프레임 순서: 0 대기, 1~4 걷기, 5 점프, 6~7 공격)
+# 시트에 없는 프레임은 빠지고, 프레임이 하나도 없는 상태는 대기 프레임 사용
+DEFAULT_STATE_FRAMES = {
+    ANIM_IDLE: (0,),
+    ANIM_WALK: (1, 2, 3, 4),
+    ANIM_JUMP: (5,),
+    ANIM_ATTACK: (6, 7),
+}
+
+
+class AnimationClock:
+    """공유 애니메이션 시계 - 프레임마다 한 번만 진행하고 모든 애니메이션이 같은 시간을 사용"""
+    
+    def __init__(self):
+        self.time = 0.0
+    
+    def update(self, dt):
+        """시계 진행"""
+        self.time += dt
+
+
+animation_clock = AnimationClock()
+
+
+class SpriteSheet:
+    """스프라이트 시트 클래스 - 크기 변환한 프레임과 뒤집은 프레임을 한 번만 만들어 공유"""
+    
+    _cache = {}  # {(full_path, (width, height)): SpriteSheet}
+    
+    def __init__(self, frames, fps=12, state_frames=None, flipped_frames=None, source=None, pending=False):
+        self.frames = frames
+        # 파일에서 만든 시트면 (파일 경로, 크기, state_frames)
+        self.source = source
+        # 디코딩 중인 자리 표시 시트거나 파일이 바뀌었으면 True - 쓰는 곳에서 refresh()로 새 시트 받기
+        self.pending = pending
+        if flipped_frames is None:
+            flipped_frames = [pygame.transform.flip(frame, True, False) for frame in frames]
+        self.flipped_frames = flipped_frames
+        self.fps = fps
+        if state_frames is None:
+            state_frames = DEFAULT_STATE_FRAMES
+        frame_count = len(frames)
+        self.states = {}
+        for state, indices in state_frames.items():
+            self.states[state] = tuple(index for index in indices if index < frame_count)
+        if not self.states.get(ANIM_IDLE):
+            self.states[ANIM_IDLE] = (0,)
+        for state, indices in self.states.items():
+            if not indices:
+                self.states[state] = self.states[ANIM_IDLE]
+    
+    @staticmethod
+    def load(file_path, size, state_frames=None):
+        """Piskel 파일의 스프라이트 시트 (파일과 크기별로 공유, 파일을 읽지 못하면 None)"""
+        key = (PiskelLoader.get_resource_path(file_path), tuple(size))
+        sheet = SpriteSheet._cache.get(key)
+        if sheet is not None:
+            return sheet
+        
+        if PiskelLoader.is_pending(file_path):
+            # 디코딩 중 - 자리 표시 프레임 하나짜리 시트 (캐시하지 않음)
+            placeholder = PiskelLoader.load_variant(file_path, key[1])
+            return SpriteSheet([placeholder], 12, state_frames, [placeholder], (file_path, key[1], state_frames), True)
+        
+        frames = PiskelLoader.load_frames(file_path)
+        if not frames:
+            return None
+        # 크기 변환/뒤집은 프레임은 PiskelLoader 파생 이미지 캐시에서
+        frame_range = range(len(frames))
+        scaled_frames = [PiskelLoader.load_variant(file_path, key[1], frame=index) for index in frame_range]
+        flipped_frames = [PiskelLoader.load_variant(file_path, key[1], flip=True, frame=index) for index in frame_range]
+        sheet = SpriteSheet(scaled_frames, PiskelLoader.get_fps(file_path), state_frames, flipped_frames,
+                            (file_path, key[1], state_frames))
+        SpriteSheet._cache[key] = sheet
+        return sheet
+    
+    @staticmethod
+    def invalidate(full_path):
+        """파일이 바뀌었을 때 그 파일의 시트만 캐시에서 빼고, 쓰던 곳에서 refresh()로 새 시트를 받게 함"""
+        for key in [key for key in SpriteSheet._cache if key[0] == full_path]:
+            SpriteSheet._cache.pop(key).pending = True
+    
+    def refresh(self):
+        """pending 시트의 새 시트 반환 (디코딩 중이거나 파일을 읽지 못하면 자신)"""
+        file_path, size, state_frames = self.source
+        if PiskelLoader.is_pending(file_path):
+            return self
+        return SpriteSheet.load(file_path, size, state_frames) or self
+    
+    def get_frame_index(self, state, time):
+        """상태와 상태 시작 후 경과 시간으로 프레임 번호 계산"""
+        indices = self.states.get(state) or self.states[ANIM_IDLE]
+        return indices[int(time * self.fps) % len(indices)]
+    
+    def get_frame(self, state, time, facing_right=True):
+        """프레임 Surface 반환 (왼쪽을 보면 미리 뒤집은 프레임)"""
+        index = self.get_frame_index(state, time)
+        if facing_right:
+            return self.frames[index]
+        return self.flipped_frames[index]
+
+
+class Animator:
+    """애니메이션 컴포넌트 - 엔티티 상태에 맞는 프레임 선택 (상태가 바뀌면 첫 프레임부터)"""
+    
+    def __init__(self, sheet, clock=None):
+        self.sheet = sheet
+        self.clock = clock if clock is not None else animation_clock
+        self.state = ANIM_IDLE
+        self.state_start = self.clock.time
+    
+    def set_state(self, state):
+        """상태 변경 (같은 상태면 이어서 재생)"""
+        if state != self.state:
+            self.state = state
+            self.state_start = self.clock.time
+    
+    def get_frame(self, facing_right=True):
+        """현재 프레임 Surface 반환"""
+        if self.sheet.pending:
+            self.sheet = self.sheet.refresh()
+        return self.sheet.get_frame(self.state, self.clock.time - self.state_start, facing_right)
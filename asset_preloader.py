@@ -0,0 +1,76 @@
+"""
+에셋 미리 로드 (메뉴가 떠 있는 동안 작업 스레드에서 .piskel 디코딩)
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from piskel_loader import PiskelLoader
+from world import BLOCK_IMAGE_PATHS
+from inventory import ITEM_IMAGE_PATHS
+from player import PLAYER_IMAGE_PATHS
+from enemy import ZOMBIE_IMAGE_PATH
+from npc import PIKU_IMAGE_PATH
+
+
+def get_known_asset_paths():
+    """게임에서 사용하는 에셋 경로 리스트 (중복 제거, 블록 -> 플레이어 -> 좀비/NPC -> 아이템 순서)"""
+    paths = []
+    for path in (list(BLOCK_IMAGE_PATHS.values()) + list(PLAYER_IMAGE_PATHS.values()) +
+                 [ZOMBIE_IMAGE_PATH, PIKU_IMAGE_PATH] + list(ITEM_IMAGE_PATHS.values())):
+        if path and path not in paths:
+            paths.append(path)
+    return paths
+
+
+class AssetPreloader:
+    """에셋 미리 로드 클래스 - 스레드 풀에서 디코딩하고, 메인 스레드에서 매 프레임 결과를 반영
+    
+    디코딩이 끝나기 전에 요청된 이미지는 자리 표시 이미지로 그려지고, 끝나면 같은 Surface에 실제 이미지가 그려짐
+    """
+    
+    def __init__(self, paths=None, max_workers=None):
+        self.paths = paths if paths is not None else get_known_asset_paths()
+        if max_workers is None:
+            max_workers = min(4, os.cpu_count() or 1)
+        self.max_workers = max_workers
+        self.executor = None
+        self.total = 0  # 디코딩을 시작한 에셋 수 (없는 파일 제외)
+        self.remaining = 0
+    
+    def start(self):
+        """모든 에셋 디코딩 시작 (메인 스레드에서 호출)"""
+        if self.executor is not None:
+            return
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='asset-preload')
+        for path in self.paths:
+            try:
+                if PiskelLoader.preload(path, self.executor):
+                    self.total += 1
+            except Exception as e:
+                print(f"Error preloading {path}: {e}")
+        self.remaining = PiskelLoader.process_pending()
+        if not self.remaining:
+            self.shutdown()
+    
+    def update(self):
+        """끝난 디코딩 결과를 반영 (매 프레임 호출, 기다리지 않음)"""
+        if self.executor is None:
+            return
+        self.remaining = PiskelLoader.process_pending()
+        if not self.remaining:
+            self.shutdown()
+    
+    def is_done(self):
+        """모든 에셋 로드가 끝났는지"""
+        return self.remaining == 0
+    
+    def get_progress(self):
+        """진행률 (0.0 ~ 1.0)"""
+        if not self.total:
+            return 1.0
+        return 1.0 - self.remaining / self.total
+    
+    def shutdown(self):
+        """스레드 풀 종료 (남은 작업은 기다리지 않음)"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
@@ -0,0 +1,64 @@
+"""
+에셋 굽기 스크립트
+fig/ 폴더의 .piskel 파일을 미리 디코딩해서 RGBA 프레임 번들(data/assets.bin)로 저장
+빌드 전에 실행: python bake_assets.py
+"""
+import json
+import os
+import struct
+import sys
+import pygame
+from piskel_loader import PiskelLoader, BUNDLE_PATH, BUNDLE_MAGIC, BUNDLE_VERSION, BUNDLE_HEADER
+
+
+def bake_assets(source_dir='fig', output_path=BUNDLE_PATH):
+    """source_dir 아래의 모든 .piskel 파일을 번들 하나로 저장하고 에셋 수 반환"""
+    index = {}
+    frame_data = bytearray()
+    source_path = PiskelLoader.get_resource_path(source_dir)
+    
+    for root, dirs, files in os.walk(source_path):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith('.piskel'):
+                continue
+            full_path = os.path.join(root, name)
+            key = PiskelLoader.get_asset_key(full_path)
+            try:
+                frames, fps = PiskelLoader.decode_piskel(full_path)
+            except Exception as e:
+                print(f"Error baking {key}: {e}")
+                continue
+            if not frames:
+                print(f"Error baking {key}: no frames")
+                continue
+            
+            width, height = frames[0].get_size()
+            offsets = []
+            for frame in frames:
+                offsets.append(len(frame_data))
+                frame_data += pygame.image.tostring(frame, 'RGBA')
+            index[key] = {
+                'width': width,
+                'height': height,
+                'fps': fps,
+                'frames': offsets,
+                'mtime': os.path.getmtime(full_path),  # 개발 중 원본이 바뀌었는지 확인용
+            }
+    
+    index_data = json.dumps(index, ensure_ascii=False).encode('utf-8')
+    output_full_path = PiskelLoader.get_resource_path(output_path)
+    os.makedirs(os.path.dirname(output_full_path), exist_ok=True)
+    temp_path = output_full_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(struct.pack(BUNDLE_HEADER, BUNDLE_MAGIC, BUNDLE_VERSION, len(index_data)))
+        f.write(index_data)
+        f.write(frame_data)
+    os.replace(temp_path, output_full_path)
+    return len(index)
+
+
+if __name__ == '__main__':
+    source = sys.argv[1] if len(sys.argv) > 1 else 'fig'
+    count = bake_assets(source)
+    print(f"{count}개 에셋을 {BUNDLE_PATH}에 저장했습니다.")
@@ -45,6 +45,15 @@ if exist build\exe.win-amd64-3.12 (
     )
 )
 
+echo.
+echo Baking assets (fig -^> data\assets.bin)...
+python bake_assets.py
+if errorlevel 1 (
+    echo ERROR: Failed to bake assets!
+    pause
+    exit /b 1
+)
+
 echo.
 echo [4/5] Building executable...
 echo This may take a few minutes...
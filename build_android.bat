@@ -22,6 +22,15 @@ if errorlevel 1 (
     exit /b 1
 )
 
+echo.
+echo 에셋 번들 생성 중 (fig -^> data\assets.bin)...
+python bake_assets.py
+if errorlevel 1 (
+    echo ERROR: 에셋 번들 생성 실패!
+    pause
+    exit /b 1
+)
+
 echo.
 echo [3/3] 안드로이드 APK 빌드 중...
 echo 이 작업은 시간이 오래 걸릴 수 있습니다 (10-30분)...
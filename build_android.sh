@@ -16,6 +16,10 @@ fi
 echo "Python-for-Android 의존성 설치 중..."
 pip install cython
 
+# 에셋 번들 생성 (.piskel -> data/assets.bin)
+echo "에셋 번들 생성 중..."
+python bake_assets.py || exit 1
+
 # 안드로이드 빌드
 echo "안드로이드 APK 빌드 중..."
 echo "이 작업은 시간이 오래 걸릴 수 있습니다 (10-30분)..."
@@ -13,6 +13,8 @@ class Camera:
         self.screen_height = screen_height
         self.x = 0
         self.y = 0
+        self.prev_x = 0  # 이전 시뮬레이션 스텝 위치 (렌더링 보간용)
+        self.prev_y = 0
         self.target_x = 0
         self.target_y = 0
         self.smooth_factor = 0.15  # 부드러움 정도 (0.0 ~ 1.0, 작을수록 더 부드러움)
@@ -29,6 +31,10 @@ class Camera:
         self.x = lerp(self.x, self.target_x, lerp_factor)
         self.y = lerp(self.y, self.target_y, lerp_factor)
     
+    def get_render_pos(self, alpha):
+        """이전/현재 스텝 사이를 보간한 렌더링용 카메라 위치 반환"""
+        return (lerp(self.prev_x, self.x, alpha), lerp(self.prev_y, self.y, alpha))
+    
     def get_pos(self):
         """카메라 위치 반환"""
         return (self.x, self.y)
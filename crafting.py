@@ -4,6 +4,7 @@
 import pygame
 from utils import Colors, draw_text_with_shadow
 from piskel_loader import PiskelLoader
+from inventory import ITEM_IMAGE_PATHS
 
 
 class Crafting:
@@ -123,23 +124,9 @@ class Crafting:
         return True
     
     def get_item_image(self, item_type):
-        """아이템 이미지 가져오기"""
-        image_paths = {
-            'portal': 'fig/block/portal.piskel',
-            'ground': 'fig/block/ground.piskel',
-            'tree': 'fig/block/tree.piskel',
-            'tree_leaf': 'fig/block/tree_leaf.piskel',
-            'wood_plank': 'fig/block/나무판자.piskel',
-            'plank_board': 'fig/block/판자판.piskel',
-            'water': 'fig/block/water.piskel',
-            'stick_wood': 'fig/tool/tool/stick/stick_wood.piskel',
-            'wood_dt': 'fig/tool/ax/wood_DT.piskel',
-        }
-        
-        if item_type in image_paths and image_paths[item_type]:
-            image = PiskelLoader.load_piskel(image_paths[item_type])
-            if image:
-                return pygame.transform.scale(image, (self.slot_size - 4, self.slot_size - 4))
+        """아이템 이미지 가져오기 (크기 변환 이미지는 PiskelLoader 캐시에서 공유)"""
+        if ITEM_IMAGE_PATHS.get(item_type):
+            return PiskelLoader.load_variant(ITEM_IMAGE_PATHS[item_type], (self.slot_size - 4, self.slot_size - 4))
         
         return None
     
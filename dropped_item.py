@@ -0,0 +1,376 @@
+"""
+떨어진 아이템 엔티티 (채굴한 블록 등) - 간단한 물리, 같은 종류끼리 합치기, 멈추면 잠자기
+"""
+import random
+from collections import deque
+import pygame
+from inventory import ITEM_IMAGE_PATHS
+from texture_atlas import atlas
+from spatial_hash import SpatialHash
+from utils import Colors
+
+
+class DroppedItem:
+    """떨어진 아이템 클래스 - PhysicsSystem.step_entity로 이동"""
+    
+    def __init__(self, x, y, item_type, count, size, spawn_time):
+        self.x = x
+        self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.width = size
+        self.height = size
+        self.vel_x = random.uniform(-1.5, 1.5)
+        self.vel_y = -4.0  # 살짝 튀어오름
+        self.gravity = 1.0
+        self.on_ground = False
+        self.item_type = item_type
+        self.count = count
+        self.spawn_time = spawn_time  # 생성 시각 (줍기 지연, 사라지는 시간, 오래된 순서 계산용)
+        self.rest_steps = 0  # 바닥에 멈춰 있던 스텝 수
+        self.sleep_key = None  # 잠든 경우 발밑 청크 (chunk_x, chunk_y)
+        self.is_alive = True
+
+
+class DroppedItemManager:
+    """떨어진 아이템 관리 클래스
+    
+    바닥에 멈춘 아이템은 잠들어서 물리/합치기를 건너뛰고, 발밑 청크의 revision이 바뀌면 깨어남.
+    생성 시 주변의 같은 종류 아이템에 합치고, 최대 개수를 넘으면 같은 종류에 합치거나
+    가장 오래된 아이템을 대기열(overflow)로 옮김 (자리가 나면 다시 꺼냄, 세이브에도 포함)
+    """
+    
+    def __init__(self, world, physics, block_size=32, max_items=128, max_stack=100,
+                 merge_radius=None, pickup_delay=0.5, despawn_time=300.0, sleep_steps=10):
+        self.world = world
+        self.physics = physics
+        self.block_size = block_size
+        self.size = block_size // 2
+        self.max_items = max_items  # 동시에 존재하는 최대 아이템 엔티티 수
+        self.max_stack = max_stack  # 엔티티 하나에 합칠 수 있는 최대 개수
+        self.merge_radius = merge_radius if merge_radius is not None else block_size * 1.5
+        self.pickup_delay = pickup_delay  # 생성 후 주울 수 있을 때까지 시간 (초)
+        self.despawn_time = despawn_time  # 사라지는 시간 (초)
+        self.sleep_steps = sleep_steps  # 이만큼 멈춰 있으면 잠듦
+        self.time = 0.0
+        self.awake = []  # 움직이는 아이템
+        self.sleeping = {}  # 발밑 청크 (chunk_x, chunk_y) -> (revision, [아이템])
+        self.count = 0
+        self.overflow = deque()  # 최대 개수 때문에 밀려난 아이템 상태 (x, y, item_type, count) - 오래된 순서
+        self.revision = 0  # 아이템 종류/개수가 바뀔 때마다 증가 (세이브 저널 기록용)
+        self.hash = SpatialHash(block_size * 2)
+        self.despawn_timer = 0.0
+    
+    def __len__(self):
+        return self.count
+    
+    def __iter__(self):
+        yield from self.awake
+        for _, items in self.sleeping.values():
+            yield from items
+    
+    def clear(self):
+        """모든 아이템 제거"""
+        self.awake = []
+        self.sleeping.clear()
+        self.count = 0
+        self.overflow.clear()
+        self.hash.clear()
+        self.revision += 1
+    
+    def _merge_into(self, target, count):
+        """target에 넣을 수 있는 만큼 합치고 남은 개수 반환"""
+        add_amount = min(count, self.max_stack - target.count)
+        if add_amount <= 0:
+            return count
+        target.count += add_amount
+        self.revision += 1
+        return count - add_amount
+    
+    def _find_merge_target(self, item_type, x, y, radius, exclude=None):
+        """주변의 합칠 수 있는 같은 종류 아이템 찾기 (가장 가까운 것)"""
+        best = None
+        best_distance = None
+        for other in self.hash.query_radius(x, y, radius):
+            if other is exclude or not other.is_alive or other.item_type != item_type:
+                continue
+            if other.count >= self.max_stack:
+                continue
+            distance = (other.x - x) ** 2 + (other.y - y) ** 2
+            if best is None or distance < best_distance:
+                best = other
+                best_distance = distance
+        return best
+    
+    def _evict_oldest(self):
+        """가장 오래된 아이템을 대기열로 옮김 (최대 개수 초과 시, 아이템은 사라지지 않음)"""
+        oldest = min(self, key=lambda item: item.spawn_time, default=None)
+        if oldest is not None:
+            self.overflow.append((oldest.x, oldest.y, oldest.item_type, oldest.count))
+            self._kill(oldest)
+            self._remove_dead()
+    
+    def spawn(self, item_type, x, y, count=1):
+        """아이템 드롭 (x, y는 아이템 중심) - 주변 같은 종류에 먼저 합침"""
+        left = x - self.size / 2
+        top = y - self.size / 2
+        while count > 0:
+            target = self._find_merge_target(item_type, left, top, self.merge_radius)
+            if target is None and self.count >= self.max_items:
+                # 최대 개수 - 멀리 있는 같은 종류에라도 합치고, 없으면 가장 오래된 아이템을 대기열로
+                target = self._find_nearest_same_type(item_type, left, top)
+                if target is None:
+                    self._evict_oldest()
+            if target is not None:
+                count = self._merge_into(target, count)
+                continue
+            
+            add_amount = min(count, self.max_stack)
+            item = DroppedItem(left, top, item_type, add_amount, self.size, self.time)
+            self.awake.append(item)
+            self.count += 1
+            self.hash.insert(item)
+            self.revision += 1
+            count -= add_amount
+    
+    def _find_nearest_same_type(self, item_type, x, y):
+        """거리와 상관없이 합칠 수 있는 같은 종류 아이템 중 가장 가까운 것"""
+        best = None
+        best_distance = None
+        for other in self:
+            if not other.is_alive or other.item_type != item_type or other.count >= self.max_stack:
+                continue
+            distance = (other.x - x) ** 2 + (other.y - y) ** 2
+            if best is None or distance < best_distance:
+                best = other
+                best_distance = distance
+        return best
+    
+    def _kill(self, item):
+        """아이템 제거 표시 (실제 제거는 _remove_dead)"""
+        if item.is_alive:
+            item.is_alive = False
+            self.hash.remove(item)
+            self.revision += 1
+    
+    def _remove_dead(self):
+        """제거 표시된 아이템을 목록에서 정리"""
+        self.awake = [item for item in self.awake if item.is_alive]
+        for key in list(self.sleeping):
+            revision, items = self.sleeping[key]
+            items = [item for item in items if item.is_alive]
+            if items:
+                self.sleeping[key] = (revision, items)
+            else:
+                del self.sleeping[key]
+        self.count = len(self.awake) + sum(len(items) for _, items in self.sleeping.values())
+    
+    def _get_foot_chunk(self, item):
+        """아이템 발밑 블록이 속한 청크"""
+        chunk_pixel_size = self.world.chunk_size * self.block_size
+        return (int((item.x + item.width / 2) // chunk_pixel_size),
+                int((item.y + item.height) // chunk_pixel_size))
+    
+    def _wake_changed_chunks(self):
+        """발밑 청크가 바뀐(블록이 부서지거나 놓인) 잠든 아이템을 깨움"""
+        get_chunk_revision = self.world.get_chunk_revision
+        for key in [key for key, (revision, _) in self.sleeping.items()
+                    if get_chunk_revision(key[0], key[1]) != revision]:
+            _, items = self.sleeping.pop(key)
+            for item in items:
+                item.sleep_key = None
+                item.rest_steps = 0
+            self.awake.extend(items)
+    
+    def _sleep(self, item):
+        """아이템을 잠들게 함 (발밑 청크의 revision 기록)"""
+        key = self._get_foot_chunk(item)
+        revision = self.world.get_chunk_revision(key[0], key[1])
+        item.sleep_key = key
+        item.vel_x = 0
+        item.vel_y = 0
+        item.prev_x = item.x  # 잠든 동안은 이전 위치를 갱신하지 않으므로 보간 위치 고정
+        item.prev_y = item.y
+        entry = self.sleeping.get(key)
+        if entry is None:
+            entry = self.sleeping[key] = (revision, [])
+        entry[1].append(item)
+    
+    def store_previous_positions(self):
+        """시뮬레이션 스텝 전 위치 저장 (렌더링 보간용, 잠든 아이템은 움직이지 않음)"""
+        for item in self.awake:
+            item.prev_x = item.x
+            item.prev_y = item.y
+    
+    def update(self, dt, player, inventory):
+        """시뮬레이션 스텝 - 깨어 있는 아이템만 이동/합치기, 플레이어 주변 아이템 줍기"""
+        self.time += dt
+        if self.sleeping:
+            self._wake_changed_chunks()
+        
+        step_entity = self.physics.step_entity
+        update_hash = self.hash.update
+        still_awake = []
+        for item in self.awake:
+            if not item.is_alive:
+                continue
+            step_entity(item, dt)
+            item.vel_x *= 0.8  # 마찰
+            if abs(item.vel_x) < 0.05:
+                item.vel_x = 0
+            update_hash(item)
+            
+            # 같은 종류 아이템과 합치기 (작은 쪽을 큰 쪽으로)
+            target = self._find_merge_target(item.item_type, item.x, item.y, self.merge_radius, exclude=item)
+            if target is not None:
+                if target.count >= item.count:
+                    item.count = self._merge_into(target, item.count)
+                    if item.count <= 0:
+                        self._kill(item)
+                        continue
+                else:
+                    target.count = self._merge_into(item, target.count)
+                    if target.count <= 0:
+                        self._kill(target)
+            
+            # 바닥에 멈춰 있으면 잠듦
+            if item.on_ground and item.vel_x == 0:
+                item.rest_steps += 1
+                if item.rest_steps >= self.sleep_steps:
+                    self._sleep(item)
+                    continue
+            else:
+                item.rest_steps = 0
+            still_awake.append(item)
+        self.awake = still_awake
+        
+        self._pickup(player, inventory)
+        
+        # 오래된 아이템 제거 (1초마다 확인)
+        self.despawn_timer -= dt
+        if self.despawn_timer <= 0:
+            self.despawn_timer = 1.0
+            expire_time = self.time - self.despawn_time
+            for item in self:
+                if item.spawn_time <= expire_time:
+                    self._kill(item)
+        self._remove_dead()
+        
+        # 자리가 나면 대기열의 아이템을 다시 꺼냄
+        while self.overflow and self.count < self.max_items:
+            self._add_restored(*self.overflow.popleft())
+    
+    def _pickup(self, player, inventory):
+        """플레이어와 겹친 아이템을 인벤토리에 넣음 (인벤토리가 가득 차면 남은 개수는 그대로 남음)"""
+        pickup_time = self.time - self.pickup_delay
+        for item in self.hash.query_rect(player.x, player.y, player.width, player.height):
+            if not item.is_alive or item.spawn_time > pickup_time:
+                continue
+            add_amount = min(item.count, inventory.get_free_space(item.item_type))
+            if add_amount <= 0:
+                continue
+            inventory.add_item(item.item_type, add_amount)
+            item.count -= add_amount
+            self.revision += 1
+            if item.count <= 0:
+                self._kill(item)
+    
+    def unload_evicted(self, world):
+        """언로드된 청크의 아이템(대기열 포함)을 월드에 보관하고 제거"""
+        chunk_pixel_size = world.chunk_size * self.block_size
+        chunks = world.chunks
+        if self.overflow:
+            remaining = deque()
+            for state in self.overflow:
+                key = self._get_state_chunk(state, chunk_pixel_size)
+                if key in chunks:
+                    remaining.append(state)
+                else:
+                    world.store_entity(key, 'item', state)
+            self.overflow = remaining
+        if not self.count:
+            return
+        evicted = False
+        for item in self:
+            key = (int((item.x + item.width / 2) // chunk_pixel_size),
+                   int((item.y + item.height - 1e-6) // chunk_pixel_size))
+            if key not in chunks:
+                world.store_entity(key, 'item', (item.x, item.y, item.item_type, item.count))
+                self._kill(item)
+                evicted = True
+        if evicted:
+            self._remove_dead()
+    
+    def get_save_states(self, world):
+        """세이브할 아이템 상태 리스트 [(chunk_x, chunk_y, x, y, item_type, count)] (살아있는 아이템 + 보관된 아이템)"""
+        chunk_pixel_size = world.chunk_size * self.block_size
+        states = []
+        for item in self:
+            if item.is_alive:
+                chunk_x = int((item.x + item.width / 2) // chunk_pixel_size)
+                chunk_y = int((item.y + item.height - 1e-6) // chunk_pixel_size)
+                states.append((chunk_x, chunk_y, item.x, item.y, item.item_type, item.count))
+        for state in self.overflow:
+            states.append(self._get_state_chunk(state, chunk_pixel_size) + tuple(state))
+        for (chunk_x, chunk_y), state in world.get_stored_entities('item'):
+            states.append((chunk_x, chunk_y) + tuple(state))
+        return states
+    
+    def _get_state_chunk(self, state, chunk_pixel_size):
+        """보관용 아이템 상태 (x, y, item_type, count)가 속한 청크"""
+        x, y = state[0], state[1]
+        return (int((x + self.size / 2) // chunk_pixel_size),
+                int((y + self.size - 1e-6) // chunk_pixel_size))
+    
+    def _add_restored(self, x, y, item_type, count):
+        """보관되어 있던 아이템을 다시 추가 (종류/개수는 그대로이므로 revision은 바꾸지 않음)"""
+        item = DroppedItem(x, y, item_type, count, self.size, self.time)
+        item.vel_x = 0
+        item.vel_y = 0
+        self.awake.append(item)
+        self.count += 1
+        self.hash.insert(item)
+    
+    def restore_loaded(self, world):
+        """다시 로드된 청크에 보관되어 있던 아이템 복원 (최대 개수를 넘으면 대기열로)"""
+        for state in world.take_loaded_entities('item'):
+            if self.count < self.max_items:
+                self._add_restored(*state)
+            else:
+                self.overflow.append(state)
+    
+    def draw(self, screen, camera_x, camera_y, alpha=1.0):
+        """화면 안의 아이템 그리기 (alpha: 이전/현재 스텝 사이 보간 비율)"""
+        if not self.count:
+            return
+        size = self.size
+        screen_width = screen.get_width()
+        screen_height = screen.get_height()
+        sprites = {}
+        blit_list = []
+        for item in self:
+            screen_x = int(item.prev_x + (item.x - item.prev_x) * alpha - camera_x)
+            screen_y = int(item.prev_y + (item.y - item.prev_y) * alpha - camera_y)
+            if screen_x + size < 0 or screen_x > screen_width or screen_y + size < 0 or screen_y > screen_height:
+                continue
+            sprite = sprites.get(item.item_type)
+            if sprite is None:
+                sprite = sprites[item.item_type] = self.get_sprite(item.item_type)
+            blit_list.append((sprite[0], (screen_x, screen_y), sprite[1]))
+        if blit_list:
+            screen.blits(blit_list, doreturn=False)
+    
+    def get_sprite(self, item_type):
+        """아이템 스프라이트 (아틀라스 Surface, 영역) - 이미지가 없으면 회색 사각형"""
+        size = (self.size, self.size)
+        path = ITEM_IMAGE_PATHS.get(item_type)
+        sprite = atlas.get_sprite(path, size) if path else None
+        if sprite is None:
+            sprite = atlas.get_surface(('item', item_type, size), self._make_fallback_image)
+        return sprite
+    
+    def _make_fallback_image(self):
+        """이미지가 없는 아이템용 회색 사각형"""
+        image = pygame.Surface((self.size, self.size))
+        image.fill(Colors.GRAY)
+        return image
@@ -2,156 +2,413 @@
 적 클래스 (Zombie)
 """
 import pygame
-import math
-from piskel_loader import PiskelLoader
+import random
+import numpy as np
+from lod import LOD_FULL
+from animation import SpriteSheet, animation_clock, ANIM_IDLE, ANIM_WALK, ANIM_JUMP, ANIM_ATTACK
 from utils import Colors
 
+ZOMBIE_IMAGE_PATH = 'fig/enemy/ZOMBIE.piskel'
 
-class Zombie:
-    """좀비 적 클래스"""
+# ZombieStore 배열 필드 (이름, dtype)
+ZOMBIE_FIELDS = (
+    ('x', np.float64), ('y', np.float64),
+    ('prev_x', np.float64), ('prev_y', np.float64),
+    ('vel_x', np.float64), ('vel_y', np.float64),
+    ('health', np.float64), ('attack_timer', np.float64),
+    ('on_ground', np.bool_),
+    ('target_x', np.float64), ('target_row', np.float64),
+    ('repath_timer', np.float64), ('following', np.bool_),
+    ('step_dt', np.float64),
+    ('chunk_x', np.int64), ('chunk_y', np.int64),  # 소속 청크 (발 위치 기준)
+    ('facing_right', np.bool_),
+    ('attack_start', np.float64),  # 마지막 공격 시각 (animation_clock 기준, 공격 애니메이션용)
+)
+
+
+class ZombieStore:
+    """좀비 저장소 - 위치, 속도, 체력, 타이머를 연속 배열로 보관하고 한 번에 업데이트
+    
+    배열은 용량이 부족할 때만 두 배로 늘리고, 죽거나 제거된 좀비의 핸들은 풀에 모아 재사용
+    """
     
-    def __init__(self, x, y, block_size=32):
+    def __init__(self, block_size=32, capacity=64):
         self.block_size = block_size
         self.width = block_size * 2
         self.height = block_size * 2
-        self.x = x
-        self.y = y
         self.max_health = 150
-        self.health = 150
         self.attack_power = 23
         self.attack_speed = 3.0  # 3초마다 공격
-        self.attack_timer = 0.0
         self.speed = 3.0  # 플레이어보다 3배 느림 (플레이어 속도 9)
-        self.image = None
+        self.gravity = 2.0  # 플레이어와 같은 중력 (60 FPS 기준)
+        self.jump_power = 14  # 한 칸 올라가기용 점프 (약 1.5블록 높이)
+        self.repath_interval = 0.75  # 경로 재탐색 간격 (초)
+        self.attack_animation_time = 0.4  # 공격 애니메이션 길이 (초)
+        self.count = 0
+        self.handles = []  # 인덱스 순서의 Zombie 핸들
+        self.free_handles = []  # 재사용할 핸들 풀 (죽거나 제거된 좀비)
+        self._allocate(capacity)
+        self.sheet = None
         self.load_image()
-        self.is_alive = True
-        
+    
+    def _allocate(self, capacity):
+        """배열 할당 (기존 데이터는 복사)"""
+        count = self.count
+        for name, dtype in ZOMBIE_FIELDS:
+            array = np.zeros(capacity, dtype=dtype)
+            if count:
+                array[:count] = getattr(self, name)[:count]
+            setattr(self, name, array)
+        self.capacity = capacity
+    
     def load_image(self):
-        """좀비 이미지 로드"""
-        image_path = 'fig/enemy/ZOMBIE.piskel'
-        self.image = PiskelLoader.load_piskel(image_path)
-        if self.image:
-            self.image = pygame.transform.scale(self.image, (self.width, self.height))
-        else:
+        """좀비 스프라이트 시트 로드 (모든 좀비가 공유)"""
+        image_path = ZOMBIE_IMAGE_PATH
+        self.sheet = SpriteSheet.load(image_path, (self.width, self.height))
+        if self.sheet is None:
             # 기본 이미지 (초록색 사각형) - 항상 생성
-            self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            self.image.fill((0, 150, 0))
+            image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            image.fill((0, 150, 0))
             # 눈과 입 그리기 (더 명확하게 보이도록)
-            pygame.draw.circle(self.image, (255, 0, 0), (self.width // 3, self.height // 3), 3)
-            pygame.draw.circle(self.image, (255, 0, 0), (self.width * 2 // 3, self.height // 3), 3)
-            pygame.draw.ellipse(self.image, (100, 0, 0), (self.width // 3, self.height * 2 // 3, self.width // 3, self.height // 6))
+            pygame.draw.circle(image, (255, 0, 0), (self.width // 3, self.height // 3), 3)
+            pygame.draw.circle(image, (255, 0, 0), (self.width * 2 // 3, self.height // 3), 3)
+            pygame.draw.ellipse(image, (100, 0, 0), (self.width // 3, self.height * 2 // 3, self.width // 3, self.height // 6))
+            self.sheet = SpriteSheet([image])
+    
+    def __len__(self):
+        return self.count
+    
+    def __iter__(self):
+        return iter(self.handles)
+    
+    def spawn(self, x, y):
+        """좀비 생성 - 배열 끝에 추가하고 핸들 반환"""
+        if self.count >= self.capacity:
+            self._allocate(self.capacity * 2)
+        index = self.count
+        self.x[index] = x
+        self.y[index] = y
+        self.prev_x[index] = x
+        self.prev_y[index] = y
+        self.vel_x[index] = 0
+        self.vel_y[index] = 0
+        self.health[index] = self.max_health
+        self.attack_timer[index] = 0.0
+        self.on_ground[index] = False
+        self.target_x[index] = x
+        self.target_row[index] = 0
+        self.repath_timer[index] = random.uniform(0.0, self.repath_interval)  # 재탐색 시점 분산
+        self.following[index] = False
+        self.step_dt[index] = 0.0
+        self.facing_right[index] = True
+        self.attack_start[index] = -np.inf
+        # 풀에 남은 핸들이 있으면 재사용
+        if self.free_handles:
+            handle = self.free_handles.pop()
+            handle.index = index
+            handle.path = None
+            handle.path_index = 0
+        else:
+            handle = Zombie(self, index)
+        self.handles.append(handle)
+        self.count += 1
+        return handle
+    
+    def clear(self):
+        """모든 좀비 제거"""
+        for handle in self.handles:
+            handle.index = -1
+            handle.path = None
+        self.free_handles.extend(self.handles)
+        self.handles.clear()
+        self.count = 0
+    
+    def remove_dead(self):
+        """죽은 좀비를 배열에서 제거"""
+        alive = self.health[:self.count] > 0
+        if not alive.all():
+            self._compact(alive)
     
-    def update(self, dt, player_x, player_y, player, world):
-        """좀비 업데이트 - 플레이어처럼 엄격한 충돌 처리"""
-        if not self.is_alive:
+    def _compact(self, keep):
+        """keep이 True인 좀비만 앞으로 압축 (나머지 핸들은 풀로)"""
+        count = self.count
+        new_count = int(keep.sum())
+        for name, _ in ZOMBIE_FIELDS:
+            array = getattr(self, name)
+            array[:new_count] = array[:count][keep]
+        
+        handles = []
+        for handle, is_kept in zip(self.handles, keep.tolist()):
+            if is_kept:
+                handle.index = len(handles)
+                handles.append(handle)
+            else:
+                handle.index = -1
+                handle.path = None
+                self.free_handles.append(handle)
+        self.handles = handles
+        self.count = new_count
+    
+    def update_ownership(self, chunk_pixel_size):
+        """소속 청크 갱신 - 청크 경계를 넘은 좀비는 새 청크로 이동 (발 중심 기준)"""
+        count = self.count
+        self.chunk_x[:count] = (self.x[:count] + self.width / 2) // chunk_pixel_size
+        self.chunk_y[:count] = (self.y[:count] + self.height - 1e-6) // chunk_pixel_size
+    
+    def unload_evicted(self, world):
+        """언로드된 청크에 속한 좀비를 월드에 보관하고 저장소에서 제거 (보관된 좀비는 비용 없음)"""
+        count = self.count
+        if not count:
+            return
+        self.update_ownership(world.chunk_size * self.block_size)
+        chunks = world.chunks
+        chunk_xs = self.chunk_x[:count].tolist()
+        chunk_ys = self.chunk_y[:count].tolist()
+        keep = np.array([key in chunks for key in zip(chunk_xs, chunk_ys)], dtype=np.bool_)
+        keep &= self.health[:count] > 0
+        if keep.all():
             return
         
-        # 플레이어를 향해 이동 (X축만)
-        dx = player_x - (self.x + self.width // 2)
-        distance = math.sqrt(dx * dx)
-        
-        # X축 이동 처리 (플레이어처럼 분리)
-        new_x = self.x
-        if distance > 0:
-            # 플레이어 쪽으로 이동 (X축만, dt를 고려하여 프레임레이트 독립적)
-            move_x = (dx / distance) * self.speed * dt * 60.0  # 60 FPS 기준으로 정규화
-            new_x = self.x + move_x
-        
-        # X축 충돌 검사 (절대로 블록 통과 불가)
-        if world.check_block_collision(new_x, self.y, self.width, self.height):
-            # X축 충돌 발생 - 이전 위치 유지
-            new_x = self.x
-        
-        # Y축 이동 처리 (땅에 붙어서 다니기, 점프 불가)
-        # 현재 위치에서 땅 찾기
-        zombie_bottom = self.y + self.height
-        ground_y = world.find_ground_y(new_x, zombie_bottom, self.height)
-        new_y = ground_y
-        
-        # Y축 충돌 검사 (절대로 블록 통과 불가)
-        if world.check_block_collision(new_x, new_y, self.width, self.height):
-            # Y축 충돌 발생 - 블록 위에 정확히 서도록
-            # 바닥에 정확히 서도록 다시 계산
-            zombie_bottom = new_y + self.height
-            new_y = world.find_ground_y(new_x, zombie_bottom, self.height)
-            # 다시 충돌 검사
-            if world.check_block_collision(new_x, new_y, self.width, self.height):
-                # 여전히 충돌하면 현재 위치 유지
-                new_y = self.y
-        
-        # 위치 업데이트 (충돌 검사 완료 후)
-        self.x = new_x
-        self.y = new_y
-        
-        # 공격 처리 (X축과 Y축 모두 겹쳐야 데미지)
-        # AABB 충돌 검사
-        zombie_left = self.x
-        zombie_right = self.x + self.width
-        zombie_top = self.y
-        zombie_bottom = self.y + self.height
-        
-        player_left = player.x
-        player_right = player.x + player.width
-        player_top = player.y
-        player_bottom = player.y + player.height
-        
-        # X축과 Y축 모두 겹치는지 확인
-        x_overlap = zombie_right > player_left and zombie_left < player_right
-        y_overlap = zombie_bottom > player_top and zombie_top < player_bottom
-        
-        if x_overlap and y_overlap and self.attack_timer >= self.attack_speed:
-            # 플레이어에게 데미지
-            player.health -= self.attack_power
-            if player.health < 0:
-                player.health = 0
-            self.attack_timer = 0.0
+        for i in np.flatnonzero(~keep).tolist():
+            if self.health[i] > 0:
+                state = (float(self.x[i]), float(self.y[i]), float(self.health[i]), float(self.attack_timer[i]))
+                world.store_entity((chunk_xs[i], chunk_ys[i]), 'zombie', state)
+        self._compact(keep)
+    
+    def restore_loaded(self, world):
+        """다시 로드된 청크에 보관되어 있던 좀비 복원"""
+        for x, y, health, attack_timer in world.take_loaded_entities('zombie'):
+            handle = self.spawn(x, y)
+            self.health[handle.index] = health
+            self.attack_timer[handle.index] = attack_timer
+    
+    def store_previous_positions(self):
+        """시뮬레이션 스텝 전 위치 저장 (렌더링 보간용)"""
+        count = self.count
+        self.prev_x[:count] = self.x[:count]
+        self.prev_y[:count] = self.y[:count]
+    
+    def update(self, dt, player_x, pathfinder=None, goal=None, lod=None):
+        """모든 좀비 업데이트 - 이동 방향과 공격 타이머를 한 번에 계산
+        
+        pathfinder가 있으면 goal 노드까지의 경로를 따라 이동 (걷기/한 칸 점프/낙하),
+        경로가 없는 좀비는 플레이어 쪽으로 X축만 이동.
+        lod가 있으면 가까운 좀비만 길찾기, 먼 좀비는 가끔 단순 추적, 더 먼 좀비는 정지
+        (이번 스텝에 쓸 시간은 step_dt에 저장 - PhysicsSystem.step_store가 사용)
+        """
+        self.remove_dead()
+        count = self.count
+        if not count:
+            return
+        
+        x = self.x[:count]
+        if lod is not None:
+            bands, step_dt = lod.get_step_dt(x, self.y[:count], dt)
+            full = bands == LOD_FULL
+        else:
+            step_dt = np.full(count, dt)
+            full = np.ones(count, dtype=np.bool_)
+        self.step_dt[:count] = step_dt
+        active = step_dt > 0
+        following = self.following[:count]
+        target_x = self.target_x[:count]
+        target_row = self.target_row[:count]
+        block_size = self.block_size
+        foot_row = (self.y[:count] + self.height - 1e-6) // block_size
+        
+        if pathfinder is not None and goal is not None:
+            handles = self.handles
+            
+            # 재탐색 시간이 된 좀비만 경로 요청 (같은 목표의 경로는 공유)
+            repath_timer = self.repath_timer[:count]
+            repath_timer[full] -= dt
+            repath_timer[~full] = 0.0  # 전체 구간에 들어오면 바로 재탐색
+            following[~full] = False  # 먼 좀비는 경로 없이 단순 추적
+            for i in np.flatnonzero(full & (repath_timer <= 0)).tolist():
+                start = pathfinder.get_node(x[i], self.y[i], self.width, self.height)
+                path = pathfinder.get_path(start, goal)
+                if path is None:
+                    continue  # 이번 스텝 탐색 예산 소진 - 다음 스텝에 다시 시도
+                handles[i].path = path
+                handles[i].path_index = 0
+                repath_timer[i] = self.repath_interval
+                following[i] = bool(path)
+                if path:
+                    target_x[i] = path[0][0] * block_size
+                    target_row[i] = path[0][1]
+            
+            # 웨이포인트 도착 판정 (X가 가깝고 목표 행보다 아래에 있지 않으면 다음 웨이포인트로)
+            reached = following & (np.abs(target_x - x) <= self.speed) & (foot_row <= target_row)
+            for i in np.flatnonzero(reached).tolist():
+                handle = handles[i]
+                handle.path_index += 1
+                if handle.path_index < len(handle.path):
+                    node = handle.path[handle.path_index]
+                    target_x[i] = node[0] * block_size
+                    target_row[i] = node[1]
+                else:
+                    handle.path = None
+                    following[i] = False
+            
+            # 위쪽 웨이포인트 앞에서 바닥에 있으면 점프 (한 칸 올라가기)
+            jumping = (following & self.on_ground[:count] & (target_row < foot_row) &
+                       (np.abs(target_x - x) <= block_size * 1.5))
+            self.vel_y[:count][jumping] = -self.jump_power
+        else:
+            following[:] = False
+        
+        # 경로가 없으면 플레이어 쪽으로 (X축만)
+        chase = ~following
+        target_x[chase] = player_x - self.width // 2
+        
+        # 이동 의도만 설정 (중력과 충돌은 PhysicsSystem에서 처리, 이번 스텝에 쉬는 좀비는 그대로)
+        vel_x = self.vel_x[:count]
+        vel_x[active] = np.clip(target_x[active] - x[active], -self.speed, self.speed)
+        moving = active & (vel_x != 0)
+        self.facing_right[:count][moving] = vel_x[moving] > 0
         
         # 공격 타이머 업데이트
-        self.attack_timer += dt
+        self.attack_timer[:count] += step_dt
     
-    def take_damage(self, damage):
-        """데미지 받기"""
-        self.health -= damage
-        if self.health <= 0:
-            self.health = 0
-            self.is_alive = False
-    
-    def draw(self, screen, camera_x, camera_y):
-        """좀비 그리기"""
-        if not self.is_alive:
+    def attack_player(self, player):
+        """플레이어와 겹친 좀비가 공격 (X축과 Y축 모두 겹쳐야 데미지)"""
+        count = self.count
+        if not count:
+            return
+        
+        x = self.x[:count]
+        y = self.y[:count]
+        attacking = ((x + self.width > player.x) & (x < player.x + player.width) &
+                     (y + self.height > player.y) & (y < player.y + player.height) &
+                     (self.health[:count] > 0) &
+                     (self.attack_timer[:count] >= self.attack_speed))
+        hits = int(attacking.sum())
+        if hits:
+            # 플레이어에게 데미지
+            player.health = max(0, player.health - self.attack_power * hits)
+            self.attack_timer[:count][attacking] = 0.0
+            self.attack_start[:count][attacking] = animation_clock.time
+    
+    def _get_frame_ids(self, mask):
+        """mask에 해당하는 좀비들의 애니메이션 프레임 번호 배열 (공격 > 점프 > 걷기 > 대기)"""
+        sheet = self.sheet
+        count = self.count
+        now = animation_clock.time
+        attack_elapsed = now - self.attack_start[:count][mask]
+        # 걷기/대기 주기는 좀비마다 조금씩 어긋나게
+        elapsed = now + np.flatnonzero(mask) * 0.37
+        attacking = attack_elapsed < self.attack_animation_time
+        jumping = ~attacking & ~self.on_ground[:count][mask]
+        walking = ~attacking & ~jumping & (self.vel_x[:count][mask] != 0)
+        idle = ~(attacking | jumping | walking)
+        
+        frame_ids = np.zeros(len(elapsed), dtype=np.int64)
+        for state, selected, times in ((ANIM_ATTACK, attacking, attack_elapsed), (ANIM_JUMP, jumping, elapsed),
+                                       (ANIM_WALK, walking, elapsed), (ANIM_IDLE, idle, elapsed)):
+            if selected.any():
+                indices = np.array(sheet.states[state], dtype=np.int64)
+                frame_ids[selected] = indices[(times[selected] * sheet.fps).astype(np.int64) % len(indices)]
+        return frame_ids
+    
+    def draw(self, screen, camera_x, camera_y, alpha=1.0):
+        """화면 안의 좀비와 체력바 그리기 (alpha: 이전/현재 스텝 사이 보간 비율)"""
+        count = self.count
+        if not count:
             return
         
-        screen_x = int(self.x - camera_x)
-        screen_y = int(self.y - camera_y)
+        # 보간된 화면 좌표 계산
+        prev_x = self.prev_x[:count]
+        prev_y = self.prev_y[:count]
+        screen_x = (prev_x + (self.x[:count] - prev_x) * alpha - camera_x).astype(np.int32)
+        screen_y = (prev_y + (self.y[:count] - prev_y) * alpha - camera_y).astype(np.int32)
         
         # 화면 밖에 있으면 그리지 않음 (최적화)
-        if screen_x + self.width < 0 or screen_x > screen.get_width() or \
-           screen_y + self.height < 0 or screen_y > screen.get_height():
+        visible = ((screen_x + self.width >= 0) & (screen_x <= screen.get_width()) &
+                   (screen_y + self.height >= 0) & (screen_y <= screen.get_height()) &
+                   (self.health[:count] > 0))
+        if not visible.any():
             return
         
-        # 이미지가 없으면 기본 이미지 생성
-        if self.image is None:
-            self.load_image()
+        xs = screen_x[visible].tolist()
+        ys = screen_y[visible].tolist()
+        health_widths = (self.width * self.health[:count][visible] / self.max_health).astype(np.int32).tolist()
         
-        # 좀비 이미지 그리기
-        if self.image:
-            screen.blit(self.image, (screen_x, screen_y))
-        else:
-            # 이미지 로드 실패 시 기본 사각형 그리기
-            pygame.draw.rect(screen, (0, 150, 0), (screen_x, screen_y, self.width, self.height))
+        # 좀비 이미지 그리기 (상태별 애니메이션 프레임, 왼쪽을 보면 미리 뒤집은 프레임)
+        if self.sheet.pending:
+            self.sheet = self.sheet.refresh()
+        frame_ids = self._get_frame_ids(visible).tolist()
+        facing_right = self.facing_right[:count][visible].tolist()
+        frames = self.sheet.frames
+        flipped_frames = self.sheet.flipped_frames
+        screen.blits([
+            (frames[frame_id] if right else flipped_frames[frame_id], (sx, sy))
+            for frame_id, right, sx, sy in zip(frame_ids, facing_right, xs, ys)
+        ], doreturn=False)
         
         # 체력바 그리기
         bar_width = self.width
         bar_height = 5
-        bar_x = screen_x
-        bar_y = screen_y - 10
-        
-        # 배경 (빨간색)
-        pygame.draw.rect(screen, (150, 0, 0), (bar_x, bar_y, bar_width, bar_height))
-        # 체력 (초록색)
-        health_width = int(bar_width * (self.health / self.max_health))
-        pygame.draw.rect(screen, (0, 150, 0), (bar_x, bar_y, health_width, bar_height))
-        # 테두리
-        pygame.draw.rect(screen, Colors.WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
+        for bar_x, sy, health_width in zip(xs, ys, health_widths):
+            bar_y = sy - 10
+            # 배경 (빨간색)
+            pygame.draw.rect(screen, (150, 0, 0), (bar_x, bar_y, bar_width, bar_height))
+            # 체력 (초록색)
+            pygame.draw.rect(screen, (0, 150, 0), (bar_x, bar_y, health_width, bar_height))
+            # 테두리
+            pygame.draw.rect(screen, Colors.WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
 
 
+class Zombie:
+    """좀비 핸들 클래스 - 데이터는 ZombieStore 배열에 있고 속성으로 접근"""
+    
+    __slots__ = ('store', 'index', 'path', 'path_index')
+    
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index  # 배열 인덱스 (제거되면 -1)
+        self.path = None  # 따라가는 경로 (노드 리스트)
+        self.path_index = 0
+    
+    @property
+    def width(self):
+        return self.store.width
+    
+    @property
+    def height(self):
+        return self.store.height
+    
+    @property
+    def gravity(self):
+        return self.store.gravity
+    
+    @property
+    def is_alive(self):
+        return self.index >= 0 and self.store.health[self.index] > 0
+    
+    def _get_field(name, cast=float):
+        """배열 필드 속성 생성"""
+        def getter(self):
+            return cast(getattr(self.store, name)[self.index])
+        
+        def setter(self, value):
+            getattr(self.store, name)[self.index] = value
+        
+        return property(getter, setter)
+    
+    x = _get_field('x')
+    y = _get_field('y')
+    prev_x = _get_field('prev_x')
+    prev_y = _get_field('prev_y')
+    vel_x = _get_field('vel_x')
+    vel_y = _get_field('vel_y')
+    health = _get_field('health')
+    attack_timer = _get_field('attack_timer')
+    on_ground = _get_field('on_ground', bool)
+    del _get_field
+    
+    def take_damage(self, damage):
+        """데미지 받기"""
+        if self.index < 0:
+            return
+        health = self.store.health
+        health[self.index] = max(0, health[self.index] - damage)
@@ -0,0 +1,76 @@
+"""
+.piskel 에셋 핫 리로드 (개발용 - 바뀐 파일을 백그라운드에서 다시 디코딩하고 그 파일의 캐시만 무효화)
+"""
+import os
+import queue
+import threading
+from piskel_loader import PiskelLoader
+from animation import SpriteSheet
+from texture_atlas import atlas
+
+
+class AssetHotReloader:
+    """에셋 핫 리로더 클래스 - 로드된 .piskel 파일의 수정 시각을 작업 스레드에서 interval마다 확인
+    
+    바뀐 파일은 작업 스레드에서 디코딩하고, 메인 스레드의 update()에서 프레임을 교체한 뒤
+    그 파일의 파생 캐시(크기 변환/색조 이미지, 스프라이트 시트, 아틀라스 영역)만 무효화
+    """
+    
+    def __init__(self, interval=0.5):
+        self.interval = interval
+        self.mtimes = {}  # {full_path: 마지막으로 확인한 수정 시각} (작업 스레드 전용)
+        self.results = queue.Queue()  # 다시 디코딩한 결과 (full_path, 프레임 리스트, fps)
+        self._thread = None
+        self._stop_event = threading.Event()
+    
+    def start(self):
+        """수정 시각 확인 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='asset-hot-reload', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """수정 시각 확인 스레드 종료"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+    
+    def _run(self):
+        """interval마다 바뀐 파일 확인 (작업 스레드)"""
+        while not self._stop_event.wait(self.interval):
+            self.poll()
+    
+    def poll(self):
+        """로드된 파일 중 바뀐 파일을 다시 디코딩해서 results에 넣음"""
+        for full_path in PiskelLoader.get_loaded_paths():
+            try:
+                mtime = os.path.getmtime(full_path)
+            except OSError:
+                continue  # 원본 파일이 없음 (번들에서만 읽은 에셋 등)
+            last_mtime = self.mtimes.get(full_path)
+            self.mtimes[full_path] = mtime
+            if last_mtime is None or mtime == last_mtime:
+                continue
+            try:
+                frames, fps = PiskelLoader.decode_piskel(full_path)
+            except Exception as e:
+                # 저장 도중이면 다음 저장 때 수정 시각이 다시 바뀌어 재시도
+                print(f"Error reloading piskel file {full_path}: {e}")
+                continue
+            if frames:
+                self.results.put((full_path, frames, fps))
+    
+    def update(self):
+        """다시 디코딩한 에셋 반영 (메인 스레드에서 매 프레임 호출, 기다리지 않음)"""
+        while True:
+            try:
+                full_path, frames, fps = self.results.get_nowait()
+            except queue.Empty:
+                return
+            PiskelLoader.replace_frames(full_path, frames, fps)
+            SpriteSheet.invalidate(full_path)
+            atlas.invalidate(full_path)
+            print(f"Reloaded {PiskelLoader.get_asset_key(full_path)}")
@@ -4,6 +4,20 @@
 import pygame
 from utils import Colors, draw_text_with_shadow
 from piskel_loader import PiskelLoader
+from texture_atlas import atlas
+
+# 아이템 이미지 경로 (인벤토리 아이콘, 떨어진 아이템 공용)
+ITEM_IMAGE_PATHS = {
+    'portal': 'fig/block/portal.piskel',
+    'ground': 'fig/block/ground.piskel',
+    'tree': 'fig/block/tree.piskel',
+    'tree_leaf': 'fig/block/tree_leaf.piskel',
+    'wood_plank': 'fig/block/나무판자.piskel',
+    'plank_board': 'fig/block/판자판.piskel',
+    'water': 'fig/block/water.piskel',
+    'stick_wood': 'fig/tool/tool/stick/stick_wood.piskel',
+    'wood_dt': 'fig/tool/ax/wood_DT.piskel',
+}
 
 
 class Inventory:
@@ -33,6 +47,7 @@ class Inventory:
         # 슬롯 크기
         self.slot_size = 50
         self.slot_spacing = 5
+        self.count_texts = {}  # 개수 텍스트 Surface 캐시 {(font, count): Surface}
     
     def add_item(self, item_type, count=1):
         """아이템 추가 (핫바 우선, 그 다음 인벤토리)"""
@@ -98,6 +113,17 @@ class Inventory:
         
         return count > 0  # 일부만 추가된 경우 False
     
+    def get_free_space(self, item_type):
+        """item_type을 더 넣을 수 있는 개수 (핫바 + 인벤토리)"""
+        space = 0
+        for slots, slot_count in ((self.hotbar, self.hotbar_size), (self.items, self.slots)):
+            for slot_idx in range(slot_count):
+                if slot_idx not in slots:
+                    space += self.max_stack
+                elif slots[slot_idx]['type'] == item_type:
+                    space += max(0, self.max_stack - slots[slot_idx]['count'])
+        return space
+    
     def remove_item(self, slot_idx, count=1):
         """아이템 제거 (인벤토리 슬롯)"""
         if slot_idx in self.items:
@@ -112,26 +138,51 @@ class Inventory:
         return self.remove_item(slot_idx, count)
     
     def get_item_image(self, item_type):
-        """아이템 이미지 가져오기"""
-        image_paths = {
-            'portal': 'fig/block/portal.piskel',
-            'ground': 'fig/block/ground.piskel',
-            'tree': 'fig/block/tree.piskel',
-            'tree_leaf': 'fig/block/tree_leaf.piskel',
-            'wood_plank': 'fig/block/나무판자.piskel',
-            'plank_board': 'fig/block/판자판.piskel',
-            'water': 'fig/block/water.piskel',
-            'stick_wood': 'fig/tool/tool/stick/stick_wood.piskel',
-            'wood_dt': 'fig/tool/ax/wood_DT.piskel',
-        }
-        
-        if item_type in image_paths and image_paths[item_type]:
-            image = PiskelLoader.load_piskel(image_paths[item_type])
-            if image:
-                return pygame.transform.scale(image, (self.slot_size - 4, self.slot_size - 4))
+        """아이템 이미지 가져오기 (크기 변환 이미지는 PiskelLoader 캐시에서 공유)"""
+        if ITEM_IMAGE_PATHS.get(item_type):
+            return PiskelLoader.load_variant(ITEM_IMAGE_PATHS[item_type], (self.slot_size - 4, self.slot_size - 4))
         
         return None
     
+    def get_item_sprite(self, item_type):
+        """아이템 스프라이트 (아틀라스 Surface, 영역) 반환 - 이미지가 없으면 None"""
+        if ITEM_IMAGE_PATHS.get(item_type):
+            return atlas.get_sprite(ITEM_IMAGE_PATHS[item_type], (self.slot_size - 4, self.slot_size - 4))
+        return None
+    
+    def get_count_text(self, font, count):
+        """개수 텍스트 Surface (폰트와 개수별로 캐시)"""
+        key = (font, count)
+        text = self.count_texts.get(key)
+        if text is None:
+            text = self.count_texts[key] = font.render(str(count), True, Colors.WHITE)
+        return text
+    
+    def _collect_item_blits(self, items, slot_positions, font, icon_blits, text_blits):
+        """슬롯 위치의 아이템 아이콘과 개수 텍스트를 blits 리스트에 추가"""
+        for slot_idx, slot_x, slot_y in slot_positions:
+            item = items.get(slot_idx)
+            if item is None:
+                continue
+            sprite = self.get_item_sprite(item['type'])
+            if sprite:
+                icon_blits.append((sprite[0], (slot_x + 2, slot_y + 2), sprite[1]))
+            # 개수 표시
+            if item['count'] > 1:
+                text_blits.append((self.get_count_text(font, item['count']), (slot_x + 2, slot_y + self.slot_size - 15)))
+    
+    def _draw_dragging_item(self, screen, font):
+        """드래그 중인 아이템 그리기 (마우스 위치)"""
+        mouse_pos = pygame.mouse.get_pos()
+        sprite = self.get_item_sprite(self.dragging_item['type'])
+        if sprite:
+            x = mouse_pos[0] - self.slot_size // 2
+            y = mouse_pos[1] - self.slot_size // 2
+            screen.blit(sprite[0], (x, y), sprite[1])
+            # 개수 표시
+            if self.dragging_item['count'] > 1:
+                screen.blit(self.get_count_text(font, self.dragging_item['count']), (x + 2, y + self.slot_size - 15))
+    
     def handle_mouse_wheel(self, scroll):
         """마우스 휠 처리"""
         if scroll > 0:
@@ -377,17 +428,17 @@ class Inventory:
         return remaining == 0  # 모든 아이템을 제거했는지 반환
     
     def draw(self, screen, font, is_open):
-        """인벤토리 그리기"""
+        """인벤토리 그리기 (아이콘과 개수 텍스트는 층별로 blits 한 번씩)"""
         self.is_open = is_open
         if not is_open:
             # 핫바만 그리기
             self.draw_hotbar(screen, font)
-            # 드래그 중인 아이템 그리기
+            # 드래그 중인 아이템 그리기 (핫바만 보일 때는 개수 표시 없음)
             if self.dragging_item:
                 mouse_pos = pygame.mouse.get_pos()
-                item_image = self.get_item_image(self.dragging_item['type'])
-                if item_image:
-                    screen.blit(item_image, (mouse_pos[0] - self.slot_size // 2, mouse_pos[1] - self.slot_size // 2))
+                sprite = self.get_item_sprite(self.dragging_item['type'])
+                if sprite:
+                    screen.blit(sprite[0], (mouse_pos[0] - self.slot_size // 2, mouse_pos[1] - self.slot_size // 2), sprite[1])
             return
         
         # 인벤토리 배경
@@ -401,6 +452,7 @@ class Inventory:
                         (self.inv_x, self.inv_y, self.inv_width, self.inv_height), 3)
         
         # 슬롯 그리기
+        slot_positions = []
         visible_rows = self.inv_height // (self.slot_size + self.slot_spacing)
         for row in range(visible_rows):
             for col in range(self.slots_per_row):
@@ -410,38 +462,27 @@ class Inventory:
                 
                 slot_x = self.inv_x + col * (self.slot_size + self.slot_spacing) + 10
                 slot_y = self.inv_y + row * (self.slot_size + self.slot_spacing) + 10
+                slot_positions.append((slot_idx, slot_x, slot_y))
                 
                 # 슬롯 배경
                 pygame.draw.rect(screen, Colors.DARK_GRAY,
                                (slot_x, slot_y, self.slot_size, self.slot_size))
                 pygame.draw.rect(screen, Colors.WHITE,
                                (slot_x, slot_y, self.slot_size, self.slot_size), 2)
-                
-                # 아이템 그리기
-                if slot_idx in self.items:
-                    item = self.items[slot_idx]
-                    item_image = self.get_item_image(item['type'])
-                    if item_image:
-                        screen.blit(item_image, (slot_x + 2, slot_y + 2))
-                    
-                    # 개수 표시
-                    if item['count'] > 1:
-                        count_text = font.render(str(item['count']), True, Colors.WHITE)
-                        screen.blit(count_text, (slot_x + 2, slot_y + self.slot_size - 15))
+        
+        # 아이템 그리기 (슬롯은 겹치지 않으므로 아이콘 -> 개수 순서로 한 번에)
+        icon_blits = []
+        text_blits = []
+        self._collect_item_blits(self.items, slot_positions, font, icon_blits, text_blits)
+        screen.blits(icon_blits, doreturn=False)
+        screen.blits(text_blits, doreturn=False)
         
         # 핫바 그리기
         self.draw_hotbar(screen, font, is_inventory_open=True)
         
         # 드래그 중인 아이템 그리기
         if self.dragging_item:
-            mouse_pos = pygame.mouse.get_pos()
-            item_image = self.get_item_image(self.dragging_item['type'])
-            if item_image:
-                screen.blit(item_image, (mouse_pos[0] - self.slot_size // 2, mouse_pos[1] - self.slot_size // 2))
-                # 개수 표시
-                if self.dragging_item['count'] > 1:
-                    count_text = font.render(str(self.dragging_item['count']), True, Colors.WHITE)
-                    screen.blit(count_text, (mouse_pos[0] - self.slot_size // 2 + 2, mouse_pos[1] - self.slot_size // 2 + self.slot_size - 15))
+            self._draw_dragging_item(screen, font)
     
     def draw_hotbar(self, screen, font, is_inventory_open=False):
         """핫바 그리기"""
@@ -451,8 +492,10 @@ class Inventory:
             hotbar_y = self.screen_height - 70
         hotbar_x = (self.screen_width - (self.hotbar_size * (self.slot_size + self.slot_spacing))) // 2
         
+        slot_positions = []
         for i in range(self.hotbar_size):
             slot_x = hotbar_x + i * (self.slot_size + self.slot_spacing)
+            slot_positions.append((i, slot_x, hotbar_y))
             
             # 선택된 슬롯 강조
             if i == self.selected_hotbar_slot:
@@ -464,18 +507,13 @@ class Inventory:
                            (slot_x, hotbar_y, self.slot_size, self.slot_size))
             pygame.draw.rect(screen, Colors.WHITE,
                            (slot_x, hotbar_y, self.slot_size, self.slot_size), 2)
-            
-            # 아이템 그리기
-            if i in self.hotbar:
-                item = self.hotbar[i]
-                item_image = self.get_item_image(item['type'])
-                if item_image:
-                    screen.blit(item_image, (slot_x + 2, hotbar_y + 2))
-                
-                # 개수 표시
-                if item['count'] > 1:
-                    count_text = font.render(str(item['count']), True, Colors.WHITE)
-                    screen.blit(count_text, (slot_x + 2, hotbar_y + self.slot_size - 15))
+        
+        # 아이템 그리기
+        icon_blits = []
+        text_blits = []
+        self._collect_item_blits(self.hotbar, slot_positions, font, icon_blits, text_blits)
+        screen.blits(icon_blits, doreturn=False)
+        screen.blits(text_blits, doreturn=False)
     
     def get_hover_item_name(self, mouse_pos):
         """마우스 위치의 아이템 이름 반환"""
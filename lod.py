@@ -0,0 +1,56 @@
+"""
+시뮬레이션 거리 LOD (플레이어 청크 기준 엔티티 업데이트 빈도)
+"""
+import numpy as np
+
+# LOD 구간
+LOD_FULL = 0  # 매 스텝 전체 업데이트
+LOD_REDUCED = 1  # 몇 스텝마다 간단한 이동만
+LOD_SUSPENDED = 2  # 정지 (업데이트/물리 없음)
+
+
+class SimulationLOD:
+    """시뮬레이션 거리 정책 클래스 - 렌더링 거리와 별개로 플레이어 청크와의 거리로 구간 결정
+
+    청크 거리(체비셰프) full_distance 이하는 전체, reduced_distance 이하는 감소, 그 밖은 정지
+    """
+
+    def __init__(self, chunk_pixel_size, full_distance=2, reduced_distance=4, reduced_interval=4):
+        self.chunk_pixel_size = chunk_pixel_size
+        self.full_distance = full_distance
+        self.reduced_distance = reduced_distance
+        self.reduced_interval = reduced_interval  # 감소 구간 업데이트 간격 (스텝)
+        self.player_chunk_x = 0
+        self.player_chunk_y = 0
+        self.tick = 0
+
+    def update(self, player_x, player_y):
+        """시뮬레이션 스텝 시작 - 플레이어 청크 갱신"""
+        self.player_chunk_x = int(player_x // self.chunk_pixel_size)
+        self.player_chunk_y = int(player_y // self.chunk_pixel_size)
+        self.tick += 1
+
+    def classify(self, xs, ys):
+        """위치 배열의 LOD 구간 배열 반환"""
+        chunk_pixel_size = self.chunk_pixel_size
+        distance = np.maximum(
+            np.abs(xs // chunk_pixel_size - self.player_chunk_x),
+            np.abs(ys // chunk_pixel_size - self.player_chunk_y)
+        )
+        bands = np.full(len(xs), LOD_SUSPENDED, dtype=np.int8)
+        bands[distance <= self.reduced_distance] = LOD_REDUCED
+        bands[distance <= self.full_distance] = LOD_FULL
+        return bands
+
+    def get_step_dt(self, xs, ys, dt):
+        """구간 배열과 엔티티별 이번 스텝 dt 반환
+
+        감소 구간은 reduced_interval 스텝마다 (엔티티별로 분산) 그동안의 시간을 몰아서 주고,
+        정지 구간과 차례가 아닌 감소 구간은 0
+        """
+        bands = self.classify(xs, ys)
+        step_dt = np.where(bands == LOD_FULL, dt, 0.0)
+        interval = self.reduced_interval
+        reduced_turn = (np.arange(len(xs)) + self.tick) % interval == 0
+        step_dt[(bands == LOD_REDUCED) & reduced_turn] = dt * interval
+        return bands, step_dt
@@ -15,10 +15,21 @@ from chat import Chat
 from menu import Menu
 from time_system import TimeSystem
 from npc import PIKU
-from enemy import Zombie
+from enemy import ZombieStore
 from trade import Trade
-from utils import Colors, draw_text_with_shadow, get_chunk_coord
+from utils import Colors, draw_text_with_shadow, get_chunk_coord, store_previous_position
 from mobile_controls import MobileControls
+from save_system import SaveManager
+from physics import PhysicsSystem
+from spatial_hash import SpatialHash
+from pathfinding import PathFinder
+from lod import SimulationLOD
+from spawner import SpawnScheduler
+from dropped_item import DroppedItemManager
+from animation import animation_clock
+from piskel_loader import PiskelLoader
+from asset_preloader import AssetPreloader
+from hot_reload import AssetHotReloader
 
 
 # 게임 상수
@@ -38,7 +49,13 @@ except:
     SCREEN_HEIGHT = 720
 
 FPS = 60
+SIM_DT = 1.0 / 60  # 고정 시뮬레이션 스텝 (초)
+MAX_SIM_STEPS = 5  # 한 프레임에서 따라잡을 최대 스텝 수
+SIM_FULL_DISTANCE = 2  # 매 스텝 업데이트하는 시뮬레이션 거리 (청크, 렌더링 거리와 별개)
+SIM_REDUCED_DISTANCE = 4  # 가끔 업데이트하는 시뮬레이션 거리 (청크, 그 밖은 정지)
 BLOCK_SIZE = 32
+# 개발용 .piskel 핫 리로드 (바뀐 에셋을 게임 중에 바로 반영) - 환경 변수 DEQJAM_HOT_RELOAD=1로 켬
+HOT_RELOAD_ENABLED = os.environ.get('DEQJAM_HOT_RELOAD') == '1'
 
 
 def init_game(gender='man'):
@@ -81,14 +98,43 @@ def init_game(gender='man'):
     # PIKU와 거래 시스템 초기화
     piku = None
     trade = Trade(SCREEN_WIDTH, SCREEN_HEIGHT)
-    zombies = []  # 좀비 리스트
-    
-    # 다른 세계 여부 (False = 원래 세계, True = 다른 세계)
-    world.is_other_world = False
+    zombies = ZombieStore(BLOCK_SIZE)  # 좀비 저장소 (배열 기반)
     
     return player, world, camera, inventory, crafting, chat, time_system, piku, trade, zombies
 
 
+def enter_other_world(world, player, reset_world=True):
+    """다른 세계로 이동하고 플레이어를 플랫폼 위에 배치 (세이브 복원 시에는 reset_world=False)"""
+    # 인벤토리는 자동으로 유지됨
+    if reset_world:
+        world.reset_chunks(True)
+    
+    # 플레이어를 y+100 이상 위치에 배치
+    spawn_y_block = random.randint(100, 150)  # y 100~150 블록
+    spawn_y = -spawn_y_block * BLOCK_SIZE
+    spawn_x = 0
+    
+    # 새로운 세계의 청크 생성 (플레이어 주변)
+    player_chunk_x = get_chunk_coord(spawn_x, 12 * BLOCK_SIZE)
+    player_chunk_y = get_chunk_coord(spawn_y, 12 * BLOCK_SIZE)
+    
+    # 플레이어 주변 청크 생성
+    for cx in range(player_chunk_x - 2, player_chunk_x + 3):
+        for cy in range(player_chunk_y - 2, player_chunk_y + 3):
+            world.generate_other_world_chunk(cx, cy)
+    
+    # 플랫폼의 월드 y 좌표 계산 (y 99 블록 = -99 * BLOCK_SIZE)
+    platform_block_y = 99
+    platform_world_y = -platform_block_y * BLOCK_SIZE
+    
+    # 플레이어를 플랫폼 위에 배치 (플랫폼 위 1블록 위)
+    player.x = spawn_x
+    player.y = platform_world_y - player.height - BLOCK_SIZE
+    player.vel_x = 0
+    player.vel_y = 0
+    player.on_ground = False
+
+
 def get_block_at_mouse(mouse_x, mouse_y, camera_x, camera_y, world):
     """마우스 위치의 블록 가져오기"""
     world_x = mouse_x + camera_x
@@ -103,6 +149,17 @@ def get_block_at_mouse(mouse_x, mouse_y, camera_x, camera_y, world):
     return None, None, None
 
 
+def get_block_target_points(block_x, block_y):
+    """시야 검사에 쓰는 블록 칸의 중심과 네 모서리 (모서리는 칸 안쪽으로 1픽셀)"""
+    left = block_x * BLOCK_SIZE + 1
+    top = block_y * BLOCK_SIZE + 1
+    right = (block_x + 1) * BLOCK_SIZE - 1
+    bottom = (block_y + 1) * BLOCK_SIZE - 1
+    center_x = (block_x + 0.5) * BLOCK_SIZE
+    center_y = (block_y + 0.5) * BLOCK_SIZE
+    return ((center_x, center_y), (left, top), (right, top), (left, bottom), (right, bottom))
+
+
 def can_mine_block(block, block_x, block_y, player, world):
     """블록을 채굴할 수 있는지 확인"""
     if not block:
@@ -122,7 +179,17 @@ def can_mine_block(block, block_x, block_y, player, world):
     if dist_x > 10 or dist_y > 10:
         return False
     
-    return True
+    # 벽 너머 블록은 채굴 불가 (플레이어 중심에서 블록의 중심이나 모서리 중 하나로 광선을 쏴서 처음 맞은 블록이어야 함)
+    # 중심만 보면 평지에서 옆 블록의 윗면에 막히므로 모서리도 확인
+    origin_x = player.x + player.width / 2
+    origin_y = player.y + player.height / 2
+    for target_x, target_y in get_block_target_points(block_x, block_y):
+        hit = world.raycast((origin_x, origin_y), (target_x - origin_x, target_y - origin_y),
+                            math.hypot(target_x - origin_x, target_y - origin_y))
+        if not hit or (hit[1], hit[2]) == (block_x, block_y):
+            return True
+    
+    return False
 
 
 def can_place_block(mouse_x, mouse_y, camera_x, camera_y, player, world):
@@ -147,7 +214,14 @@ def can_place_block(mouse_x, mouse_y, camera_x, camera_y, player, world):
     if world.get_block_at(block_x, block_y):
         return False, None, None
     
-    return True, block_x, block_y
+    # 벽 너머에는 설치 불가 (설치 칸의 중심이나 모서리 중 하나까지 광선이 막히지 않아야 함)
+    origin_x = player.x + player.width / 2
+    origin_y = player.y + player.height / 2
+    for target_x, target_y in get_block_target_points(block_x, block_y):
+        if world.has_line_of_sight(origin_x, origin_y, target_x, target_y):
+            return True, block_x, block_y
+    
+    return False, None, None
 
 
 def main():
@@ -179,6 +253,8 @@ def main():
             screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         
         pygame.display.set_caption("DEQJAM")
+        # 디스플레이 생성 전에 로드된 이미지를 디스플레이 픽셀 형식으로 변환
+        PiskelLoader.convert_loaded()
         clock = pygame.time.Clock()
         # 윈도우가 제대로 표시되도록 강제
         pygame.display.flip()
@@ -246,6 +322,16 @@ def main():
         font = pygame.font.Font(None, 24)
         small_font = pygame.font.Font(None, 18)
     
+    # 메뉴가 떠 있는 동안 에셋을 백그라운드에서 미리 로드
+    preloader = AssetPreloader()
+    preloader.start()
+    
+    # 개발 중이면 에셋 핫 리로드 (빌드된 실행 파일/안드로이드에서는 사용하지 않음)
+    hot_reloader = None
+    if HOT_RELOAD_ENABLED and PiskelLoader.is_development():
+        hot_reloader = AssetHotReloader()
+        hot_reloader.start()
+    
     # 메뉴
     menu = Menu(SCREEN_WIDTH, SCREEN_HEIGHT)
     game_started = False
@@ -258,6 +344,13 @@ def main():
     
     # 게임 상태
     player = None
+    save_manager = None
+    physics = None
+    zombie_hash = None
+    pathfinder = None
+    simulation_lod = None
+    spawner = None
+    dropped_items = None
     world = None
     camera = None
     inventory = None
@@ -317,6 +410,7 @@ def main():
         return 0  # 기본 공격력 없음
     
     running = True
+    sim_accumulator = 0.0  # 아직 시뮬레이션하지 않은 시간 (초)
     
     while running:
         try:
@@ -345,6 +439,25 @@ def main():
                             if gender:
                                 selected_gender = gender
                                 player, world, camera, inventory, crafting, chat, time_system, piku, trade, zombies = init_game(gender)
+                                # 세이브 + 저널 복원 후 기록 시작
+                                save_manager = SaveManager()
+                                physics = PhysicsSystem(world, BLOCK_SIZE)
+                                zombie_hash = SpatialHash(BLOCK_SIZE * 4)
+                                pathfinder = PathFinder(world, BLOCK_SIZE)
+                                simulation_lod = SimulationLOD(world.chunk_size * BLOCK_SIZE, SIM_FULL_DISTANCE, SIM_REDUCED_DISTANCE)
+                                spawner = SpawnScheduler(world, BLOCK_SIZE)
+                                dropped_items = DroppedItemManager(world, physics, BLOCK_SIZE)
+                                piku_pos = save_manager.start(world, player, inventory, time_system, trade)
+                                if piku_pos:
+                                    piku = PIKU(piku_pos[0], piku_pos[1], BLOCK_SIZE)
+                                if world.is_other_world and not save_manager.player_restored:
+                                    # 저널에만 세계 전환이 남은 경우 다른 세계 플랫폼에 배치
+                                    enter_other_world(world, player, reset_world=False)
+                                camera.x = player.x + player.width // 2 - camera.screen_width // 2
+                                camera.y = player.y + player.height // 2 - camera.screen_height // 2
+                                store_previous_position(player)
+                                store_previous_position(camera)
+                                sim_accumulator = 0.0
                                 game_started = True
                 else:
                     # 게임 상태
@@ -410,23 +523,21 @@ def main():
                                     selected_item = inventory.get_selected_hotbar_item()
                                     attack_power = get_attack_power(selected_item)
                                     if attack_power > 0:
+                                        player.start_attack()
                                         mouse_world_x = mouse_pos[0] + camera.x
                                         mouse_world_y = mouse_pos[1] + camera.y
-                                        for zombie in zombies:
+                                        # 클릭 위치 50픽셀 이내 좀비만 공간 해시로 조회
+                                        for zombie in zombie_hash.query_radius(mouse_world_x, mouse_world_y, 50):
                                             if zombie.is_alive:
-                                                dx = zombie.x - mouse_world_x
-                                                dy = zombie.y - mouse_world_y
-                                                distance = math.sqrt(dx * dx + dy * dy)
-                                                if distance <= 50:  # 50픽셀 이내
-                                                    zombie.take_damage(attack_power)
-                                                    # wood_dt 내구도 감소
-                                                    if inventory.selected_hotbar_slot in inventory.hotbar:
-                                                        if 'durability' in inventory.hotbar[inventory.selected_hotbar_slot]:
-                                                            inventory.hotbar[inventory.selected_hotbar_slot]['durability'] -= 1
-                                                            if inventory.hotbar[inventory.selected_hotbar_slot]['durability'] <= 0:
-                                                                # 내구도가 0이 되면 아이템 제거
-                                                                del inventory.hotbar[inventory.selected_hotbar_slot]
-                                                    break
+                                                zombie.take_damage(attack_power)
+                                                # wood_dt 내구도 감소
+                                                if inventory.selected_hotbar_slot in inventory.hotbar:
+                                                    if 'durability' in inventory.hotbar[inventory.selected_hotbar_slot]:
+                                                        inventory.hotbar[inventory.selected_hotbar_slot]['durability'] -= 1
+                                                        if inventory.hotbar[inventory.selected_hotbar_slot]['durability'] <= 0:
+                                                            # 내구도가 0이 되면 아이템 제거
+                                                            del inventory.hotbar[inventory.selected_hotbar_slot]
+                                                break
                                     
                                     # 채굴 시작
                                     block, block_x, block_y = get_block_at_mouse(mouse_pos[0], mouse_pos[1], camera.x, camera.y, world)
@@ -512,10 +623,15 @@ def main():
                             mining_start_time = 0
                             mouse_held_time = 0
             
+            # 디코딩이 끝난 에셋 반영 (자리 표시 이미지 교체)
+            preloader.update()
+            if hot_reloader:
+                hot_reloader.update()
+            
             if not game_started:
                 # 메뉴 업데이트 및 그리기
                 menu.update(dt)
-                menu.draw(screen, font)
+                menu.draw(screen, font, preloader.get_progress())
             else:
                 # 게임 업데이트
                 keys = pygame.key.get_pressed()
@@ -564,6 +680,12 @@ def main():
                 # 시간 시스템 업데이트
                 time_system.update(dt)
                 
+                # 애니메이션 시계 (모든 스프라이트가 공유, 프레임마다 한 번)
+                animation_clock.update(dt)
+                
+                # 인벤토리 변경 기록 및 주기적 세이브 압축
+                save_manager.update(dt, world, player, inventory, time_system, piku, trade, dropped_items)
+                
                 # 아이템 이름 표시 시간 업데이트
                 if item_display_name is not None:
                     item_display_time += dt
@@ -585,129 +707,92 @@ def main():
                         if player.on_ground:
                             player.can_jump = True
                 
-                player.update(keys, dt, mobile_input)
-                
-                # X축 이동 먼저 처리
-                new_x = player.x + player.vel_x
-                new_y = player.y
-                
-                # X축 충돌 검사
-                if world.check_block_collision(new_x, new_y, player.width, player.height):
-                    # X축 충돌 발생 - 이전 위치 유지
-                    new_x = player.x
-                    player.vel_x = 0
-                
-                # Y축 이동 처리
-                new_y = player.y + player.vel_y
-                
-                # Y축 충돌 검사
-                if world.check_block_collision(new_x, new_y, player.width, player.height):
-                    # Y축 충돌 발생
-                    if player.vel_y > 0:  # 아래로 이동 (낙하) - 블록 위에 서도록
-                        # 플레이어 발 아래 블록 찾기
-                        player_bottom = new_y + player.height
-                        # 블록 위에 정확히 서도록 위치 찾기
-                        new_y = world.find_ground_y(new_x, player_bottom, player.height)
-                    elif player.vel_y < 0:  # 위로 이동 (점프) - 블록 아래에 멈춤
-                        # 플레이어 머리 위 블록 찾기
-                        player_top = new_y
-                        new_y = world.find_ceiling_y(new_x, player_top, player.height)
+                # 고정 시간 간격 시뮬레이션 (프레임이 떨어져도 게임 속도는 그대로)
+                sim_accumulator += dt
+                sim_steps = 0
+                while sim_accumulator >= SIM_DT and sim_steps < MAX_SIM_STEPS:
+                    sim_accumulator -= SIM_DT
+                    sim_steps += 1
+                    
+                    # 렌더링 보간용 이전 위치 저장
+                    store_previous_position(player)
+                    store_previous_position(camera)
+                    if piku:
+                        store_previous_position(piku)
+                    zombies.store_previous_positions()
+                    dropped_items.store_previous_positions()
+                    
+                    player.update(keys, SIM_DT, mobile_input)
+                    
+                    # 중력 + 스윕 AABB 충돌 처리 (X축 -> Y축, 빠르게 떨어져도 블록을 통과하지 않음)
+                    physics.step_entity(player, SIM_DT)
+                    
+                    # 포탈 충돌 체크 (원래 세계에서만)
+                    if not world.is_other_world:
+                        if world.check_portal_collision(player.x, player.y, player.width, player.height):
+                            # 다른 세계로 이동 (세이브의 플레이어 위치도 바로 갱신)
+                            # 자동 저장이 진행 중이어도 건너뛰지 않도록 끝날 때까지 기다렸다가 저장
+                            enter_other_world(world, player)
+                            store_previous_position(player)
+                            # 원래 세계의 엔티티는 가져가지 않음 (새 세계 청크 키로 다시 보관되지 않도록)
+                            zombies.clear()
+                            world.discard_stored_entities('zombie')
+                            dropped_items.clear()
+                            save_manager.save(world, player, inventory, time_system, piku, trade, blocking=True, dropped_items=dropped_items)
+                    
+                    # 카메라 업데이트 (부드러운 추적)
+                    camera.update(player.x + player.width // 2, player.y + player.height // 2, SIM_DT)
+                    
+                    # 좀비 스폰 (밤에만, 스케줄러가 밤마다 예산을 받아 간격에 맞춰 지표면 스폰 지점에 스폰)
+                    current_period = time_system.get_current_period()
+                    if current_period == 'night':
+                        spawner.update(SIM_DT, time_system, player, zombies)
                     else:
-                        new_y = player.y
+                        # 아침이 되면 모든 좀비 제거 (언로드된 청크에 보관된 좀비 포함)
+                        zombies.clear()
+                        world.discard_stored_entities('zombie')
                     
-                    # Y 속도 초기화
-                    player.vel_y = 0
-                
-                # 위치 업데이트
-                player.x = new_x
-                player.y = new_y
-                
-                # 포탈 충돌 체크 (원래 세계에서만)
-                if not world.is_other_world:
-                    if world.check_portal_collision(player.x, player.y, player.width, player.height):
-                        # 다른 세계로 이동 (인벤토리는 자동으로 유지됨)
-                        world.is_other_world = True
-                        world.chunks.clear()
-                        world.generated_chunks.clear()
-                        
-                        # 플레이어를 y+100 이상 위치에 배치
-                        spawn_y_block = random.randint(100, 150)  # y 100~150 블록
-                        spawn_y = -spawn_y_block * BLOCK_SIZE
-                        spawn_x = 0
-                        
-                        # 새로운 세계의 청크 생성 (플레이어 주변)
-                        player_chunk_x = get_chunk_coord(spawn_x, 12 * BLOCK_SIZE)
-                        player_chunk_y = get_chunk_coord(spawn_y, 12 * BLOCK_SIZE)
-                        
-                        # 플레이어 주변 청크 생성
-                        for cx in range(player_chunk_x - 2, player_chunk_x + 3):
-                            for cy in range(player_chunk_y - 2, player_chunk_y + 3):
-                                world.generate_other_world_chunk(cx, cy)
-                        
-                        # 플랫폼 위에 플레이어 배치
-                        # 플랫폼이 있는 청크 찾기 (y 99~50 범위)
-                        platform_chunk_y = player_chunk_y
-                        platform_chunk = world.get_chunk(player_chunk_x, platform_chunk_y)
-                        
-                        # 플랫폼의 월드 y 좌표 계산 (y 99 블록 = -99 * BLOCK_SIZE)
-                        platform_block_y = 99
-                        platform_world_y = -platform_block_y * BLOCK_SIZE
-                        
-                        # 플레이어를 플랫폼 위에 배치 (플랫폼 위 1블록 위)
-                        player.x = spawn_x
-                        player.y = platform_world_y - player.height - BLOCK_SIZE
-                        player.vel_x = 0
-                        player.vel_y = 0
-                        player.on_ground = False
-                
-                # 바닥 확인 (낙하 중일 때만 확인하여 성능 최적화)
-                if player.vel_y >= 0:  # 낙하 중일 때만
-                    player.on_ground = world.check_on_ground(player.x, player.y, player.width, player.height)
-                    # 바닥에 닿았으면 Y 속도를 0으로 설정
-                    if player.on_ground:
-                        player.vel_y = 0
-                else:
-                    player.on_ground = False
+                    # 좀비 업데이트 (플레이어까지 경로 추적, 공격 타이머를 배열로 한 번에)
+                    # (시뮬레이션 거리 LOD: 가까운 좀비만 매 스텝, 먼 좀비는 가끔, 더 먼 좀비는 정지)
+                    pathfinder.begin_step(SIM_DT)
+                    simulation_lod.update(player.x + player.width // 2, player.y + player.height // 2)
+                    player_node = pathfinder.get_node(player.x, player.y, player.width, player.height)
+                    zombies.update(SIM_DT, player.x + player.width // 2, pathfinder, player_node, simulation_lod)
+                    # 좀비 물리 처리 (한 번에)
+                    physics.step_store(zombies)
+                    
+                    # 공간 해시 갱신 (셀이 바뀐 좀비만 다시 등록)
+                    zombie_hash.sync(zombies)
+                    
+                    # 플레이어와 겹친 좀비 공격
+                    zombies.attack_player(player)
+                    
+                    # 떨어진 아이템 업데이트 (깨어 있는 아이템만 물리/합치기, 플레이어와 겹치면 줍기)
+                    dropped_items.update(SIM_DT, player, inventory)
+                    
+                    # PIKU 스폰 (2일이 되면)
+                    if piku is None and time_system.days_passed >= 1:  # 2일 = days_passed >= 1
+                        # 오른쪽 끝에서 스폰 (플레이어 오른쪽 500픽셀)
+                        spawn_x = player.x + 500
+                        spawn_y = player.y
+                        piku = PIKU(spawn_x, spawn_y, BLOCK_SIZE)
+                    
+                    # PIKU 업데이트
+                    if piku:
+                        piku.update(SIM_DT, player.x + player.width // 2, player.y + player.height // 2, zombie_hash, world)
                 
-                # 카메라 업데이트 (부드러운 추적)
-                camera.update(player.x + player.width // 2, player.y + player.height // 2, dt)
+                # 따라잡지 못한 시간은 버림 (느린 기기에서 스텝이 계속 밀리는 것 방지)
+                if sim_steps >= MAX_SIM_STEPS:
+                    sim_accumulator %= SIM_DT
                 
                 # 청크 업데이트
                 world.update_rendered_chunks(player.x, player.y, 3)
                 
-                # PIKU 스폰 (2일이 되면)
-                if piku is None and time_system.days_passed >= 1:  # 2일 = days_passed >= 1
-                    # 오른쪽 끝에서 스폰 (플레이어 오른쪽 500픽셀)
-                    spawn_x = player.x + 500
-                    spawn_y = player.y
-                    piku = PIKU(spawn_x, spawn_y, BLOCK_SIZE)
-                
-                # PIKU 업데이트
-                if piku:
-                    piku.update(dt, player.x + player.width // 2, player.y + player.height // 2, zombies)
-                
-                # 좀비 스폰 (밤에만)
-                current_period = time_system.get_current_period()
-                if current_period == 'night':
-                    # 밤에만 좀비 스폰 (플레이어로부터 25블록 밖)
-                    alive_zombies = [z for z in zombies if z.is_alive]
-                    if len(alive_zombies) < 3:  # 최대 3마리
-                        spawn_angle = random.uniform(0, 2 * math.pi)
-                        spawn_distance = 25 * BLOCK_SIZE  # 25블록 = 800픽셀
-                        zombie_x = player.x + math.cos(spawn_angle) * spawn_distance
-                        zombie_y = player.y + math.sin(spawn_angle) * spawn_distance
-                        # 땅 위에 스폰되도록 조정
-                        zombie_bottom = zombie_y + BLOCK_SIZE * 2
-                        zombie_y = world.find_ground_y(zombie_x, zombie_bottom, BLOCK_SIZE * 2)
-                        zombies.append(Zombie(zombie_x, zombie_y, BLOCK_SIZE))
-                else:
-                    # 아침이 되면 모든 좀비 제거
-                    zombies.clear()
-                
-                # 좀비 업데이트
-                for zombie in zombies:
-                    if zombie.is_alive:
-                        zombie.update(dt, player.x + player.width // 2, player.y + player.height // 2, player, world)
+                # 언로드된 청크의 좀비는 청크와 함께 보관, 다시 로드된 청크의 좀비는 복원
+                zombies.unload_evicted(world)
+                zombies.restore_loaded(world)
+                dropped_items.unload_evicted(world)
+                dropped_items.restore_loaded(world)
                 
                 # 거래 창 업데이트
                 if trade.is_open:
@@ -758,7 +843,8 @@ def main():
                             block_y = int(mining_block.y // BLOCK_SIZE)
                             block = world.remove_block_at(block_x, block_y)
                             if block:
-                                inventory.add_item(block.block_type, 1)
+                                # 블록 자리에 아이템 드롭 (플레이어가 주워야 인벤토리에 들어감)
+                                dropped_items.spawn(block.block_type, block.x + BLOCK_SIZE / 2, block.y + BLOCK_SIZE / 2)
                                 # wood_dt 내구도 감소
                                 selected_item = inventory.get_selected_hotbar_item()
                                 if selected_item and selected_item.get('type') == 'wood_dt':
@@ -777,7 +863,8 @@ def main():
                             block_y = int(mining_block.y // BLOCK_SIZE)
                             block = world.remove_block_at(block_x, block_y)
                             if block:
-                                inventory.add_item(block.block_type, 1)
+                                # 블록 자리에 아이템 드롭 (플레이어가 주워야 인벤토리에 들어감)
+                                dropped_items.spawn(block.block_type, block.x + BLOCK_SIZE / 2, block.y + BLOCK_SIZE / 2)
                                 # wood_dt 내구도 감소
                                 selected_item = inventory.get_selected_hotbar_item()
                                 if selected_item and selected_item.get('type') == 'wood_dt':
@@ -796,26 +883,31 @@ def main():
                 sky_color = time_system.get_sky_color()
                 screen.fill(sky_color)
                 
+                # 시뮬레이션 스텝 사이 보간 비율 및 렌더링용 카메라 위치
+                render_alpha = sim_accumulator / SIM_DT
+                render_camera_x, render_camera_y = camera.get_render_pos(render_alpha)
+                
                 # 월드 그리기
-                world.draw(screen, camera.x, camera.y, dt)
+                world.draw(screen, render_camera_x, render_camera_y, dt)
                 
                 # 플레이어 그리기
-                player.draw(screen, camera.x, camera.y)
+                player.draw(screen, render_camera_x, render_camera_y, render_alpha)
                 
                 # PIKU 그리기
                 if piku:
-                    piku.draw(screen, camera.x, camera.y)
+                    piku.draw(screen, render_camera_x, render_camera_y, render_alpha)
+                
+                # 떨어진 아이템 그리기
+                dropped_items.draw(screen, render_camera_x, render_camera_y, render_alpha)
                 
                 # 좀비 그리기
-                for zombie in zombies:
-                    if zombie.is_alive:
-                        zombie.draw(screen, camera.x, camera.y)
+                zombies.draw(screen, render_camera_x, render_camera_y, render_alpha)
                 
                 # 채굴 진행 표시 (최적화: Surface 재사용)
                 if mining_block and mouse_buttons[0] and mining_duration > 0:
                     progress = mouse_held_time / mining_duration
-                    mining_screen_x = int(mining_block.x - camera.x)
-                    mining_screen_y = int(mining_block.y - camera.y)
+                    mining_screen_x = int(mining_block.x - render_camera_x)
+                    mining_screen_y = int(mining_block.y - render_camera_y)
                     
                     # 빨간색 오버레이 (직접 그리기로 최적화)
                     alpha = int(255 * progress * 0.5)
@@ -1003,6 +1095,15 @@ def main():
                 pass
             continue
     
+    # 종료 시 저널을 메인 세이브로 압축
+    if save_manager:
+        try:
+            save_manager.close(world, player, inventory, time_system, piku, trade, dropped_items)
+        except Exception as e:
+            print(f"Error saving game: {e}")
+    
+    if hot_reloader:
+        hot_reloader.stop()
     pygame.quit()
     sys.exit()
 
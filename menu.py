@@ -101,8 +101,8 @@ class Menu:
         except:
             return pygame.font.Font(None, size)
     
-    def draw(self, screen, font):
-        """메뉴 그리기"""
+    def draw(self, screen, font, loading_progress=1.0):
+        """메뉴 그리기 (loading_progress: 에셋 미리 로드 진행률, 1.0 미만이면 아래쪽에 진행 막대)"""
         screen.fill(Colors.BLACK)
         
         title_font = self._get_korean_font(72)
@@ -152,4 +152,10 @@ class Menu:
             woman_text = font.render("WOMAN", True, Colors.WHITE)
             woman_text_rect = woman_text.get_rect(center=self.woman_button_rect.center)
             screen.blit(woman_text, woman_text_rect)
+        
+        if loading_progress < 1.0:
+            # 에셋 로드 진행 막대
+            bar_rect = pygame.Rect(self.screen_width // 2 - 100, self.screen_height - 60, 200, 8)
+            pygame.draw.rect(screen, Colors.DARK_GRAY, bar_rect)
+            pygame.draw.rect(screen, Colors.WHITE, (bar_rect.x, bar_rect.y, int(bar_rect.width * loading_progress), bar_rect.height))
 
@@ -5,6 +5,7 @@
 import pygame
 import math
 from utils import Colors
+from texture_atlas import atlas
 
 
 class VirtualJoystick:
@@ -142,23 +143,40 @@ class MobileButton:
         """프레임 업데이트 (이전 상태 저장)"""
         self.was_pressed = self.pressed
     
-    def draw(self, screen, font):
-        """버튼 그리기"""
+    def collect_blits(self, font, background_blits, text_blits):
+        """버튼 배경과 글자의 (아틀라스 Surface, 위치, 영역)을 blits 리스트에 추가"""
         color = self.color
         if self.pressed:
             # 눌렸을 때 더 밝게
             color = tuple(min(255, c + 30) for c in self.color[:3])
         
-        button_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        button_surface.fill((*color[:3], self.alpha))
-        screen.blit(button_surface, self.rect)
+        # 배경/글자 Surface는 색상/글자별로 아틀라스에 한 번만 만듦
+        width, height = self.rect.size
+        fill_color = (*color[:3], self.alpha)
         
-        pygame.draw.rect(screen, Colors.WHITE, self.rect, 2)
+        def make_background():
+            button_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            button_surface.fill(fill_color)
+            return button_surface
+        background, area = atlas.get_surface(('button', width, height, fill_color), make_background)
+        background_blits.append((background, self.rect.topleft, area))
         
         if self.text:
-            text_surface = font.render(self.text, True, self.text_color)
-            text_rect = text_surface.get_rect(center=self.rect.center)
-            screen.blit(text_surface, text_rect)
+            text, text_color = self.text, self.text_color
+            text_surface, area = atlas.get_surface(('text', font, text, text_color),
+                                                   lambda: font.render(text, True, text_color))
+            text_rect = area.copy()
+            text_rect.center = self.rect.center
+            text_blits.append((text_surface, text_rect.topleft, area))
+    
+    def draw(self, screen, font):
+        """버튼 그리기"""
+        background_blits = []
+        text_blits = []
+        self.collect_blits(font, background_blits, text_blits)
+        screen.blits(background_blits, doreturn=False)
+        pygame.draw.rect(screen, Colors.WHITE, self.rect, 2)
+        screen.blits(text_blits, doreturn=False)
 
 
 class MobileControls:
@@ -230,6 +248,10 @@ class MobileControls:
             btn = MobileButton(btn_x, hotbar_y, button_size, button_size, 
                               str(i + 1), Colors.DARK_GRAY)
             self.hotbar_buttons.append(btn)
+        
+        # 그리는 순서대로 모든 버튼
+        self.buttons = [self.jump_button, self.mine_button, self.place_button, self.inventory_button,
+                        self.crafting_button, self.chat_button] + self.hotbar_buttons
     
     def detect_mobile(self):
         """모바일 환경 감지"""
@@ -441,29 +463,16 @@ class MobileControls:
         return None
     
     def draw(self, screen, font):
-        """모바일 컨트롤 그리기"""
+        """모바일 컨트롤 그리기 (버튼 배경과 글자는 층별로 blits 한 번씩)"""
         # 조이스틱
         self.joystick.draw(screen)
         
-        # 점프 버튼
-        self.jump_button.draw(screen, font)
-        
-        # 채굴 버튼
-        self.mine_button.draw(screen, font)
-        
-        # 설치 버튼
-        self.place_button.draw(screen, font)
-        
-        # 인벤토리 버튼
-        self.inventory_button.draw(screen, font)
-        
-        # 제작대 버튼
-        self.crafting_button.draw(screen, font)
-        
-        # 채팅 버튼
-        self.chat_button.draw(screen, font)
-        
-        # 핫바 버튼들
-        for btn in self.hotbar_buttons:
-            btn.draw(screen, font)
-
+        # 버튼 (점프, 채굴, 설치, 인벤토리, 제작대, 채팅, 핫바) - 버튼은 겹치지 않으므로 배경 -> 테두리 -> 글자 순서로 한 번에
+        background_blits = []
+        text_blits = []
+        for button in self.buttons:
+            button.collect_blits(font, background_blits, text_blits)
+        screen.blits(background_blits, doreturn=False)
+        for button in self.buttons:
+            pygame.draw.rect(screen, Colors.WHITE, button.rect, 2)
+        screen.blits(text_blits, doreturn=False)
@@ -3,8 +3,10 @@ NPC 클래스 (PIKU)
 """
 import pygame
 import math
-from piskel_loader import PiskelLoader
-from utils import Colors
+from animation import SpriteSheet, Animator
+from utils import Colors, lerp
+
+PIKU_IMAGE_PATH = 'fig/alliance/PIKU.piskel'
 
 
 class PIKU:
@@ -16,29 +18,32 @@ class PIKU:
         self.height = block_size * 2
         self.x = x
         self.y = y
+        self.prev_x = x  # 이전 시뮬레이션 스텝 위치 (렌더링 보간용)
+        self.prev_y = y
         self.float_offset = 0.0  # 둥둥 떠다니는 오프셋
         self.float_speed = 2.0  # 떠다니는 속도
         self.target_x = x  # 목표 위치
         self.target_y = y
         self.speed = 3.0  # 이동 속도
         self.following_player = False  # 플레이어를 따라다니는지
-        self.image = None
+        self.facing_right = True
+        self.animator = None
         self.load_image()
         self.damage_timer = 0.0  # 좀비에게 데미지를 주는 타이머
         
     def load_image(self):
-        """PIKU 이미지 로드"""
-        image_path = 'fig/alliance/PIKU.piskel'
-        self.image = PiskelLoader.load_piskel(image_path)
-        if self.image:
-            self.image = pygame.transform.scale(self.image, (self.width, self.height))
-        else:
+        """PIKU 스프라이트 시트 로드"""
+        image_path = PIKU_IMAGE_PATH
+        sheet = SpriteSheet.load(image_path, (self.width, self.height))
+        if sheet is None:
             # 기본 이미지 (파란색 원)
-            self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            pygame.draw.circle(self.image, (100, 150, 255), (self.width // 2, self.height // 2), self.width // 2)
+            image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            pygame.draw.circle(image, (100, 150, 255), (self.width // 2, self.height // 2), self.width // 2)
+            sheet = SpriteSheet([image])
+        self.animator = Animator(sheet)
     
-    def update(self, dt, player_x, player_y, zombies):
-        """PIKU 업데이트"""
+    def update(self, dt, player_x, player_y, zombie_hash, world=None):
+        """PIKU 업데이트 (world가 있으면 벽 너머 좀비는 공격하지 않음)"""
         # 둥둥 떠다니는 애니메이션
         self.float_offset += self.float_speed * dt
         float_y = math.sin(self.float_offset) * 5  # 5픽셀 범위로 떠다님
@@ -76,16 +81,20 @@ class PIKU:
                 self.x = target_x
                 self.y = target_y
         
+        # 플레이어 쪽을 바라봄
+        self.facing_right = player_x >= self.x + self.width / 2
+        
         # 좀비에게 자동으로 데미지 (1초에 5씩)
         self.damage_timer += dt
         if self.damage_timer >= 1.0:  # 1초마다
-            for zombie in zombies:
-                # PIKU와 좀비의 거리 확인 (100픽셀 이내)
-                dx = zombie.x - self.x
-                dy = zombie.y - self.y
-                distance = math.sqrt(dx * dx + dy * dy)
-                if distance <= 100:
-                    zombie.take_damage(5)
+            # PIKU 근처(100픽셀 이내) 좀비만 공간 해시로 조회
+            for zombie in zombie_hash.query_radius(self.x, self.y, 100):
+                if world and not world.has_line_of_sight(
+                    self.x + self.width / 2, self.y + self.height / 2,
+                    zombie.x + zombie.width / 2, zombie.y + zombie.height / 2
+                ):
+                    continue
+                zombie.take_damage(5)
             self.damage_timer = 0.0
     
     def check_click(self, mouse_x, mouse_y, camera_x, camera_y):
@@ -95,11 +104,10 @@ class PIKU:
         rect = pygame.Rect(screen_x, screen_y, self.width, self.height)
         return rect.collidepoint(mouse_x, mouse_y)
     
-    def draw(self, screen, camera_x, camera_y):
-        """PIKU 그리기"""
-        screen_x = int(self.x - camera_x)
-        screen_y = int(self.y - camera_y)
+    def draw(self, screen, camera_x, camera_y, alpha=1.0):
+        """PIKU 그리기 (alpha: 이전/현재 스텝 사이 보간 비율)"""
+        screen_x = int(lerp(self.prev_x, self.x, alpha) - camera_x)
+        screen_y = int(lerp(self.prev_y, self.y, alpha) - camera_y)
         
-        if self.image:
-            screen.blit(self.image, (screen_x, screen_y))
+        screen.blit(self.animator.get_frame(self.facing_right), (screen_x, screen_y))
 
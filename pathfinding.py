@@ -0,0 +1,244 @@
+"""
+타일 그리드 A* 길찾기 (걷기, 한 칸 올라가기, 떨어지기)
+"""
+import heapq
+
+
+class NavGrid:
+    """내비게이션 그리드 - 청크별 통과 불가 마스크를 캐시하고 청크 revision이 바뀔 때만 다시 읽음"""
+
+    def __init__(self, world):
+        self.world = world
+        self.chunk_size = world.chunk_size
+        self.chunk_grids = {}  # (chunk_x, chunk_y) -> (revision, bytearray)
+
+    def get_chunk_grid(self, chunk_x, chunk_y):
+        """청크의 통과 불가 마스크 반환 (로드되지 않은 청크는 None)"""
+        revision = self.world.get_chunk_revision(chunk_x, chunk_y)
+        if revision is None:
+            return None
+        cached = self.chunk_grids.get((chunk_x, chunk_y))
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+
+        chunk_size = self.chunk_size
+        x0 = chunk_x * chunk_size
+        y0 = chunk_y * chunk_size
+        grid = self.world.read_solid_region(x0, y0, x0 + chunk_size, y0 + chunk_size)
+        self.chunk_grids[(chunk_x, chunk_y)] = (revision, grid)
+        if len(self.chunk_grids) > len(self.world.chunks) * 2:
+            self.prune()
+        return grid
+
+    def is_blocked(self, block_x, block_y):
+        """블록 칸이 막혀 있는지 (로드되지 않은 청크도 막힌 것으로 취급)"""
+        chunk_size = self.chunk_size
+        grid = self.get_chunk_grid(block_x // chunk_size, block_y // chunk_size)
+        if grid is None:
+            return True
+        return grid[(block_y % chunk_size) * chunk_size + block_x % chunk_size] == 1
+
+    def prune(self):
+        """언로드된 청크의 캐시 제거"""
+        chunks = self.world.chunks
+        for key in [key for key in self.chunk_grids if key not in chunks]:
+            del self.chunk_grids[key]
+
+
+class PathFinder:
+    """A* 길찾기 클래스 - 같은 목표로 가는 경로를 여러 엔티티가 공유하고, 스텝당 탐색 횟수를 제한
+
+    노드는 (왼쪽 블록 열, 발 블록 행)이며 엔티티가 차지하는 칸은
+    열 x ~ x + width_blocks - 1, 행 y - height_blocks + 1 ~ y
+    """
+
+    def __init__(self, world, block_size=32, width_blocks=2, height_blocks=2,
+                 max_drop=3, max_nodes=400, searches_per_step=2, path_lifetime=3.0,
+                 max_paths_per_goal=8):
+        self.nav = NavGrid(world)
+        self.block_size = block_size
+        self.width_blocks = width_blocks
+        self.height_blocks = height_blocks
+        self.max_drop = max_drop  # 한 번에 떨어질 수 있는 최대 블록 수
+        self.max_nodes = max_nodes  # 탐색당 최대 확장 노드 수 (못 찾으면 가장 가까운 곳까지의 경로)
+        self.searches_per_step = searches_per_step  # 스텝당 최대 A* 탐색 횟수
+        self.path_lifetime = path_lifetime  # 공유 경로 유지 시간 (초)
+        self.max_paths_per_goal = max_paths_per_goal  # 목표당 보관하는 공유 경로 수 (넘으면 오래된 것부터 버림)
+        self.searches_left = searches_per_step
+        self.time = 0.0
+        self.paths = {}  # goal -> [{'path', 'index', 'revisions', 'expires'}]
+
+    def begin_step(self, dt):
+        """시뮬레이션 스텝 시작 - 탐색 예산 초기화, 만료된 공유 경로 정리"""
+        self.time += dt
+        self.searches_left = self.searches_per_step
+        if self.paths:
+            now = self.time
+            for goal in list(self.paths):
+                entries = [entry for entry in self.paths[goal] if entry['expires'] > now]
+                if entries:
+                    self.paths[goal] = entries
+                else:
+                    del self.paths[goal]
+
+    def get_node(self, x, y, width, height):
+        """픽셀 AABB를 노드 (왼쪽 블록 열, 발 블록 행)로 변환"""
+        block_size = self.block_size
+        return int(round(x / block_size)), int((y + height - 1e-6) // block_size)
+
+    def _body_fits(self, x, y):
+        """노드 위치에 엔티티 몸이 들어가는지"""
+        is_blocked = self.nav.is_blocked
+        for column in range(x, x + self.width_blocks):
+            for row in range(y - self.height_blocks + 1, y + 1):
+                if is_blocked(column, row):
+                    return False
+        return True
+
+    def _has_support(self, x, y):
+        """발 아래에 딛을 블록이 있는지"""
+        is_blocked = self.nav.is_blocked
+        return any(is_blocked(column, y + 1) for column in range(x, x + self.width_blocks))
+
+    def _get_neighbors(self, node, standable, fits):
+        """이웃 노드와 비용 (걷기 1, 한 칸 올라가기 2, 떨어지기 1 + 0.5/블록)"""
+        x, y = node
+        neighbors = []
+        headroom = None
+        for direction in (-1, 1):
+            next_x = x + direction
+            if fits(next_x, y):
+                if standable(next_x, y):
+                    # 걷기
+                    neighbors.append(((next_x, y), 1.0))
+                    continue
+                # 떨어지기 (옆 칸이 비어 있으면 딛을 곳까지 낙하)
+                for drop in range(1, self.max_drop + 1):
+                    if not fits(next_x, y + drop):
+                        break
+                    if standable(next_x, y + drop):
+                        neighbors.append(((next_x, y + drop), 1.0 + drop * 0.5))
+                        break
+                continue
+            # 한 칸 올라가기 (머리 위 공간이 있어야 점프 가능)
+            if headroom is None:
+                headroom = fits(x, y - 1)
+            if headroom and standable(next_x, y - 1):
+                neighbors.append(((next_x, y - 1), 2.0))
+        return neighbors
+
+    def find_path(self, start, goal):
+        """A* 탐색 - start 다음 노드부터 goal까지의 노드 리스트 반환
+
+        max_nodes 안에 목표에 못 가면 목표에 가장 가까운 노드까지의 경로 반환
+        """
+        fits_cache = {}
+        standable_cache = {}
+        body_fits = self._body_fits
+        has_support = self._has_support
+
+        def fits(x, y):
+            key = (x, y)
+            result = fits_cache.get(key)
+            if result is None:
+                result = fits_cache[key] = body_fits(x, y)
+            return result
+
+        def standable(x, y):
+            key = (x, y)
+            result = standable_cache.get(key)
+            if result is None:
+                result = standable_cache[key] = fits(x, y) and has_support(x, y)
+            return result
+
+        goal_x, goal_y = goal
+
+        def heuristic(node):
+            return abs(node[0] - goal_x) + abs(node[1] - goal_y)
+
+        open_heap = [(heuristic(start), 0.0, start)]
+        came_from = {start: None}
+        g_score = {start: 0.0}
+        best_node = start
+        best_h = heuristic(start)
+        expanded = 0
+        get_neighbors = self._get_neighbors
+
+        while open_heap and expanded < self.max_nodes:
+            _, g, node = heapq.heappop(open_heap)
+            if g > g_score[node]:
+                continue
+            expanded += 1
+            h = heuristic(node)
+            if h < best_h:
+                best_node = node
+                best_h = h
+            if node == goal:
+                break
+            for neighbor, cost in get_neighbors(node, standable, fits):
+                new_g = g + cost
+                if new_g < g_score.get(neighbor, float('inf')):
+                    g_score[neighbor] = new_g
+                    came_from[neighbor] = node
+                    heapq.heappush(open_heap, (new_g + heuristic(neighbor), new_g, neighbor))
+
+        # 경로 역추적
+        path = []
+        node = best_node
+        while node is not None and node != start:
+            path.append(node)
+            node = came_from[node]
+        path.reverse()
+        return path
+
+    def _is_path_current(self, entry):
+        """경로가 지나는 청크들이 경로를 만든 뒤 바뀌지 않았는지"""
+        get_chunk_revision = self.nav.world.get_chunk_revision
+        for key, revision in entry['revisions'].items():
+            if get_chunk_revision(key[0], key[1]) != revision:
+                return False
+        return True
+
+    def get_path(self, start, goal):
+        """start에서 goal까지 경로 반환 - 공유 경로가 있으면 재사용
+
+        공유 경로 위에 start가 있으면 그 뒤 구간을 그대로 사용.
+        탐색 예산이 없으면 None (다음 스텝에 다시 시도)
+        """
+        entries = self.paths.get(goal)
+        if entries:
+            for entry in entries:
+                index = entry['index'].get(start)
+                if index is not None and self._is_path_current(entry):
+                    return entry['path'][index + 1:]
+
+        if self.searches_left <= 0:
+            return None
+        self.searches_left -= 1
+
+        path = self.find_path(start, goal)
+        full_path = [start] + path
+
+        # 경로가 지나는 청크 revision 기록 (발 아래 행 포함)
+        chunk_size = self.nav.chunk_size
+        get_chunk_revision = self.nav.world.get_chunk_revision
+        revisions = {}
+        for x, y in full_path:
+            for row in (y - self.height_blocks + 1, y + 1):
+                for column in (x, x + self.width_blocks - 1):
+                    key = (column // chunk_size, row // chunk_size)
+                    if key not in revisions:
+                        revisions[key] = get_chunk_revision(key[0], key[1])
+
+        entry = {
+            'path': full_path,
+            'index': {node: i for i, node in enumerate(full_path)},
+            'revisions': revisions,
+            'expires': self.time + self.path_lifetime,
+        }
+        # 만료됐거나 지형이 바뀐 경로는 버리고, 최근 경로만 max_paths_per_goal개 유지 (조회가 선형 탐색이므로)
+        entries = [old for old in self.paths.get(goal, ())
+                   if old['expires'] > self.time and self._is_path_current(old)]
+        entries.append(entry)
+        self.paths[goal] = entries[-self.max_paths_per_goal:]
+        return path
@@ -0,0 +1,106 @@
+"""
+물리 시스템 (중력 적분 + 스윕 AABB 충돌)
+"""
+import numpy as np
+
+
+class PhysicsSystem:
+    """엔티티 물리 처리 클래스 - 플레이어, 좀비 등 모든 엔티티가 같은 경로로 이동
+
+    엔티티는 x, y, width, height, vel_x, vel_y, gravity, on_ground 속성을 가짐
+    (속도와 중력은 60 FPS 기준 프레임당 값)
+    """
+
+    def __init__(self, world, block_size=32):
+        self.world = world
+        self.block_size = block_size
+        self.max_fall_speed = block_size * 0.75  # 최대 낙하 속도
+        self.min_y = -2000 * block_size  # Y 좌표 제한 (+2000 이상 올라갈 수 없음)
+
+    def step_entity(self, entity, dt):
+        """엔티티 하나 이동 (중력 적용 -> 스윕 충돌 -> 접촉 상태 갱신)"""
+        frame_scale = dt * 60.0  # 60 FPS 기준으로 정규화
+
+        # 중력 적용 (바닥에 서 있어도 매 프레임 적용 - 발밑 블록이 사라지면 바로 낙하)
+        vel_y = entity.vel_y + entity.gravity * frame_scale
+        if vel_y > self.max_fall_speed:
+            vel_y = self.max_fall_speed
+
+        new_x, new_y, on_ground, hit_ceiling, hit_wall = self.world.sweep_aabb(
+            entity.x, entity.y, entity.width, entity.height,
+            entity.vel_x * frame_scale, vel_y * frame_scale
+        )
+
+        if hit_wall:
+            entity.vel_x = 0
+        if on_ground or hit_ceiling:
+            vel_y = 0
+
+        # Y 좌표 제한
+        if new_y < self.min_y:
+            new_y = self.min_y
+            vel_y = 0
+
+        entity.x = new_x
+        entity.y = new_y
+        entity.vel_y = vel_y
+        entity.on_ground = on_ground
+
+    def step(self, entities, dt):
+        """엔티티 목록을 한 번에 이동 (죽은 엔티티는 건너뜀)"""
+        step_entity = self.step_entity
+        for entity in entities:
+            if getattr(entity, 'is_alive', True):
+                step_entity(entity, dt)
+
+    def step_store(self, store):
+        """배열 저장소(ZombieStore 등)의 엔티티를 한 번에 이동
+
+        엔티티별 시간은 store.step_dt 사용 (0이면 이번 스텝은 건너뜀).
+        중력 적분은 배열 연산으로 처리하고, 스윕 충돌만 엔티티별로 수행
+        """
+        count = store.count
+        if not count:
+            return
+        frame_scales = store.step_dt[:count] * 60.0  # 60 FPS 기준으로 정규화
+        active = frame_scales > 0
+
+        # 중력 적용 + 최대 낙하 속도 제한 (배열 연산)
+        vel_y = store.vel_y[:count]
+        vel_y[active] += store.gravity * frame_scales[active]
+        vel_y[vel_y > self.max_fall_speed] = self.max_fall_speed
+
+        xs = store.x[:count].tolist()
+        ys = store.y[:count].tolist()
+        vel_xs = store.vel_x[:count].tolist()
+        vel_ys = vel_y.tolist()
+        on_grounds = store.on_ground[:count].tolist()
+        scales = frame_scales.tolist()
+        width = store.width
+        height = store.height
+        min_y = self.min_y
+        sweep_aabb = self.world.sweep_aabb
+
+        for i in np.flatnonzero(active).tolist():
+            frame_scale = scales[i]
+            new_x, new_y, on_ground, hit_ceiling, hit_wall = sweep_aabb(
+                xs[i], ys[i], width, height,
+                vel_xs[i] * frame_scale, vel_ys[i] * frame_scale
+            )
+            if hit_wall:
+                vel_xs[i] = 0
+            if on_ground or hit_ceiling:
+                vel_ys[i] = 0
+            # Y 좌표 제한
+            if new_y < min_y:
+                new_y = min_y
+                vel_ys[i] = 0
+            xs[i] = new_x
+            ys[i] = new_y
+            on_grounds[i] = on_ground
+
+        store.x[:count] = xs
+        store.y[:count] = ys
+        store.vel_x[:count] = vel_xs
+        store.vel_y[:count] = vel_ys
+        store.on_ground[:count] = on_grounds
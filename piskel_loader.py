@@ -5,11 +5,20 @@ Piskel JSON 파일에서 이미지를 추출하여 Pygame Surface로 변환
 import json
 import base64
 import io
+import mmap
 import os
+import struct
 import sys
-from PIL import Image
+from collections import OrderedDict
 import pygame
 
+# 미리 디코딩한 에셋 번들 (bake_assets.py로 생성)
+# 형식: 헤더 '<4sII' (매직, 버전, 인덱스 길이) + 인덱스 JSON + RGBA 프레임 데이터
+BUNDLE_PATH = 'data/assets.bin'
+BUNDLE_MAGIC = b'DQAB'
+BUNDLE_VERSION = 1
+BUNDLE_HEADER = '<4sII'
+
 # #region agent log
 DEBUG_ENABLED = False  # 성능 최적화를 위해 비활성화
 DEBUG_LOG_PATH = r"c:\Users\UserK\Desktop\DEQJAM\.cursor\debug.log"
@@ -37,10 +46,17 @@ class PiskelLoader:
     """Piskel 파일을 로드하고 Pygame Surface로 변환하는 클래스"""
     
     _cache = {}  # 이미지 캐시
+    _variant_cache = OrderedDict()  # 파생 이미지 LRU 캐시 {(full_path, frame, size, flip, tint): Surface}
+    max_variants = 512  # 파생 이미지 캐시 최대 개수 (넘으면 가장 오래 안 쓴 것부터 제거)
+    _frames_cache = {}  # 애니메이션 프레임 캐시 {full_path: ([Surface] 또는 실패 시 None, fps)}
+    _bundle = None  # 에셋 번들 (mmap, 인덱스, 데이터 시작 위치), 번들이 없으면 False
+    _pending = {}  # 백그라운드에서 디코딩 중인 파일 {full_path: Future}
+    _placeholders = {}  # 디코딩 중에 요청된 파생 이미지 자리 {full_path: [(key, Surface)]}
+    PLACEHOLDER_COLOR = (128, 128, 128, 96)  # 자리 표시 이미지 색상 (반투명 회색)
     
     @staticmethod
-    def get_resource_path(file_path):
-        """실행 파일 또는 일반 스크립트에서 리소스 경로 가져오기"""
+    def get_base_path():
+        """리소스 기준 디렉토리 (실행 파일 또는 스크립트 위치)"""
         if getattr(sys, 'frozen', False):
             # cx_Freeze 또는 PyInstaller로 빌드된 실행 파일
             if hasattr(sys, '_MEIPASS'):
@@ -55,25 +71,38 @@ class PiskelLoader:
         else:
             # 일반 Python 스크립트
             base_path = os.path.dirname(os.path.abspath(__file__))
-        
+        return base_path
+    
+    @staticmethod
+    def get_resource_path(file_path):
+        """실행 파일 또는 일반 스크립트에서 리소스 경로 가져오기"""
         # 상대 경로 처리
         if not os.path.isabs(file_path):
-            full_path = os.path.join(base_path, file_path)
+            full_path = os.path.join(PiskelLoader.get_base_path(), file_path)
         else:
             full_path = file_path
         
         return full_path
     
+    @staticmethod
+    def get_asset_key(full_path):
+        """번들 인덱스 키 (기준 디렉토리에 대한 상대 경로, '/' 구분)"""
+        return os.path.relpath(full_path, PiskelLoader.get_base_path()).replace(os.sep, '/')
+    
+    @staticmethod
+    def is_development():
+        """개발 환경인지 (빌드된 실행 파일이나 안드로이드가 아님)"""
+        if getattr(sys, 'frozen', False):
+            return False
+        return 'ANDROID_ARGUMENT' not in os.environ and 'ANDROID_PRIVATE' not in os.environ
+    
     @staticmethod
     def load_piskel(file_path):
-        """Piskel 파일을 로드하고 이미지를 반환"""
+        """Piskel 파일을 로드하고 이미지를 반환 (모든 레이어를 합친 첫 프레임)"""
         # #region agent log
         debug_log("piskel_loader.py:46", "load_piskel called", {"file_path": file_path}, "B")
         # #endregion
         full_path = PiskelLoader.get_resource_path(file_path)
-        # #region agent log
-        debug_log("piskel_loader.py:50", "Resource path resolved", {"file_path": file_path, "full_path": full_path, "file_exists": os.path.exists(full_path)}, "B")
-        # #endregion
         
         # 캐시 확인
         if full_path in PiskelLoader._cache:
@@ -82,69 +111,16 @@ class PiskelLoader:
             # #endregion
             return PiskelLoader._cache[full_path]
         
-        try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Piskel 파일 구조에서 이미지 데이터 추출
-            layers = data['piskel']['layers']
-            if not layers:
-                # #region agent log
-                debug_log("piskel_loader.py:63", "No layers found", {"file_path": file_path}, "B")
-                # #endregion
-                return None
-            
-            layer_data = json.loads(layers[0])
-            chunks = layer_data.get('chunks', [])
-            
-            if not chunks:
-                # #region agent log
-                debug_log("piskel_loader.py:69", "No chunks found", {"file_path": file_path}, "B")
-                # #endregion
-                return None
-            
-            base64_data = chunks[0].get('base64PNG', '')
-            if not base64_data:
-                # #region agent log
-                debug_log("piskel_loader.py:75", "No base64 data", {"file_path": file_path}, "B")
-                # #endregion
-                return None
-            
-            # data:image/png;base64, 접두사 제거
-            if base64_data.startswith('data:image/png;base64,'):
-                base64_data = base64_data.split(',')[1]
-            
-            # Base64 디코딩
-            image_data = base64.b64decode(base64_data)
-            image = Image.open(io.BytesIO(image_data))
-            
-            # RGBA 모드로 변환
-            if image.mode != 'RGBA':
-                image = image.convert('RGBA')
-            
-            # Pygame Surface로 변환
-            pygame_image = pygame.image.fromstring(
-                image.tobytes(), 
-                image.size, 
-                image.mode
-            )
-            
-            # 캐시에 저장
-            PiskelLoader._cache[full_path] = pygame_image
-            # #region agent log
-            debug_log("piskel_loader.py:100", "Image loaded successfully", {"file_path": file_path, "image_size": pygame_image.get_size()}, "B")
-            # #endregion
-            return pygame_image
-            
-        except Exception as e:
-            # #region agent log
-            debug_log("piskel_loader.py:105", "Error loading piskel", {"file_path": file_path, "error": str(e)}, "B")
-            # #endregion
-            print(f"Error loading piskel file {file_path}: {e}")
-            # 빨간색 사각형 반환 (에러 표시)
-            surf = pygame.Surface((32, 32))
-            surf.fill((255, 0, 0))
-            return surf
+        # 프레임 디코딩은 load_frames와 공유 (파일당 한 번)
+        frames = PiskelLoader.load_frames(file_path)
+        if frames:
+            PiskelLoader._cache[full_path] = frames[0]
+            return frames[0]
+        
+        # 빨간색 사각형 반환 (에러 표시)
+        surf = pygame.Surface((32, 32))
+        surf.fill((255, 0, 0))
+        return surf
     
     @staticmethod
     def load_piskel_with_cache(file_path, cache=None):
@@ -161,4 +137,307 @@ class PiskelLoader:
         if image:
             cache[full_path] = image
         return image
-
+    
+    @staticmethod
+    def load_variant(file_path, size=None, flip=False, tint=None, frame=0):
+        """크기 변환/좌우 반전/색조 적용 이미지를 공유 LRU 캐시에서 가져오기 (처음 한 번만 변환, 실패하면 None)
+        
+        tint는 곱할 (r, g, b) 색상. 반환된 Surface는 여러 곳에서 함께 쓰므로 수정하지 말 것
+        """
+        full_path = PiskelLoader.get_resource_path(file_path)
+        key = (full_path, frame, tuple(size) if size else None, bool(flip), tuple(tint) if tint else None)
+        cache = PiskelLoader._variant_cache
+        image = cache.get(key)
+        if image is not None:
+            cache.move_to_end(key)
+            return image
+        
+        if PiskelLoader.is_pending(file_path) and key[2] is not None:
+            # 아직 디코딩 중 - 자리 표시 이미지를 주고, 디코딩이 끝나면 같은 Surface에 실제 이미지를 그림
+            image = pygame.Surface(key[2], pygame.SRCALPHA)
+            image.fill(PiskelLoader.PLACEHOLDER_COLOR)
+            PiskelLoader._placeholders.setdefault(full_path, []).append((key, image))
+        else:
+            frames = PiskelLoader.load_frames(file_path)
+            if not frames or frame >= len(frames):
+                return None
+            image = PiskelLoader._make_variant(frames, key)
+        
+        cache[key] = image
+        while len(cache) > PiskelLoader.max_variants:
+            cache.popitem(last=False)
+        return image
+    
+    @staticmethod
+    def _make_variant(frames, key):
+        """프레임 리스트에서 파생 이미지 만들기 (key는 load_variant의 캐시 키)"""
+        _, frame, size, flip, tint = key
+        image = frames[frame]
+        if size is not None and image.get_size() != size:
+            image = pygame.transform.scale(image, size)
+        if flip:
+            image = pygame.transform.flip(image, True, False)
+        if tint:
+            if image is frames[frame]:
+                image = image.copy()
+            image.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+        return image
+    
+    @staticmethod
+    def load_scaled(file_path, size):
+        """크기를 바꾼 이미지를 공유 캐시에서 가져오기 (load_variant 참고)"""
+        return PiskelLoader.load_variant(file_path, size)
+    
+    @staticmethod
+    def _decode_chunk_image(base64_data):
+        """청크의 base64 PNG를 Pygame Surface로 디코딩 (Pillow는 .piskel을 직접 읽을 때만 필요)"""
+        from PIL import Image
+        if base64_data.startswith('data:image/png;base64,'):
+            base64_data = base64_data.split(',')[1]
+        image = Image.open(io.BytesIO(base64.b64decode(base64_data)))
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+        return pygame.image.fromstring(image.tobytes(), image.size, image.mode)
+    
+    @staticmethod
+    def _slice_layer(layer_data, frame_width, frame_height):
+        """레이어의 청크 이미지를 frameCount개의 프레임으로 자름 (layout[열][행] = 프레임 번호)"""
+        frame_count = layer_data.get('frameCount', 1)
+        frames = [None] * frame_count
+        for chunk in layer_data.get('chunks', []):
+            base64_data = chunk.get('base64PNG', '')
+            if not base64_data:
+                continue
+            sheet = PiskelLoader._decode_chunk_image(base64_data)
+            # layout이 없으면 가로 한 줄
+            layout = chunk.get('layout') or [[index] for index in range(frame_count)]
+            for column, frame_indices in enumerate(layout):
+                for row, frame_index in enumerate(frame_indices):
+                    if 0 <= frame_index < frame_count:
+                        rect = pygame.Rect(column * frame_width, row * frame_height, frame_width, frame_height)
+                        frames[frame_index] = sheet.subsurface(rect)
+        return frames
+    
+    @staticmethod
+    def decode_piskel(full_path):
+        """.piskel 파일 디코딩 - (레이어를 합친 프레임 리스트, fps) 반환 (디스플레이 형식 변환 전)
+        
+        모든 레이어를 아래에서부터 불투명도에 맞춰 합치고, 스프라이트 시트를 frameCount개의 프레임으로 자름
+        """
+        with open(full_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        piskel = data['piskel']
+        frame_width = piskel['width']
+        frame_height = piskel['height']
+        fps = piskel.get('fps') or 12
+        
+        composited = []
+        for layer in piskel['layers']:
+            layer_data = json.loads(layer)
+            opacity = layer_data.get('opacity', 1)
+            if opacity <= 0:
+                continue
+            layer_frames = PiskelLoader._slice_layer(layer_data, frame_width, frame_height)
+            while len(composited) < len(layer_frames):
+                composited.append(pygame.Surface((frame_width, frame_height), pygame.SRCALPHA))
+            for frame, layer_frame in zip(composited, layer_frames):
+                if layer_frame is None:
+                    continue
+                if opacity < 1:
+                    layer_frame = layer_frame.copy()
+                    layer_frame.set_alpha(int(opacity * 255))
+                frame.blit(layer_frame, (0, 0))
+        return composited, fps
+    
+    @staticmethod
+    def _get_bundle():
+        """에셋 번들 열기 (처음 한 번만 mmap, 없으면 None)"""
+        if PiskelLoader._bundle is None:
+            PiskelLoader._bundle = False
+            bundle_path = PiskelLoader.get_resource_path(BUNDLE_PATH)
+            if os.path.exists(bundle_path):
+                try:
+                    with open(bundle_path, 'rb') as f:
+                        # 쓰기 시 복사 - 파일은 바뀌지 않고, Surface가 프레임 데이터를 바로 참조
+                        bundle_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+                    magic, version, index_length = struct.unpack_from(BUNDLE_HEADER, bundle_map, 0)
+                    if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+                        raise ValueError("unsupported bundle format")
+                    header_size = struct.calcsize(BUNDLE_HEADER)
+                    index = json.loads(bundle_map[header_size:header_size + index_length].decode('utf-8'))
+                    PiskelLoader._bundle = (bundle_map, index, header_size + index_length)
+                except Exception as e:
+                    print(f"Error loading asset bundle {bundle_path}: {e}")
+        return PiskelLoader._bundle or None
+    
+    @staticmethod
+    def _load_bundled_frames(full_path):
+        """번들에서 프레임 가져오기 - (프레임 리스트, fps), 번들에 없으면 None
+        
+        개발 환경에서 원본 .piskel이 번들을 만든 뒤 바뀌었으면 None (.piskel을 직접 읽음)
+        """
+        bundle = PiskelLoader._get_bundle()
+        if bundle is None:
+            return None
+        bundle_map, index, data_start = bundle
+        entry = index.get(PiskelLoader.get_asset_key(full_path))
+        if entry is None:
+            return None
+        if PiskelLoader.is_development() and os.path.exists(full_path):
+            if os.path.getmtime(full_path) != entry['mtime']:
+                return None
+        
+        width = entry['width']
+        height = entry['height']
+        frame_size = width * height * 4
+        view = memoryview(bundle_map)
+        frames = []
+        for offset in entry['frames']:
+            start = data_start + offset
+            frames.append(pygame.image.frombuffer(view[start:start + frame_size], (width, height), 'RGBA'))
+        return frames, entry['fps']
+    
+    @staticmethod
+    def read_frames(full_path):
+        """번들 또는 .piskel에서 프레임 읽기 - (프레임 리스트, fps) (캐시/디스플레이 변환 없음, 작업 스레드에서 호출 가능)"""
+        loaded = PiskelLoader._load_bundled_frames(full_path)
+        if loaded is None:
+            loaded = PiskelLoader.decode_piskel(full_path)
+        return loaded
+    
+    @staticmethod
+    def is_pending(file_path):
+        """백그라운드에서 디코딩 중인 파일인지"""
+        return bool(PiskelLoader._pending) and PiskelLoader.get_resource_path(file_path) in PiskelLoader._pending
+    
+    @staticmethod
+    def preload(file_path, executor):
+        """executor(스레드 풀)에서 파일 디코딩 시작 - 시작했으면 True (이미 로드됐거나 디코딩 중이면 무시)"""
+        full_path = PiskelLoader.get_resource_path(file_path)
+        if full_path in PiskelLoader._frames_cache or full_path in PiskelLoader._pending:
+            return False
+        bundle = PiskelLoader._get_bundle()  # 번들은 메인 스레드에서 먼저 열어 둠
+        if not os.path.exists(full_path) and (bundle is None or PiskelLoader.get_asset_key(full_path) not in bundle[1]):
+            return False  # 없는 파일은 평소처럼 처음 사용할 때 폴백 이미지로
+        PiskelLoader._pending[full_path] = executor.submit(PiskelLoader.read_frames, full_path)
+        return True
+    
+    @staticmethod
+    def finish_pending(full_path):
+        """디코딩이 끝난 파일을 캐시에 넣고 자리 표시 이미지를 실제 이미지로 교체 (메인 스레드에서 호출)"""
+        future = PiskelLoader._pending.pop(full_path)
+        frames = None
+        fps = 12
+        try:
+            composited, fps = future.result()
+            if composited:
+                frames = [PiskelLoader._prepare_surface(frame) for frame in composited]
+            else:
+                print(f"Error loading piskel file {full_path}: no frames")
+        except Exception as e:
+            print(f"Error loading piskel file {full_path}: {e}")
+        PiskelLoader._frames_cache[full_path] = (frames, fps)
+        
+        for key, placeholder in PiskelLoader._placeholders.pop(full_path, []):
+            if frames and key[1] < len(frames):
+                placeholder.fill((0, 0, 0, 0))
+                placeholder.blit(PiskelLoader._make_variant(frames, key), (0, 0))
+            elif PiskelLoader._variant_cache.get(key) is placeholder:
+                # 읽지 못한 파일 - 자리 표시 이미지를 캐시에서 빼서 쓰는 곳이 폴백 이미지를 쓰게 함
+                del PiskelLoader._variant_cache[key]
+    
+    @staticmethod
+    def process_pending():
+        """디코딩이 끝난 파일들을 처리하고 남은 개수 반환 (매 프레임 호출, 기다리지 않음)"""
+        for full_path in [path for path, future in PiskelLoader._pending.items() if future.done()]:
+            PiskelLoader.finish_pending(full_path)
+        return len(PiskelLoader._pending)
+    
+    @staticmethod
+    def load_frames(file_path):
+        """Piskel 파일의 애니메이션 프레임 리스트 반환 (파일당 한 번만 디코딩, 실패하면 None)
+        
+        에셋 번들에 있으면 번들의 RGBA 데이터를 그대로 쓰고, 없으면 .piskel 파일 디코딩
+        """
+        full_path = PiskelLoader.get_resource_path(file_path)
+        cached = PiskelLoader._frames_cache.get(full_path)
+        if cached is not None:
+            return cached[0]
+        
+        future = PiskelLoader._pending.get(full_path)
+        if future is not None:
+            if not future.done():
+                return None  # 디코딩 중 - 기다리지 않음
+            PiskelLoader.finish_pending(full_path)
+            return PiskelLoader._frames_cache[full_path][0]
+        
+        frames = None
+        fps = 12
+        try:
+            composited, fps = PiskelLoader.read_frames(full_path)
+            
+            if composited:
+                # 디스플레이 픽셀 형식으로 한 번만 변환 (blit 때마다 형식 변환하지 않음)
+                frames = [PiskelLoader._prepare_surface(frame) for frame in composited]
+            else:
+                print(f"Error loading piskel file {file_path}: no frames")
+        
+        except Exception as e:
+            print(f"Error loading piskel file {file_path}: {e}")
+        
+        # 실패도 캐시 (같은 파일을 매번 다시 읽지 않음)
+        PiskelLoader._frames_cache[full_path] = (frames, fps)
+        return frames
+    
+    @staticmethod
+    def _prepare_surface(surface):
+        """디스플레이 픽셀 형식으로 변환 (투명 픽셀이 없으면 알파 없는 Surface로 - 불투명 blit이 가장 빠름)
+        
+        디스플레이가 아직 없으면 그대로 반환 (set_mode 후 convert_loaded에서 변환)
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        try:
+            if pygame.surfarray.array_alpha(surface).min() == 255:
+                return surface.convert()
+            return surface.convert_alpha()
+        except Exception as e:
+            print(f"Error converting surface: {e}")
+            return surface
+    
+    @staticmethod
+    def convert_loaded():
+        """이미 로드된 프레임을 디스플레이 픽셀 형식으로 변환 (set_mode 후 호출)
+        
+        첫 프레임/파생 이미지 캐시는 비워서 변환된 프레임으로 다시 만들게 함
+        """
+        for full_path, (frames, fps) in list(PiskelLoader._frames_cache.items()):
+            if frames:
+                frames = [PiskelLoader._prepare_surface(frame) for frame in frames]
+                PiskelLoader._frames_cache[full_path] = (frames, fps)
+        PiskelLoader._cache.clear()
+        PiskelLoader._variant_cache.clear()
+    
+    @staticmethod
+    def get_loaded_paths():
+        """로드된 파일 경로 리스트 (작업 스레드에서 호출 가능)"""
+        return list(PiskelLoader._frames_cache)
+    
+    @staticmethod
+    def replace_frames(full_path, composited, fps):
+        """다시 디코딩한 프레임으로 교체하고 이 파일의 첫 프레임/파생 이미지 캐시만 비움 (메인 스레드에서 호출)"""
+        frames = [PiskelLoader._prepare_surface(frame) for frame in composited]
+        PiskelLoader._frames_cache[full_path] = (frames, fps)
+        PiskelLoader._cache.pop(full_path, None)
+        variant_cache = PiskelLoader._variant_cache
+        for key in [key for key in variant_cache if key[0] == full_path]:
+            del variant_cache[key]
+    
+    @staticmethod
+    def get_fps(file_path, default=12):
+        """Piskel 파일에 저장된 애니메이션 FPS (load_frames 이후에 사용)"""
+        cached = PiskelLoader._frames_cache.get(PiskelLoader.get_resource_path(file_path))
+        if cached is None:
+            return default
+        return cached[1] or default
@@ -3,8 +3,14 @@
 """
 import pygame
 import math
-from utils import Colors, clamp, distance
-from piskel_loader import PiskelLoader
+from utils import Colors, clamp, distance, lerp
+from animation import SpriteSheet, Animator, ANIM_IDLE, ANIM_WALK, ANIM_JUMP, ANIM_ATTACK
+
+# 성별별 플레이어 이미지 경로
+PLAYER_IMAGE_PATHS = {
+    'man': 'fig/player/Species/MAN SPECIES/1no species.piskel',
+    'woman': 'fig/player/Species/WOMAN  SPECIES/2no speicies.piskel',
+}
 
 
 class Player:
@@ -18,6 +24,8 @@ class Player:
         self.height = block_size * 2
         self.x = x
         self.y = y
+        self.prev_x = x  # 이전 시뮬레이션 스텝 위치 (렌더링 보간용)
+        self.prev_y = y
         self.vel_x = 0
         self.vel_y = 0
         self.speed = 9  # 5 * 1.8 = 9
@@ -28,29 +36,25 @@ class Player:
         self.can_jump = True
         self.max_health = 100
         self.health = 100
-        self.image = None
-        self.image_flipped = None  # 뒤집힌 이미지 캐시
+        self.animator = None
         self.load_image()
-        self.animation_timer = 0
+        self.attack_time = 0.0  # 공격 애니메이션 남은 시간 (초)
         self.facing_right = True
     
     def load_image(self):
-        """플레이어 이미지 로드"""
+        """플레이어 스프라이트 시트 로드 (크기 변환/뒤집은 프레임은 시트에 캐시)"""
         if self.gender == 'man':
-            image_path = 'fig/player/Species/MAN SPECIES/1no species.piskel'
+            image_path = PLAYER_IMAGE_PATHS['man']
         else:
-            image_path = 'fig/player/Species/WOMAN  SPECIES/2no speicies.piskel'
+            image_path = PLAYER_IMAGE_PATHS['woman']
         
-        self.image = PiskelLoader.load_piskel_with_cache(image_path)
-        if self.image:
-            self.image = pygame.transform.scale(self.image, (self.width, self.height))
-            # 뒤집힌 이미지 미리 생성 (성능 최적화)
-            self.image_flipped = pygame.transform.flip(self.image, True, False)
-        else:
+        sheet = SpriteSheet.load(image_path, (self.width, self.height))
+        if sheet is None:
             # 기본 이미지 (빨간색 사각형)
-            self.image = pygame.Surface((self.width, self.height))
-            self.image.fill(Colors.RED)
-            self.image_flipped = pygame.transform.flip(self.image, True, False)
+            image = pygame.Surface((self.width, self.height))
+            image.fill(Colors.RED)
+            sheet = SpriteSheet([image])
+        self.animator = Animator(sheet)
     
     def update(self, keys, dt, mobile_input=None):
         """플레이어 업데이트
@@ -107,6 +111,22 @@ class Player:
             # 바닥에 닿으면 자동으로 점프 가능하게
             if self.on_ground:
                 self.can_jump = True
+        
+        # 애니메이션 상태 선택 (중력과 충돌은 PhysicsSystem에서 처리)
+        if self.attack_time > 0:
+            self.attack_time -= dt
+            self.animator.set_state(ANIM_ATTACK)
+        elif not self.on_ground:
+            self.animator.set_state(ANIM_JUMP)
+        elif self.vel_x != 0:
+            self.animator.set_state(ANIM_WALK)
+        else:
+            self.animator.set_state(ANIM_IDLE)
+    
+    def start_attack(self, duration=0.3):
+        """공격 애니메이션 시작"""
+        self.attack_time = duration
+        self.animator.set_state(ANIM_ATTACK)
     
     def jump(self):
         """점프 실행 (모바일 버튼용)"""
@@ -114,32 +134,15 @@ class Player:
             self.vel_y = -self.jump_power
             self.on_ground = False
             self.can_jump = False
-        
-        # 중력 적용
-        if not self.on_ground:
-            self.vel_y += self.gravity
-        
-        # Y 좌표 제한 (+2000 이상 올라갈 수 없음)
-        if self.y < -2000 * self.block_size:
-            self.y = -2000 * self.block_size
-            self.vel_y = 0
-        
-        # 애니메이션 타이머 업데이트
-        self.animation_timer += dt
-    
-    def apply_velocity(self):
-        """속도 적용"""
-        self.x += self.vel_x
-        self.y += self.vel_y
     
     def get_rect(self):
         """플레이어의 충돌 사각형 반환"""
         return pygame.Rect(self.x, self.y, self.width, self.height)
     
-    def draw(self, screen, camera_x, camera_y):
-        """플레이어 그리기 - 최적화된 버전"""
-        screen_x = int(self.x - camera_x)
-        screen_y = int(self.y - camera_y)
+    def draw(self, screen, camera_x, camera_y, alpha=1.0):
+        """플레이어 그리기 - 최적화된 버전 (alpha: 이전/현재 스텝 사이 보간 비율)"""
+        screen_x = int(lerp(self.prev_x, self.x, alpha) - camera_x)
+        screen_y = int(lerp(self.prev_y, self.y, alpha) - camera_y)
         
         # 화면 밖이면 그리지 않음 (더 빠른 검사)
         screen_width = screen.get_width()
@@ -148,13 +151,6 @@ class Player:
             screen_y < -self.height or screen_y > screen_height + self.height):
             return
         
-        # 이미지 뒤집기 (캐시된 이미지 사용)
-        if not self.facing_right:
-            draw_image = self.image_flipped
-        else:
-            draw_image = self.image
-        
-        # 플레이어 그리기
-        if draw_image:
-            screen.blit(draw_image, (screen_x, screen_y))
+        # 현재 애니메이션 프레임 (왼쪽을 보면 미리 뒤집은 프레임)
+        screen.blit(self.animator.get_frame(self.facing_right), (screen_x, screen_y))
 
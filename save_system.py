@@ -0,0 +1,576 @@
+"""
+세이브 시스템
+게임 상태(월드, 플레이어, 인벤토리, 시간, PIKU, 거래)를 버전이 있는 바이너리 세이브로 저장하고,
+블록 편집과 인벤토리 변경은 저널(write-ahead log)에 기록했다가 자동 저장 시 메인 세이브로 압축
+"""
+import os
+import sys
+import struct
+import threading
+
+
+SAVE_MAGIC = b'DQSV'
+SAVE_VERSION = 3  # 1: 월드 + 인벤토리, 2: 플레이어/시간/PIKU/거래 상태 추가, 3: 떨어진 아이템 추가
+
+# 저널 레코드 종류
+OP_PLACE = 1  # 블록 설치 (block_x, block_y, block_type)
+OP_REMOVE = 2  # 블록 제거 (block_x, block_y)
+OP_INVENTORY = 3  # 인벤토리 전체 상태
+OP_DIMENSION = 4  # 세계 전환 (0 = 원래 세계, 1 = 다른 세계)
+OP_ITEMS = 5  # 떨어진 아이템 전체 상태 (첫 레코드 여부 + encode_items 결과)
+OP_CHUNK = 6  # 처음 수정되는 청크의 수정 전 블록 전체 (chunk_x, chunk_y, [로컬 인덱스, block_type]...)
+
+ITEMS_PER_RECORD = 200  # 아이템 레코드 하나에 넣는 최대 아이템 수 (페이로드 길이 제한 65535바이트)
+
+RECORD_HEADER = struct.Struct('<BH')  # (레코드 종류, 페이로드 길이)
+BLOCK_POS = struct.Struct('<ii')
+
+
+def get_save_dir():
+    """세이브 파일 디렉토리 반환 (안드로이드는 앱 전용 저장소 사용)"""
+    if 'ANDROID_PRIVATE' in os.environ:
+        base_path = os.environ['ANDROID_PRIVATE']
+    elif getattr(sys, 'frozen', False) and sys.executable:
+        base_path = os.path.dirname(os.path.abspath(sys.executable))
+    else:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_path, 'saves')
+
+
+def pack_string(text):
+    """짧은 문자열을 길이(1바이트) + UTF-8 바이트로 인코딩"""
+    data = text.encode('utf-8')
+    return struct.pack('<B', len(data)) + data
+
+
+def unpack_string(data, offset):
+    """pack_string으로 인코딩된 문자열 디코딩 - (문자열, 다음 오프셋) 반환"""
+    length = data[offset]
+    start = offset + 1
+    return data[start:start + length].decode('utf-8'), start + length
+
+
+def encode_inventory(inventory):
+    """인벤토리(핫바 + 슬롯) 상태를 바이트로 인코딩"""
+    parts = []
+    for container in (inventory.hotbar, inventory.items):
+        parts.append(struct.pack('<H', len(container)))
+        for slot_idx, item in sorted(container.items()):
+            parts.append(struct.pack('<H', slot_idx))
+            parts.append(pack_string(item['type']))
+            parts.append(struct.pack('<Hhh', item['count'],
+                                     item.get('durability', -1),
+                                     item.get('max_durability', -1)))
+    return b''.join(parts)
+
+
+def decode_inventory(data, offset=0):
+    """encode_inventory 결과를 (hotbar, items, 다음 오프셋)으로 디코딩"""
+    containers = []
+    for _ in range(2):
+        container = {}
+        (count,) = struct.unpack_from('<H', data, offset)
+        offset += 2
+        for _ in range(count):
+            (slot_idx,) = struct.unpack_from('<H', data, offset)
+            item_type, offset = unpack_string(data, offset + 2)
+            item_count, durability, max_durability = struct.unpack_from('<Hhh', data, offset)
+            offset += 6
+            item = {'type': item_type, 'count': item_count}
+            if durability >= 0:
+                item['durability'] = durability
+                item['max_durability'] = max_durability
+            container[slot_idx] = item
+        containers.append(container)
+    return containers[0], containers[1], offset
+
+
+def encode_items(states):
+    """떨어진 아이템 상태 [(chunk_x, chunk_y, x, y, item_type, count)]를 바이트로 인코딩"""
+    parts = [struct.pack('<I', len(states))]
+    for chunk_x, chunk_y, x, y, item_type, count in states:
+        parts.append(struct.pack('<iiddH', chunk_x, chunk_y, x, y, count))
+        parts.append(pack_string(item_type))
+    return b''.join(parts)
+
+
+def decode_items(data, offset=0):
+    """encode_items 결과를 (상태 리스트, 다음 오프셋)으로 디코딩"""
+    states = []
+    (count,) = struct.unpack_from('<I', data, offset)
+    offset += 4
+    for _ in range(count):
+        chunk_x, chunk_y, x, y, item_count = struct.unpack_from('<iiddH', data, offset)
+        item_type, offset = unpack_string(data, offset + struct.calcsize('<iiddH'))
+        states.append((chunk_x, chunk_y, x, y, item_type, item_count))
+    return states, offset
+
+
+class WriteAheadJournal:
+    """블록/인벤토리 변경을 기록하는 바이너리 저널
+
+    메인 스레드는 메모리 버퍼에 레코드를 덧붙이기만 하고,
+    실제 디스크 기록(write + fsync)은 백그라운드 스레드가 flush_interval마다 수행
+    """
+
+    def __init__(self, path, flush_interval=0.3):
+        self.path = path
+        self.rotated_path = path + '.old'
+        self.flush_interval = flush_interval
+        self._buffer = bytearray()
+        self._lock = threading.Lock()  # 버퍼 보호 (메인 스레드가 잡는 시간은 아주 짧음)
+        self._io_lock = threading.Lock()  # 파일 쓰기/교체 보호
+        self._rotate_buffer = None  # 압축 시작 시점까지의 레코드 (이전 저널에 기록)
+        self._file = None
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    def start(self):
+        """저널 파일을 열고 백그라운드 flush 스레드 시작"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, 'ab')
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='journal-flush', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """flush 스레드 종료 후 남은 레코드 기록"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        with self._io_lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def append(self, op, payload=b''):
+        """레코드 추가 (디스크 기록은 flush 스레드가 처리)"""
+        with self._lock:
+            self._buffer += RECORD_HEADER.pack(op, len(payload))
+            self._buffer += payload
+
+    def log_place(self, block_x, block_y, block_type):
+        """블록 설치 기록"""
+        self.append(OP_PLACE, BLOCK_POS.pack(block_x, block_y) + pack_string(block_type))
+
+    def log_remove(self, block_x, block_y):
+        """블록 제거 기록"""
+        self.append(OP_REMOVE, BLOCK_POS.pack(block_x, block_y))
+
+    def log_inventory(self, inventory_data):
+        """인벤토리 상태 기록 (encode_inventory 결과)"""
+        self.append(OP_INVENTORY, inventory_data)
+
+    def log_chunk(self, chunk_x, chunk_y, block_types):
+        """청크 블록 전체 기록 (메인 세이브에 없는 청크를 처음 수정할 때)"""
+        parts = [struct.pack('<iiH', chunk_x, chunk_y, len(block_types))]
+        for (local_x, local_y), block_type in block_types.items():
+            parts.append(struct.pack('<B', local_y * 12 + local_x))
+            parts.append(pack_string(block_type))
+        self.append(OP_CHUNK, b''.join(parts))
+
+    def log_dimension(self, is_other_world):
+        """세계 전환 기록"""
+        self.append(OP_DIMENSION, struct.pack('<B', 1 if is_other_world else 0))
+
+    def log_items(self, states):
+        """떨어진 아이템 전체 상태 기록 (길면 여러 레코드로 나눔 - 첫 레코드가 이전 상태를 대체)"""
+        records = []
+        for start in range(0, max(len(states), 1), ITEMS_PER_RECORD):
+            payload = struct.pack('<B', 1 if start == 0 else 0) + encode_items(states[start:start + ITEMS_PER_RECORD])
+            records.append(RECORD_HEADER.pack(OP_ITEMS, len(payload)) + payload)
+        with self._lock:
+            self._buffer += b''.join(records)
+
+    def begin_compaction(self):
+        """메인 세이브 스냅샷 시점 표시 - 지금까지의 레코드는 이전 저널로 분리됨"""
+        with self._lock:
+            pending = bytes(self._buffer)
+            self._buffer.clear()
+            if self._rotate_buffer is None:
+                self._rotate_buffer = pending
+            else:
+                self._rotate_buffer += pending
+
+    def finish_compaction(self):
+        """메인 세이브 기록이 끝난 뒤 이전 저널 삭제"""
+        self.flush()
+        with self._io_lock:
+            if os.path.exists(self.rotated_path):
+                os.remove(self.rotated_path)
+
+    def flush(self):
+        """버퍼를 디스크에 기록 (압축 대기 중이면 저널 파일 교체)"""
+        with self._io_lock:
+            if self._file is None:
+                return
+            with self._lock:
+                data = bytes(self._buffer)
+                self._buffer.clear()
+                rotate_data = self._rotate_buffer
+                self._rotate_buffer = None
+
+            if rotate_data is not None:
+                # 스냅샷 이전 레코드는 이전 저널에 남기고 새 저널 시작
+                try:
+                    if rotate_data:
+                        self._file.write(rotate_data)
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+                    rotate_data = b''  # 현재 저널에 기록됨 - 다시 시도할 때는 파일 교체만
+                    self._file.close()
+                    if os.path.exists(self.rotated_path):
+                        # 이전 압축이 끝나지 않은 경우 이어 붙임
+                        with open(self.rotated_path, 'ab') as rotated, open(self.path, 'rb') as current:
+                            rotated.write(current.read())
+                        os.remove(self.path)
+                    else:
+                        os.replace(self.path, self.rotated_path)
+                    self._file = open(self.path, 'ab')
+                except Exception:
+                    # 교체 실패 - 레코드를 버퍼에 되돌려 다음 flush에서 다시 시도
+                    with self._lock:
+                        if self._rotate_buffer is not None:
+                            rotate_data += self._rotate_buffer
+                        self._rotate_buffer = rotate_data
+                        self._buffer[:0] = data
+                    if self._file.closed:
+                        self._file = open(self.path, 'ab')
+                    raise
+
+            if data:
+                self._file.write(data)
+                self._file.flush()
+                os.fsync(self._file.fileno())
+
+    def _run(self):
+        """백그라운드 flush 루프"""
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Journal flush error: {e}")
+
+    @staticmethod
+    def read_records(path):
+        """저널 파일의 레코드를 (op, payload)로 순회 (잘린 마지막 레코드는 무시)"""
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb') as f:
+            data = f.read()
+        offset = 0
+        while offset + RECORD_HEADER.size <= len(data):
+            op, length = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            if start + length > len(data):
+                break  # 기록 도중 종료된 레코드
+            yield op, data[start:start + length]
+            offset = start + length
+
+
+class SaveManager:
+    """메인 세이브 파일 + 저널 관리 (자동 저장 포함)
+
+    자동 저장은 메인 스레드에서 가벼운 스냅샷만 만들고,
+    인코딩과 디스크 기록은 작업 스레드에서 수행
+    """
+
+    def __init__(self, save_dir=None, autosave_interval=30.0, inventory_check_interval=0.25):
+        if save_dir is None:
+            save_dir = get_save_dir()
+        self.save_dir = save_dir
+        self.save_path = os.path.join(save_dir, 'world.sav')
+        self.journal = WriteAheadJournal(os.path.join(save_dir, 'world.journal'))
+        self.autosave_interval = autosave_interval
+        self.inventory_check_interval = inventory_check_interval
+        self.autosave_timer = 0.0
+        self.inventory_timer = 0.0
+        self.last_inventory_data = None
+        self.last_items_revision = None  # 마지막으로 기록한 DroppedItemManager.revision
+        self._save_thread = None
+        # 청크 인코딩 캐시 - 마지막 저장 이후 바뀐 청크만 다시 인코딩
+        # 두 캐시는 메인 세이브 기록이 성공한 뒤에만 함께 갱신 (실패하면 다음 저장에서 바뀐 청크를 다시 인코딩)
+        self._chunk_sources = {}  # {key: (청크 또는 보관된 블록 타입, revision)} (마지막으로 기록된 저장 기준)
+        self._chunk_data = {}  # {key: 인코딩된 청크 바이트} (마지막으로 기록된 저장 기준)
+        self._type_table = {}  # {block_type: index} (작업 스레드 전용)
+        self.player_restored = False  # 세이브에서 플레이어 위치를 복원했는지
+
+    def start(self, world, player, inventory, time_system, trade):
+        """세이브 + 저널을 복원하고 저널 기록 시작 - 저장된 PIKU 위치 반환 (없으면 None)"""
+        piku_pos = self.restore(world, player, inventory, time_system, trade)
+        world.journal = self.journal
+        self.last_inventory_data = encode_inventory(inventory)
+        self.journal.start()
+        return piku_pos
+
+    def restore(self, world, player, inventory, time_system, trade):
+        """메인 세이브를 불러온 뒤 저널(이전 저널 포함)을 재실행"""
+        piku_pos = None
+        if os.path.exists(self.save_path):
+            try:
+                piku_pos = self.load_save(world, player, inventory, time_system, trade)
+            except (OSError, ValueError, IndexError, struct.error) as e:
+                print(f"Error loading save file: {e}")
+
+        for path in (self.journal.rotated_path, self.journal.path):
+            for op, payload in WriteAheadJournal.read_records(path):
+                try:
+                    self.apply_record(op, payload, world, inventory)
+                except (ValueError, IndexError, struct.error, UnicodeDecodeError) as e:
+                    print(f"Error replaying journal record: {e}")
+        return piku_pos
+
+    def apply_record(self, op, payload, world, inventory):
+        """저널 레코드 하나를 월드/인벤토리에 적용"""
+        if op == OP_PLACE:
+            block_x, block_y = BLOCK_POS.unpack_from(payload, 0)
+            block_type, _ = unpack_string(payload, BLOCK_POS.size)
+            world.set_block_at(block_x, block_y, block_type)
+        elif op == OP_REMOVE:
+            block_x, block_y = BLOCK_POS.unpack_from(payload, 0)
+            world.set_block_at(block_x, block_y, None)
+        elif op == OP_INVENTORY:
+            inventory.hotbar, inventory.items, _ = decode_inventory(payload)
+        elif op == OP_DIMENSION:
+            world.reset_chunks(payload[0] == 1)
+        elif op == OP_CHUNK:
+            chunk_x, chunk_y, block_count = struct.unpack_from('<iiH', payload, 0)
+            offset = 10
+            blocks = {}
+            for _ in range(block_count):
+                local_index = payload[offset]
+                blocks[(local_index % 12, local_index // 12)], offset = unpack_string(payload, offset + 1)
+            world.load_chunk_state(chunk_x, chunk_y, blocks)
+        elif op == OP_ITEMS:
+            # 아이템은 청크와 함께 보관 - 청크가 로드되면 DroppedItemManager.restore_loaded가 꺼냄
+            if payload[0] == 1:
+                world.discard_stored_entities('item')
+            states, _ = decode_items(payload, 1)
+            for chunk_x, chunk_y, x, y, item_type, count in states:
+                world.store_entity((chunk_x, chunk_y), 'item', (x, y, item_type, count))
+
+    def update(self, dt, world, player, inventory, time_system, piku, trade, dropped_items=None):
+        """매 프레임 호출 - 인벤토리/떨어진 아이템 변경 기록 및 주기적 자동 저장"""
+        self.inventory_timer += dt
+        if self.inventory_timer >= self.inventory_check_interval:
+            self.inventory_timer = 0.0
+            self.log_inventory(inventory)
+            if dropped_items is not None:
+                self.log_items(world, dropped_items)
+
+        self.autosave_timer += dt
+        if self.autosave_timer >= self.autosave_interval:
+            self.autosave_timer = 0.0
+            self.save(world, player, inventory, time_system, piku, trade, dropped_items=dropped_items)
+
+    def log_inventory(self, inventory):
+        """인벤토리가 마지막 기록 이후 바뀌었으면 저널에 기록"""
+        data = encode_inventory(inventory)
+        if data != self.last_inventory_data:
+            self.last_inventory_data = data
+            self.journal.log_inventory(data)
+
+    def log_items(self, world, dropped_items):
+        """떨어진 아이템이 마지막 기록 이후 바뀌었으면 저널에 기록 (채굴한 블록이 자동 저장 전에 사라지지 않도록)"""
+        if dropped_items.revision != self.last_items_revision:
+            self.last_items_revision = dropped_items.revision
+            self.journal.log_items(dropped_items.get_save_states(world))
+
+    def snapshot(self, world, player, inventory, time_system, piku, trade, dropped_items=None):
+        """메인 스레드에서 현재 상태를 가볍게 복사 (바뀐 청크만 블록 타입 복사)"""
+        chunks = {}
+        sources = {}
+        for key, source in world.get_edited_chunk_sources().items():
+            revision = getattr(source, 'revision', 0)
+            sources[key] = (source, revision)
+            previous = self._chunk_sources.get(key)
+            if previous is not None and previous[0] is source and previous[1] == revision:
+                chunks[key] = None  # 마지막 저장 이후 변경 없음 - 캐시된 인코딩 재사용
+            elif hasattr(source, 'snapshot'):
+                chunks[key] = source.snapshot().block_types
+            else:
+                chunks[key] = source  # 보관된 청크는 읽기 전용 스냅샷 그대로 사용
+
+        return {
+            'is_other_world': world.is_other_world,
+            'player': (player.x, player.y, player.vel_x, player.vel_y,
+                       player.health, player.max_health, player.facing_right),
+            'time': (time_system.time, time_system.days_passed),
+            'piku': (piku.x, piku.y) if piku else None,
+            'trade': (trade.dialogue_complete, trade.trade_complete,
+                      trade.dialogue_index, trade.completion_dialogue_index),
+            'inventory': encode_inventory(inventory),
+            'chunks': chunks,
+            'chunk_sources': sources,
+            'items': dropped_items.get_save_states(world) if dropped_items else [],
+        }
+
+    def save(self, world, player, inventory, time_system, piku, trade, blocking=False, dropped_items=None):
+        """저널을 메인 세이브로 압축 (인코딩 + 디스크 기록은 작업 스레드에서)"""
+        if self._save_thread and self._save_thread.is_alive():
+            if not blocking:
+                return  # 이전 저장이 아직 진행 중
+            self._save_thread.join()
+
+        self.log_inventory(inventory)
+        snapshot = self.snapshot(world, player, inventory, time_system, piku, trade, dropped_items)
+        self.journal.begin_compaction()
+
+        if blocking:
+            self._write_snapshot(snapshot)
+        else:
+            self._save_thread = threading.Thread(
+                target=self._write_snapshot, args=(snapshot,), name='save-write', daemon=True
+            )
+            self._save_thread.start()
+
+    def _write_snapshot(self, snapshot):
+        """스냅샷을 메인 세이브로 기록한 뒤 이전 저널 삭제"""
+        try:
+            self.journal.flush()
+            self._chunk_data = self.write_save(snapshot)
+            self._chunk_sources = snapshot['chunk_sources']
+            self.journal.finish_compaction()
+        except Exception as e:
+            # 캐시와 이전 저널은 그대로 - 다음 저장에서 다시 시도
+            print(f"Error writing save file: {e}")
+
+    def close(self, world, player, inventory, time_system, piku, trade, dropped_items=None):
+        """게임 종료 시 마지막 저장 후 저널 종료"""
+        self.save(world, player, inventory, time_system, piku, trade, blocking=True, dropped_items=dropped_items)
+        self.journal.stop()
+
+    def encode_chunk(self, chunk_x, chunk_y, blocks):
+        """청크 하나를 (좌표, 블록 수, [로컬 인덱스, 타입 인덱스]...) 바이트로 인코딩"""
+        data = bytearray(struct.pack('<iiH', chunk_x, chunk_y, len(blocks)))
+        type_table = self._type_table
+        for (local_x, local_y), block_type in blocks.items():
+            type_index = type_table.get(block_type)
+            if type_index is None:
+                type_index = type_table[block_type] = len(type_table)
+            data.append(local_y * 12 + local_x)
+            data.append(type_index)
+        return bytes(data)
+
+    def encode_save(self, snapshot):
+        """스냅샷을 메인 세이브 바이트로 인코딩 - (세이브 바이트, 청크별 인코딩) 반환"""
+        chunk_data = {}
+        for key, blocks in snapshot['chunks'].items():
+            if blocks is None and key in self._chunk_data:
+                chunk_data[key] = self._chunk_data[key]
+            else:
+                if blocks is None:
+                    blocks = {}
+                chunk_data[key] = self.encode_chunk(key[0], key[1], blocks)
+
+        x, y, vel_x, vel_y, health, max_health, facing_right = snapshot['player']
+        time, days_passed = snapshot['time']
+        piku = snapshot['piku']
+        dialogue_complete, trade_complete, dialogue_index, completion_index = snapshot['trade']
+        inventory_data = snapshot['inventory']
+
+        parts = [
+            SAVE_MAGIC,
+            struct.pack('<HB', SAVE_VERSION, 1 if snapshot['is_other_world'] else 0),
+            struct.pack('<ddffhhB', x, y, vel_x, vel_y, health, max_health, 1 if facing_right else 0),
+            struct.pack('<dI', time, days_passed),
+            struct.pack('<Bdd', 1 if piku else 0, *(piku if piku else (0.0, 0.0))),
+            struct.pack('<BBBB', 1 if dialogue_complete else 0, 1 if trade_complete else 0,
+                        dialogue_index, completion_index),
+            struct.pack('<I', len(inventory_data)),
+            inventory_data,
+            struct.pack('<B', len(self._type_table)),
+        ]
+        for block_type in self._type_table:
+            parts.append(pack_string(block_type))
+        parts.append(struct.pack('<I', len(chunk_data)))
+        parts.extend(chunk_data.values())
+        # 떨어진 아이템 (소속 청크, 위치, 종류, 개수)
+        parts.append(encode_items(snapshot['items']))
+        return b''.join(parts), chunk_data
+
+    def write_save(self, snapshot):
+        """메인 세이브를 임시 파일에 기록한 뒤 원자적으로 교체 - 청크별 인코딩 반환 (다음 저장의 캐시)"""
+        data, chunk_data = self.encode_save(snapshot)
+        os.makedirs(self.save_dir, exist_ok=True)
+        temp_path = self.save_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.save_path)
+        return chunk_data
+
+    def load_save(self, world, player, inventory, time_system, trade):
+        """메인 세이브를 읽어 게임 상태에 적용 - 저장된 PIKU 위치 반환 (없으면 None)"""
+        with open(self.save_path, 'rb') as f:
+            data = f.read()
+        if data[:4] != SAVE_MAGIC:
+            raise ValueError("not a save file")
+        version, is_other_world = struct.unpack_from('<HB', data, 4)
+        if not 1 <= version <= SAVE_VERSION:
+            raise ValueError(f"unsupported save version {version}")
+        offset = 7
+
+        if is_other_world != world.is_other_world:
+            world.reset_chunks(bool(is_other_world))
+
+        # 플레이어 / 시간 / PIKU / 거래 진행 상태 (버전 1 세이브에는 없음 - 기본 상태 그대로 사용)
+        piku_pos = None
+        if version >= 2:
+            x, y, vel_x, vel_y, health, max_health, facing_right = struct.unpack_from('<ddffhhB', data, offset)
+            offset += struct.calcsize('<ddffhhB')
+            player.x, player.y = x, y
+            player.vel_x, player.vel_y = vel_x, vel_y
+            player.health, player.max_health = health, max_health
+            player.facing_right = bool(facing_right)
+            player.on_ground = False
+            self.player_restored = True
+
+            time_system.time, time_system.days_passed = struct.unpack_from('<dI', data, offset)
+            offset += struct.calcsize('<dI')
+
+            has_piku, piku_x, piku_y = struct.unpack_from('<Bdd', data, offset)
+            offset += struct.calcsize('<Bdd')
+            if has_piku:
+                piku_pos = (piku_x, piku_y)
+
+            dialogue_complete, trade_complete, dialogue_index, completion_index = struct.unpack_from('<BBBB', data, offset)
+            offset += 4
+            trade.dialogue_complete = bool(dialogue_complete)
+            trade.trade_complete = bool(trade_complete)
+            trade.dialogue_index = dialogue_index
+            trade.completion_dialogue_index = completion_index
+
+        (inventory_length,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+        inventory.hotbar, inventory.items, _ = decode_inventory(data, offset)
+        offset += inventory_length
+
+        type_count = data[offset]
+        offset += 1
+        type_table = []
+        for _ in range(type_count):
+            block_type, offset = unpack_string(data, offset)
+            type_table.append(block_type)
+
+        (chunk_count,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+        for _ in range(chunk_count):
+            chunk_x, chunk_y, block_count = struct.unpack_from('<iiH', data, offset)
+            offset += 10
+            blocks = {}
+            for _ in range(block_count):
+                local_index = data[offset]
+                blocks[(local_index % 12, local_index // 12)] = type_table[data[offset + 1]]
+                offset += 2
+            world.load_chunk_state(chunk_x, chunk_y, blocks)
+
+        if version >= 3:
+            # 떨어진 아이템은 청크와 함께 보관 - 청크가 로드되면 DroppedItemManager.restore_loaded가 꺼냄
+            states, offset = decode_items(data, offset)
+            for chunk_x, chunk_y, x, y, item_type, count in states:
+                world.store_entity((chunk_x, chunk_y), 'item', (x, y, item_type, count))
+        return piku_pos
@@ -1,6 +1,7 @@
 """
 cx_Freeze setup script for DEQJAM
 """
+import os
 import sys
 from cx_Freeze import setup, Executable
 
@@ -8,6 +9,9 @@ from cx_Freeze import setup, Executable
 include_files = [
     ("fig", "fig"),  # 이미지 파일들
 ]
+# 미리 디코딩한 에셋 번들 (python bake_assets.py로 생성)
+if os.path.exists("data/assets.bin"):
+    include_files.append(("data/assets.bin", "data/assets.bin"))
 
 # 제외할 모듈들
 excludes = [
@@ -21,7 +25,7 @@ excludes = [
 
 # 빌드 옵션
 build_exe_options = {
-    "packages": ["pygame", "PIL"],
+    "packages": ["pygame", "PIL", "numpy"],
     "include_files": include_files,
     "excludes": excludes,
     "optimize": 2,
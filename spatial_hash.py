@@ -0,0 +1,137 @@
+"""
+공간 해시 (균일 격자) - 주변 엔티티 빠르게 찾기
+"""
+
+
+class SpatialHash:
+    """균일 격자 공간 해시 클래스
+
+    엔티티는 x, y, width, height 속성을 가지며, AABB가 걸치는 모든 셀에 등록됨
+    """
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> 엔티티 리스트
+        self.entity_ranges = {}  # 엔티티 -> 등록된 셀 범위 (min_cx, min_cy, max_cx, max_cy)
+
+    def _get_cell_range(self, x, y, width, height):
+        """AABB가 걸치는 셀 범위 계산"""
+        cell_size = self.cell_size
+        return (
+            int(x // cell_size),
+            int(y // cell_size),
+            int((x + width) // cell_size),
+            int((y + height) // cell_size),
+        )
+
+    def _add_to_cells(self, entity, cell_range):
+        """셀 범위에 엔티티 등록"""
+        min_cx, min_cy, max_cx, max_cy = cell_range
+        cells = self.cells
+        for cell_x in range(min_cx, max_cx + 1):
+            for cell_y in range(min_cy, max_cy + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell is None:
+                    cells[(cell_x, cell_y)] = [entity]
+                else:
+                    cell.append(entity)
+
+    def _remove_from_cells(self, entity, cell_range):
+        """셀 범위에서 엔티티 제거 (빈 셀은 삭제)"""
+        min_cx, min_cy, max_cx, max_cy = cell_range
+        cells = self.cells
+        for cell_x in range(min_cx, max_cx + 1):
+            for cell_y in range(min_cy, max_cy + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell is None:
+                    continue
+                try:
+                    cell.remove(entity)
+                except ValueError:
+                    pass
+                if not cell:
+                    del cells[(cell_x, cell_y)]
+
+    def clear(self):
+        """모든 엔티티 제거"""
+        self.cells.clear()
+        self.entity_ranges.clear()
+
+    def insert(self, entity):
+        """엔티티 등록 (이미 등록되어 있으면 위치만 갱신)"""
+        self.update(entity)
+
+    def remove(self, entity):
+        """엔티티 제거"""
+        cell_range = self.entity_ranges.pop(entity, None)
+        if cell_range is not None:
+            self._remove_from_cells(entity, cell_range)
+
+    def update(self, entity):
+        """엔티티 위치 갱신 (걸치는 셀이 바뀌었을 때만 다시 등록)"""
+        cell_range = self._get_cell_range(entity.x, entity.y, entity.width, entity.height)
+        old_range = self.entity_ranges.get(entity)
+        if old_range == cell_range:
+            return
+        if old_range is not None:
+            self._remove_from_cells(entity, old_range)
+        self._add_to_cells(entity, cell_range)
+        self.entity_ranges[entity] = cell_range
+
+    def sync(self, entities):
+        """엔티티 목록과 동기화 - 살아있는 엔티티는 갱신, 사라지거나 죽은 엔티티는 제거"""
+        alive = set()
+        update = self.update
+        for entity in entities:
+            if getattr(entity, 'is_alive', True):
+                update(entity)
+                alive.add(entity)
+
+        for entity in [e for e in self.entity_ranges if e not in alive]:
+            self.remove(entity)
+
+    def query_rect(self, x, y, width, height):
+        """사각형과 겹치는 엔티티 리스트 반환 (경계만 닿는 경우는 제외)"""
+        min_cx, min_cy, max_cx, max_cy = self._get_cell_range(x, y, width, height)
+        right = x + width
+        bottom = y + height
+        cells = self.cells
+        seen = set()
+        result = []
+        for cell_x in range(min_cx, max_cx + 1):
+            for cell_y in range(min_cy, max_cy + 1):
+                cell = cells.get((cell_x, cell_y))
+                if not cell:
+                    continue
+                for entity in cell:
+                    if entity in seen:
+                        continue
+                    seen.add(entity)
+                    if (entity.x < right and entity.x + entity.width > x and
+                            entity.y < bottom and entity.y + entity.height > y):
+                        result.append(entity)
+        return result
+
+    def query_radius(self, x, y, radius):
+        """엔티티 위치(x, y)가 반경 안에 있는 엔티티 리스트 반환"""
+        min_cx, min_cy, max_cx, max_cy = self._get_cell_range(
+            x - radius, y - radius, radius * 2, radius * 2
+        )
+        radius_sq = radius * radius
+        cells = self.cells
+        seen = set()
+        result = []
+        for cell_x in range(min_cx, max_cx + 1):
+            for cell_y in range(min_cy, max_cy + 1):
+                cell = cells.get((cell_x, cell_y))
+                if not cell:
+                    continue
+                for entity in cell:
+                    if entity in seen:
+                        continue
+                    seen.add(entity)
+                    dx = entity.x - x
+                    dy = entity.y - y
+                    if dx * dx + dy * dy <= radius_sq:
+                        result.append(entity)
+        return result
@@ -0,0 +1,143 @@
+"""
+좀비 스폰 스케줄러 (청크별 스폰 지점 캐시 + 밤마다 스폰 예산)
+"""
+import random
+from world import BLOCK_TYPE_IDS
+
+# 좀비가 설 수 있는 바닥 블록 (나무/나뭇잎 위에는 스폰하지 않음)
+SPAWN_GROUND_TYPES = ('ground', 'rock')
+
+
+class SpawnScheduler:
+    """스폰 스케줄러 클래스 - 유효한 지표면 스폰 지점을 청크별로 캐시하고 예산과 간격에 맞춰 스폰
+
+    스폰 지점은 (왼쪽 블록 열, 발 블록 행)이며, 청크 각 열에서 가장 위의 설 수 있는 자리.
+    청크(와 위/아래/오른쪽 이웃 청크)의 revision이 바뀌면 다시 계산
+    """
+
+    def __init__(self, world, block_size=32, width_blocks=2, height_blocks=2,
+                 min_chunk_distance=2, max_chunk_distance=3, base_budget=10, budget_per_day=5,
+                 max_budget=40, spawn_interval=1.5, max_alive=3):
+        self.world = world
+        self.block_size = block_size
+        self.width_blocks = width_blocks
+        self.height_blocks = height_blocks
+        self.min_chunk_distance = min_chunk_distance  # 플레이어 청크와의 최소 거리 (청크)
+        self.max_chunk_distance = max_chunk_distance  # 플레이어 청크와의 최대 거리 (청크)
+        self.base_budget = base_budget  # 첫날 밤 스폰 수
+        self.budget_per_day = budget_per_day  # 하루마다 늘어나는 스폰 수
+        self.max_budget = max_budget
+        self.spawn_interval = spawn_interval  # 스폰 간격 (초)
+        self.max_alive = max_alive  # 동시에 살아있는 최대 좀비 수
+
+        self.budget = 0  # 이번 밤에 남은 스폰 수
+        self.budget_day = None  # 예산을 받은 날 (TimeSystem.days_passed)
+        self.spawn_timer = 0.0
+        self.chunk_spawn_points = {}  # (chunk_x, chunk_y) -> (revisions, [(block_x, foot_row)])
+        self.candidate_chunks = []  # 스폰 거리 안의 로드된 청크
+        self._candidate_key = None  # (플레이어 청크, 로드된 청크 수) - 바뀌면 후보 다시 계산
+
+        # 통과 불가 여부는 read_solid_region(Block.is_solid)으로 읽음 - 나중에 등록된 블록 타입도 반영
+        self.ground_ids = bytearray(256)
+        for block_type in SPAWN_GROUND_TYPES:
+            self.ground_ids[BLOCK_TYPE_IDS[block_type]] = 1
+
+    def _get_revisions(self, chunk_x, chunk_y):
+        """스폰 지점 계산에 쓰이는 청크들의 revision (자신, 위, 아래, 오른쪽)"""
+        get_chunk_revision = self.world.get_chunk_revision
+        return (
+            get_chunk_revision(chunk_x, chunk_y),
+            get_chunk_revision(chunk_x, chunk_y - 1),
+            get_chunk_revision(chunk_x, chunk_y + 1),
+            get_chunk_revision(chunk_x + 1, chunk_y),
+        )
+
+    def get_chunk_spawn_points(self, chunk_x, chunk_y):
+        """청크의 스폰 지점 리스트 반환 (청크가 바뀌지 않았으면 캐시 사용)"""
+        revisions = self._get_revisions(chunk_x, chunk_y)
+        cached = self.chunk_spawn_points.get((chunk_x, chunk_y))
+        if cached is not None and cached[0] == revisions:
+            return cached[1]
+
+        chunk_size = self.world.chunk_size
+        width_blocks = self.width_blocks
+        height_blocks = self.height_blocks
+        x0 = chunk_x * chunk_size
+        y0 = chunk_y * chunk_size - height_blocks  # 몸이 들어갈 위쪽 칸 포함
+        region_width = chunk_size + width_blocks - 1
+        region_height = chunk_size + height_blocks + 1  # 발 아래 한 줄 포함
+        region = self.world.read_region(x0, y0, x0 + region_width, y0 + region_height)
+        solid = self.world.read_solid_region(x0, y0, x0 + region_width, y0 + region_height)
+        ground_ids = self.ground_ids
+
+        points = []
+        for column in range(chunk_size):
+            # 위에서부터 내려가며 처음 설 수 있는 자리만 (지표면)
+            free_rows = 0
+            for row in range(region_height - 1):
+                start = row * region_width + column
+                if any(solid[start:start + width_blocks]):
+                    break
+                free_rows += 1
+                if free_rows < height_blocks or row < height_blocks:
+                    continue
+                below = start + region_width
+                if any(solid[below:below + width_blocks]):
+                    if any(ground_ids[type_id] for type_id in region[below:below + width_blocks]):
+                        points.append((x0 + column, y0 + row))
+                    break
+
+        self.chunk_spawn_points[(chunk_x, chunk_y)] = (revisions, points)
+        return points
+
+    def _update_candidates(self, player_x, player_y):
+        """플레이어 청크나 로드된 청크가 바뀌었으면 스폰 후보 청크 다시 계산"""
+        chunk_pixel_size = self.world.chunk_size * self.block_size
+        player_chunk_x = int(player_x // chunk_pixel_size)
+        player_chunk_y = int(player_y // chunk_pixel_size)
+        chunks = self.world.chunks
+        candidate_key = (player_chunk_x, player_chunk_y, len(chunks))
+        if candidate_key == self._candidate_key:
+            return
+        self._candidate_key = candidate_key
+
+        self.candidate_chunks = [
+            key for key in chunks
+            if self.min_chunk_distance <= max(abs(key[0] - player_chunk_x), abs(key[1] - player_chunk_y))
+            <= self.max_chunk_distance
+        ]
+        # 언로드된 청크의 스폰 지점 캐시 제거
+        for key in [key for key in self.chunk_spawn_points if key not in chunks]:
+            del self.chunk_spawn_points[key]
+
+    def pick_spawn_point(self, player_x, player_y):
+        """스폰 위치(픽셀 x, y) 하나 선택 - 실패하면 None"""
+        self._update_candidates(player_x, player_y)
+        if not self.candidate_chunks:
+            return None
+        chunk_x, chunk_y = random.choice(self.candidate_chunks)
+        points = self.get_chunk_spawn_points(chunk_x, chunk_y)
+        if not points:
+            return None
+        block_x, foot_row = random.choice(points)
+        block_size = self.block_size
+        return block_x * block_size, (foot_row + 1) * block_size - self.height_blocks * block_size
+
+    def update(self, dt, time_system, player, zombies):
+        """밤 동안 호출 - 밤마다 예산을 채우고 spawn_interval마다 한 마리씩 스폰"""
+        if self.budget_day != time_system.days_passed:
+            # 새 밤 시작 - 날이 지날수록 예산 증가
+            self.budget_day = time_system.days_passed
+            self.budget = min(self.max_budget, self.base_budget + self.budget_per_day * time_system.days_passed)
+            self.spawn_timer = 0.0
+
+        self.spawn_timer -= dt
+        if self.budget <= 0 or self.spawn_timer > 0 or len(zombies) >= self.max_alive:
+            return
+
+        spawn_pos = self.pick_spawn_point(player.x + player.width / 2, player.y + player.height / 2)
+        if spawn_pos is None:
+            return  # 다음 스텝에 다시 시도
+        zombies.spawn(spawn_pos[0], spawn_pos[1])
+        self.budget -= 1
+        self.spawn_timer = self.spawn_interval
@@ -0,0 +1,124 @@
+"""
+텍스처 아틀라스 (블록/아이템/UI 스프라이트를 큰 Surface 몇 장에 모아 Surface.blits 한 번으로 그리기)
+"""
+import pygame
+from piskel_loader import PiskelLoader
+
+ATLAS_PAGE_SIZE = 1024  # 아틀라스 한 장의 크기 (픽셀)
+
+
+class AtlasPage:
+    """아틀라스 한 장 - 선반(shelf) 방식으로 왼쪽 위부터 채움"""
+    
+    def __init__(self, size, alpha):
+        surface = pygame.Surface((size, size), pygame.SRCALPHA if alpha else 0)
+        if pygame.display.get_surface() is not None:
+            # 디스플레이 픽셀 형식으로 (불투명 스프라이트는 알파 없는 장에 모아 빠르게 그림)
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        self.surface = surface
+        self.size = size
+        self.alpha = alpha
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+    
+    def allocate(self, width, height):
+        """width x height 자리 할당 - Rect 반환 (자리가 없으면 None)"""
+        if self.shelf_x + width > self.size:
+            # 다음 선반으로
+            self.shelf_y += self.shelf_height
+            self.shelf_x = 0
+            self.shelf_height = 0
+        if width > self.size or self.shelf_y + height > self.size:
+            return None
+        rect = pygame.Rect(self.shelf_x, self.shelf_y, width, height)
+        self.shelf_x += width
+        self.shelf_height = max(self.shelf_height, height)
+        return rect
+
+
+class TextureAtlas:
+    """텍스처 아틀라스 클래스 - 스프라이트를 처음 쓸 때 아틀라스에 복사하고 (아틀라스 Surface, 영역)을 캐시
+    
+    그리는 쪽은 (아틀라스 Surface, 화면 위치, 영역) 리스트를 모아 screen.blits(..., doreturn=False)로 한 번에 그림
+    """
+    
+    def __init__(self, page_size=ATLAS_PAGE_SIZE):
+        self.page_size = page_size
+        self.pages = []
+        self.entries = {}  # {key: (아틀라스 Surface, Rect)}
+        self.asset_keys = {}  # Piskel 파일별 키 {full_path: [key]} (파일이 바뀌면 그 파일만 무효화)
+        self.free_rects = {}  # 무효화된 자리 {(alpha, width, height): [(AtlasPage, Rect)]} - 같은 크기 스프라이트에 재사용
+    
+    def add(self, key, surface):
+        """Surface를 아틀라스에 복사하고 (아틀라스 Surface, 영역) 반환 (아틀라스보다 크면 복사하지 않음)"""
+        alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+        width, height = surface.get_size()
+        rect = None
+        free_rects = self.free_rects.get((alpha, width, height))
+        if free_rects:
+            page, rect = free_rects.pop()
+            if alpha:
+                page.surface.fill((0, 0, 0, 0), rect)
+        else:
+            for page in self.pages:
+                if page.alpha == alpha:
+                    rect = page.allocate(width, height)
+                    if rect is not None:
+                        break
+        if rect is None and width <= self.page_size and height <= self.page_size:
+            page = AtlasPage(self.page_size, alpha)
+            self.pages.append(page)
+            rect = page.allocate(width, height)
+        if rect is None:
+            sprite = (surface, surface.get_rect())
+        else:
+            page.surface.blit(surface, rect)
+            sprite = (page.surface, rect)
+        self.entries[key] = sprite
+        return sprite
+    
+    def get_surface(self, key, make_surface):
+        """key의 스프라이트 반환 - 없으면 make_surface()로 만든 Surface를 아틀라스에 추가"""
+        sprite = self.entries.get(key)
+        if sprite is None:
+            sprite = self.add(key, make_surface())
+        return sprite
+    
+    def get_sprite(self, file_path, size, frame=0, flip=False, tint=None):
+        """Piskel 이미지의 스프라이트 (아틀라스 Surface, 영역) 반환 - 파일을 읽지 못하면 None
+        
+        인자는 PiskelLoader.load_variant와 같음. 디코딩 중인 자리 표시 이미지는 아틀라스에 넣지 않음
+        """
+        key = (file_path, size, frame, flip, tint)
+        sprite = self.entries.get(key)
+        if sprite is not None:
+            return sprite
+        image = PiskelLoader.load_variant(file_path, size, flip, tint, frame)
+        if image is None:
+            return None
+        if PiskelLoader.is_pending(file_path):
+            return image, image.get_rect()
+        self.asset_keys.setdefault(PiskelLoader.get_resource_path(file_path), []).append(key)
+        return self.add(key, image)
+    
+    def invalidate(self, full_path):
+        """Piskel 파일이 바뀌었을 때 그 파일의 스프라이트만 제거 (자리는 다음 스프라이트에 재사용)"""
+        pages = {id(page.surface): page for page in self.pages}
+        for key in self.asset_keys.pop(full_path, ()):
+            sprite = self.entries.pop(key, None)
+            page = pages.get(id(sprite[0])) if sprite is not None else None
+            if page is not None:
+                rect = sprite[1]
+                self.free_rects.setdefault((page.alpha, rect.width, rect.height), []).append((page, rect))
+    
+    def clear(self):
+        """아틀라스 비우기 (디스플레이 형식이 바뀌었을 때 등)"""
+        self.pages = []
+        self.entries.clear()
+        self.asset_keys.clear()
+        self.free_rects.clear()
+
+
+# 블록/아이템/UI가 함께 쓰는 아틀라스
+atlas = TextureAtlas()
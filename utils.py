@@ -91,6 +91,12 @@ def lerp(start, end, t):
     return start + (end - start) * t
 
 
+def store_previous_position(obj):
+    """시뮬레이션 스텝 전 위치 저장 (렌더링 보간용)"""
+    obj.prev_x = obj.x
+    obj.prev_y = obj.y
+
+
 def ease_in_out(t):
     """이징 함수 (ease in-out)"""
     return t * t * (3.0 - 2.0 * t)
@@ -6,8 +6,55 @@ import random
 import json
 import os
 import math
+import itertools
+from types import MappingProxyType
 from utils import Colors, get_chunk_coord, clamp
 from piskel_loader import PiskelLoader
+from animation import SpriteSheet, animation_clock
+from texture_atlas import atlas
+
+# 청크 revision 발급기 - 모든 청크에서 유일하므로 언로드 후 다시 생성된 청크와도 구분됨
+# (itertools.count의 next()는 GIL 아래에서 원자적)
+_revision_counter = itertools.count(1)
+
+# 블록 타입 ID (read_region 결과용, 0 = 빈 칸) - 처음 보는 타입은 get_block_type_id에서 자동 등록
+BLOCK_TYPE_IDS = {
+    'ground': 1,
+    'tree': 2,
+    'tree_leaf': 3,
+    'wood_plank': 4,
+    'plank_board': 5,
+    'water': 6,
+    'portal': 7,
+    'rock': 8,
+}
+BLOCK_TYPE_NAMES = [None] + list(BLOCK_TYPE_IDS)
+
+# 블록 이미지 경로
+BLOCK_IMAGE_PATHS = {
+    'ground': 'fig/block/ground.piskel',
+    'tree': 'fig/block/tree.piskel',
+    'tree_leaf': 'fig/block/tree_leaf.piskel',
+    'wood_plank': 'fig/block/나무판자.piskel',
+    'plank_board': 'fig/block/판자판.piskel',
+    'water': 'fig/block/water.piskel',  # 물 piskel 이미지 사용
+    'portal': 'fig/block/portal.piskel',
+    'rock': 'fig/block/rock.piskel',
+}
+NON_SOLID_BLOCK_TYPES = ('water',)  # 통과 가능한 블록
+INDEXED_BLOCK_TYPES = ('portal', 'water', 'tree')  # 청크별 위치 인덱스를 유지하는 블록 타입
+
+
+def get_block_type_id(block_type):
+    """블록 타입 이름을 타일 ID(1~255)로 변환"""
+    type_id = BLOCK_TYPE_IDS.get(block_type)
+    if type_id is None:
+        type_id = len(BLOCK_TYPE_NAMES)
+        if type_id > 255:
+            raise ValueError(f"too many block types: {block_type}")
+        BLOCK_TYPE_IDS[block_type] = type_id
+        BLOCK_TYPE_NAMES.append(block_type)
+    return type_id
 
 # #region agent log
 DEBUG_ENABLED = False  # 성능 최적화를 위해 비활성화
@@ -42,11 +89,15 @@ class Block:
         self.x = x
         self.y = y
         self.block_type = block_type
+        self.type_id = get_block_type_id(block_type)
+        self.is_solid = block_type not in NON_SOLID_BLOCK_TYPES
         self.block_size = block_size
         # 블록은 정확히 block_size 크기 (간격 없이 붙어있도록)
         self.width = block_size
         self.height = block_size
         self.image = None
+        self.image_path = None  # 이미지를 읽은 Piskel 파일 (폴백 이미지면 None)
+        self.sheet = None  # Piskel 이미지 블록의 스프라이트 시트 (프레임이 여러 개면 애니메이션)
         self.load_image()
         # #region agent log
         debug_log("world.py:23", "Block.__init__ after load_image", {"block_type": self.block_type, "image_is_none": self.image is None}, "A")
@@ -70,32 +121,21 @@ class Block:
         # #region agent log
         debug_log("world.py:30", "Block.load_image called", {"block_type": self.block_type}, "A")
         # #endregion
-        image_paths = {
-            'ground': 'fig/block/ground.piskel',
-            'tree': 'fig/block/tree.piskel',
-            'tree_leaf': 'fig/block/tree_leaf.piskel',
-            'wood_plank': 'fig/block/나무판자.piskel',
-            'plank_board': 'fig/block/판자판.piskel',
-            'water': 'fig/block/water.piskel',  # 물 piskel 이미지 사용
-            'portal': 'fig/block/portal.piskel',
-            'rock': 'fig/block/rock.piskel',
-        }
-        
-        if self.block_type in image_paths:
-            image_path = image_paths[self.block_type]
+        if self.block_type in BLOCK_IMAGE_PATHS:
+            image_path = BLOCK_IMAGE_PATHS[self.block_type]
             # #region agent log
             debug_log("world.py:41", "Loading image", {"block_type": self.block_type, "image_path": image_path}, "A")
             # #endregion
-            self.image = PiskelLoader.load_piskel(image_path)
+            # 블록 크기를 정확히 block_size에 맞게 (간격 없이 붙어있도록, 같은 종류 블록끼리 공유)
+            self.image = PiskelLoader.load_variant(image_path, (self.block_size, self.block_size))
             # #region agent log
-            debug_log("world.py:43", "After load_piskel", {"block_type": self.block_type, "image_is_none": self.image is None, "image_path": image_path}, "A")
+            debug_log("world.py:43", "After load_variant", {"block_type": self.block_type, "image_is_none": self.image is None, "image_path": image_path}, "A")
             # #endregion
             if self.image:
-                # 블록 크기를 정확히 block_size에 맞게 (간격 없이 붙어있도록)
-                self.image = pygame.transform.scale(self.image, (self.block_size, self.block_size))
-                # #region agent log
-                debug_log("world.py:46", "Image scaled", {"block_type": self.block_type}, "A")
-                # #endregion
+                self.image_path = image_path
+                # 스프라이트 시트 (같은 종류 블록끼리 공유, 프레임이 여러 개면 애니메이션 블록)
+                # 디코딩 중이거나 파일이 바뀌었으면 get_frame_index에서 새 시트로 교체
+                self.sheet = SpriteSheet.load(image_path, (self.block_size, self.block_size))
         
         if not self.image:
             # #region agent log
@@ -127,60 +167,116 @@ class Block:
         """블록의 충돌 사각형 반환"""
         return pygame.Rect(self.x, self.y, self.block_size, self.block_size)
     
-    def draw(self, screen, camera_x, camera_y, dt=0.0):
-        """블록 그리기 - 최적화된 버전"""
-        # dt가 None이거나 음수인 경우 처리
-        if dt is None or dt < 0:
-            dt = 0.0
-            
-        screen_x = int(self.x - camera_x)
-        screen_y = int(self.y - camera_y)
+    def get_frame_index(self):
+        """현재 애니메이션 프레임 번호 (정지 블록은 0)"""
+        sheet = self.sheet
+        if sheet is None:
+            return 0
+        if sheet.pending:
+            sheet = self.sheet = sheet.refresh()
+            if sheet.pending and not PiskelLoader.is_pending(self.image_path):
+                # 미리 로드한 파일을 읽지 못함 - 자리 표시 이미지 대신 종류별 폴백 이미지로
+                self.image = None
+                self.image_path = None
+                self.sheet = None
+                self.load_image()
+                return 0
+        return int(animation_clock.time * sheet.fps) % len(sheet.frames)
+    
+    def get_frame(self):
+        """그릴 이미지 반환 (애니메이션 블록은 현재 프레임)"""
+        if self.sheet is None:
+            return self.image
+        return self.sheet.frames[self.get_frame_index()]
+    
+    def get_sprite(self, dt=0.0):
+        """그릴 스프라이트 (아틀라스 Surface, 영역) 반환 - portal은 색조 애니메이션 진행
         
-        # 화면 밖이면 그리지 않음 (더 빠른 검사)
-        screen_width = screen.get_width()
-        screen_height = screen.get_height()
-        if (screen_x < -self.block_size or screen_x > screen_width + self.block_size or
-            screen_y < -self.block_size or screen_y > screen_height + self.block_size):
-            return
-        
-        # #region agent log
-        if self.block_type == 'tree':
-            debug_log("world.py:62", "Drawing tree block", {"block_type": self.block_type, "image_is_none": self.image is None}, "A")
-        # #endregion
+        애니메이션 블록은 공유 애니메이션 시계 기준 현재 프레임, 같은 종류 블록끼리 아틀라스 영역을 공유
+        """
+        size = (self.block_size, self.block_size)
+        tint = None
         
         # portal 애니메이션 처리
         if self.block_type == 'portal':
-            self.animation_time += dt
+            # dt가 None이거나 음수인 경우 처리
+            if dt is not None and dt > 0:
+                self.animation_time += dt
             # 색상이 변하는 애니메이션 (보라색 -> 파란색 -> 보라색)
             color_cycle = (math.sin(self.animation_time * 3.0) + 1.0) / 2.0  # 0.0 ~ 1.0
+            # 32단계로 나눠서 같은 색조 이미지를 아틀라스에서 재사용
+            color_cycle = round(color_cycle * 31) / 31
             # 보라색(128, 0, 128)과 파란색(0, 0, 255) 사이를 보간
             r = int(128 + (0 - 128) * color_cycle)
             g = int(0 + (0 - 0) * color_cycle)
             b = int(128 + (255 - 128) * color_cycle)
-            
-            # 원본 이미지가 있으면 색상 조정, 없으면 새로 생성
-            if self.image:
-                # 이미지 복사 후 색상 조정
-                try:
-                    animated_image = self.image.copy()
-                    # 색상 조정 (HSV 방식보다 간단한 방법)
-                    color_mult = pygame.Surface((self.block_size, self.block_size))
-                    color_mult.fill((r, g, b))
-                    animated_image.blit(color_mult, (0, 0), special_flags=pygame.BLEND_MULT)
-                    screen.blit(animated_image, (screen_x, screen_y))
-                except Exception:
-                    # 오류 발생 시 단순히 원본 이미지 표시
-                    screen.blit(self.image, (screen_x, screen_y))
-            else:
-                # 폴백 이미지
-                portal_surface = pygame.Surface((self.block_size, self.block_size))
-                portal_surface.fill((r, g, b))
-                screen.blit(portal_surface, (screen_x, screen_y))
-        else:
-            # 블록 그리기 (그림자 제거하여 성능 최적화)
-            if self.image:
-                # 모든 블록을 동일하게 그리기 (물도 일반 이미지로 처리하여 성능 향상)
-                screen.blit(self.image, (screen_x, screen_y))
+            tint = (r, g, b)
+        
+        if self.image_path:
+            sprite = atlas.get_sprite(self.image_path, size, frame=self.get_frame_index(), tint=tint)
+            if sprite:
+                return sprite
+        
+        # 폴백 이미지 (종류/색조별로 아틀라스에 한 번만 추가)
+        image = self.image
+        if image is None:
+            return None
+        if tint is None:
+            return atlas.get_surface(('block', self.block_type, size), lambda: image)
+        
+        def make_tinted():
+            tinted_image = image.copy()
+            tinted_image.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+            return tinted_image
+        return atlas.get_surface(('block', self.block_type, size, tint), make_tinted)
+    
+    def draw(self, screen, camera_x, camera_y, dt=0.0):
+        """블록 하나 그리기 (청크는 Chunk.collect_blits로 한 번에 그림)"""
+        sprite = self.get_sprite(dt)
+        if sprite:
+            screen.blit(sprite[0], (int(self.x - camera_x), int(self.y - camera_y)), sprite[1])
+
+
+class ChunkSnapshot:
+    """청크의 읽기 전용 스냅샷 - 작업 스레드에서 잠금 없이 읽을 수 있음"""
+    
+    __slots__ = ('chunk_x', 'chunk_y', 'revision', 'block_types')
+    
+    def __init__(self, chunk_x, chunk_y, revision, block_types):
+        self.chunk_x = chunk_x
+        self.chunk_y = chunk_y
+        self.revision = revision
+        self.block_types = MappingProxyType(block_types)  # {(block_x, block_y): block_type}
+    
+    def get_block_type(self, block_x, block_y):
+        """청크 내부 좌표의 블록 타입 반환 (없으면 None)"""
+        return self.block_types.get((block_x, block_y))
+
+
+class WorldSnapshot:
+    """여러 청크 스냅샷 묶음 - 작업 스레드용 월드 읽기 뷰"""
+    
+    def __init__(self, chunk_size, chunk_snapshots):
+        self.chunk_size = chunk_size
+        self.chunks = chunk_snapshots  # {(chunk_x, chunk_y): ChunkSnapshot}
+    
+    def get_revisions(self):
+        """스냅샷에 포함된 청크 revision 반환 (작업 결과 반영 시 비교용)"""
+        return {key: snapshot.revision for key, snapshot in self.chunks.items()}
+    
+    def get_block_type_at(self, block_x, block_y):
+        """블록 인덱스의 블록 타입 반환 (청크가 없거나 빈 칸이면 None)"""
+        chunk_x, local_x = divmod(block_x, self.chunk_size)
+        chunk_y, local_y = divmod(block_y, self.chunk_size)
+        snapshot = self.chunks.get((chunk_x, chunk_y))
+        if snapshot is None:
+            return None
+        return snapshot.block_types.get((local_x, local_y))
+    
+    def is_solid_at(self, block_x, block_y):
+        """블록 인덱스가 통과 불가 블록인지 (물은 통과 가능)"""
+        block_type = self.get_block_type_at(block_x, block_y)
+        return block_type is not None and block_type != 'water'
 
 
 class Chunk:
@@ -192,6 +288,10 @@ class Chunk:
         self.block_size = block_size
         self.blocks = {}  # {(block_x, block_y): Block}
         self.generated = False
+        self.edited = False  # 플레이어가 수정한 청크인지 (세이브 대상)
+        self.revision = next(_revision_counter)  # 블록이 바뀔 때마다 새 값 (스냅샷/세이브 캐시 무효화용)
+        self._snapshot = None  # 마지막 스냅샷 (revision이 같으면 재사용)
+        self.type_index = {block_type: set() for block_type in INDEXED_BLOCK_TYPES}  # {block_type: {(block_x, block_y)}}
     
     def get_world_x(self):
         """청크의 월드 X 좌표"""
@@ -212,7 +312,17 @@ class Chunk:
         # #region agent log
         debug_log("world.py:111", "Block created and added", {"block_type": block.block_type, "actual_block_type": block.block_type}, "A")
         # #endregion
+        self.put_block(block_x, block_y, block)
+    
+    def put_block(self, block_x, block_y, block):
+        """생성된 블록을 청크에 배치 (타입 인덱스 갱신)"""
+        old_block = self.blocks.get((block_x, block_y))
+        if old_block and old_block.block_type in self.type_index:
+            self.type_index[old_block.block_type].discard((block_x, block_y))
         self.blocks[(block_x, block_y)] = block
+        if block.block_type in self.type_index:
+            self.type_index[block.block_type].add((block_x, block_y))
+        self.revision = next(_revision_counter)
     
     def has_block(self, block_x, block_y):
         """블록이 있는지 확인"""
@@ -225,35 +335,77 @@ class Chunk:
     def remove_block(self, block_x, block_y):
         """블록 제거"""
         if (block_x, block_y) in self.blocks:
-            del self.blocks[(block_x, block_y)]
+            block = self.blocks.pop((block_x, block_y))
+            if block.block_type in self.type_index:
+                self.type_index[block.block_type].discard((block_x, block_y))
+            self.revision = next(_revision_counter)
     
-    def draw(self, screen, camera_x, camera_y, dt=0.0):
-        """청크의 모든 블록 그리기 - 최적화된 버전"""
-        screen_width = screen.get_width()
-        screen_height = screen.get_height()
+    def snapshot(self):
+        """읽기 전용 스냅샷 반환 - 마지막 변경 이후 스냅샷이 있으면 복사 없이 재사용
+        
+        작업 스레드에서 호출해도 안전: dict 복사는 GIL 아래에서 한 번에 수행되고,
+        복사 전후 revision이 다르면(도중에 메인 스레드가 수정) 다시 복사
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.revision == self.revision:
+            return snapshot
+        while True:
+            revision = self.revision
+            blocks = self.blocks.copy()
+            if revision == self.revision:
+                break
+        block_types = {pos: block.block_type for pos, block in blocks.items()}
+        snapshot = ChunkSnapshot(self.chunk_x, self.chunk_y, revision, block_types)
+        self._snapshot = snapshot
+        return snapshot
+    
+    def load_block_types(self, block_types):
+        """블록 타입 상태({(block_x, block_y): block_type})로 청크 블록 전체 교체"""
+        self.blocks.clear()
+        for positions in self.type_index.values():
+            positions.clear()
+        for (block_x, block_y), block_type in block_types.items():
+            self.add_block(block_x, block_y, block_type)
+    
+    def collect_blits(self, blits, sprites, camera_x, camera_y, screen_width, screen_height, dt=0.0):
+        """화면 안 블록의 (아틀라스 Surface, 화면 위치, 영역)을 blits에 추가
         
+        sprites: 이번 프레임의 블록 종류별 스프라이트 캐시 (portal은 블록마다 색조가 달라 제외)
+        """
         # 화면 범위 계산 (마진 추가하여 부드러운 스크롤)
         margin = self.block_size * 2
         screen_left = camera_x - margin
         screen_right = camera_x + screen_width + margin
         screen_top = camera_y - margin
         screen_bottom = camera_y + screen_height + margin
+        append = blits.append
         
         for block in self.blocks.values():
             # 화면 밖 블록은 그리지 않음 (성능 최적화) - 빠른 AABB 검사
-            block_right = block.x + block.width
-            block_bottom = block.y + block.height
-            if (block_right < screen_left or block.x > screen_right or
-                block_bottom < screen_top or block.y > screen_bottom):
+            block_x = block.x
+            block_y = block.y
+            if (block_x + block.width < screen_left or block_x > screen_right or
+                block_y + block.height < screen_top or block_y > screen_bottom):
                 continue
-            try:
-                block.draw(screen, camera_x, camera_y, dt)
-            except Exception:
-                # 오류 발생 시 기본 렌더링
-                if block.image:
-                    screen_x = int(block.x - camera_x)
-                    screen_y = int(block.y - camera_y)
-                    screen.blit(block.image, (screen_x, screen_y))
+            block_type = block.block_type
+            sprite = sprites.get(block_type)
+            if sprite is None:
+                try:
+                    sprite = block.get_sprite(dt)
+                except Exception:
+                    # 오류 발생 시 기본 이미지
+                    sprite = (block.image, block.image.get_rect()) if block.image else None
+                if sprite is None:
+                    continue
+                if block_type != 'portal':
+                    sprites[block_type] = sprite
+            append((sprite[0], (int(block_x - camera_x), int(block_y - camera_y)), sprite[1]))
+    
+    def draw(self, screen, camera_x, camera_y, dt=0.0):
+        """청크의 모든 블록 그리기 - blits 한 번으로"""
+        blits = []
+        self.collect_blits(blits, {}, camera_x, camera_y, screen.get_width(), screen.get_height(), dt)
+        screen.blits(blits, doreturn=False)
 
 
 class World:
@@ -264,6 +416,10 @@ class World:
         self.chunk_size = 12  # 1청크 = 12블록
         self.chunks = {}  # {(chunk_x, chunk_y): Chunk}
         self.generated_chunks = set()
+        self.is_other_world = False  # 다른 세계 여부
+        self.stored_chunks = {}  # 언로드된 수정 청크 {(chunk_x, chunk_y): 읽기 전용 {(block_x, block_y): block_type}}
+        self.journal = None  # 블록 편집 저널 (save_system.WriteAheadJournal)
+        self.stored_entities = {}  # 언로드된 청크에 있던 엔티티 {(chunk_x, chunk_y): [(kind, state)]}
     
     def get_chunk(self, chunk_x, chunk_y):
         """청크 가져오기 또는 생성"""
@@ -278,6 +434,9 @@ class World:
         if key in self.generated_chunks:
             return
         
+        if self.restore_stored_chunk(chunk_x, chunk_y):
+            return
+        
         chunk = self.get_chunk(chunk_x, chunk_y)
         
         # 기본 플랫폼 생성 (두께 2-3블록, y=1부터 시작하여 나무 생성 공간 확보)
@@ -317,8 +476,8 @@ class World:
                 else:
                     current_height = mountain_height
                 
-                # 산 블록 생성
-                for y in range(platform_thickness, platform_thickness + current_height):
+                # 산 블록 생성 (청크 안으로 제한 - 청크 밖 로컬 좌표는 격자 조회/충돌에서 보이지 않음)
+                for y in range(platform_thickness, min(platform_thickness + current_height, self.chunk_size)):
                     if not chunk.has_block(x, y):
                         chunk.add_block(x, y, 'ground')
         
@@ -403,6 +562,9 @@ class World:
         if key in self.generated_chunks:
             return
         
+        if self.restore_stored_chunk(chunk_x, chunk_y):
+            return
+        
         chunk = self.get_chunk(chunk_x, chunk_y)
         
         # 청크의 월드 y 좌표 범위 계산
@@ -736,8 +898,120 @@ class World:
                 chunks_to_remove.append((chunk_x, chunk_y))
         
         for key in chunks_to_remove:
-            del self.chunks[key]
+            chunk = self.chunks.pop(key)
             self.generated_chunks.discard(key)
+            # 플레이어가 수정한 청크는 다시 로드될 때 복원하도록 보관
+            if chunk.edited:
+                self.stored_chunks[key] = chunk.snapshot().block_types
+    
+    def restore_stored_chunk(self, chunk_x, chunk_y):
+        """보관된 수정 청크가 있으면 생성 대신 복원"""
+        key = (chunk_x, chunk_y)
+        block_types = self.stored_chunks.pop(key, None)
+        if block_types is None:
+            return False
+        chunk = self.get_chunk(chunk_x, chunk_y)
+        chunk.load_block_types(block_types)
+        chunk.edited = True
+        chunk.generated = True
+        self.generated_chunks.add(key)
+        return True
+    
+    def reset_chunks(self, is_other_world):
+        """세계 전환 - 로드/보관된 청크를 모두 버림"""
+        self.is_other_world = is_other_world
+        self.chunks.clear()
+        self.generated_chunks.clear()
+        self.stored_chunks.clear()
+        self.stored_entities.clear()
+        if self.journal:
+            self.journal.log_dimension(is_other_world)
+    
+    def store_entity(self, chunk_key, kind, state):
+        """언로드된 청크에 엔티티 상태 보관 (청크가 다시 로드되면 take_loaded_entities로 복원)"""
+        self.stored_entities.setdefault(chunk_key, []).append((kind, state))
+    
+    def take_loaded_entities(self, kind):
+        """로드된 청크에 보관된 kind 엔티티 상태를 꺼내서 반환"""
+        states = []
+        if not self.stored_entities:
+            return states
+        for key in [key for key in self.stored_entities if key in self.chunks]:
+            entities = self.stored_entities[key]
+            states.extend(state for entity_kind, state in entities if entity_kind == kind)
+            remaining = [entity for entity in entities if entity[0] != kind]
+            if remaining:
+                self.stored_entities[key] = remaining
+            else:
+                del self.stored_entities[key]
+        return states
+    
+    def get_stored_entities(self, kind):
+        """보관된 kind 엔티티 [(청크 키, 상태)] 반환 (꺼내지 않음)"""
+        return [(key, state) for key, entities in self.stored_entities.items()
+                for entity_kind, state in entities if entity_kind == kind]
+    
+    def discard_stored_entities(self, kind):
+        """보관된 kind 엔티티 전부 버림"""
+        if not self.stored_entities:
+            return
+        for key in list(self.stored_entities):
+            remaining = [entity for entity in self.stored_entities[key] if entity[0] != kind]
+            if remaining:
+                self.stored_entities[key] = remaining
+            else:
+                del self.stored_entities[key]
+    
+    def load_chunk_state(self, chunk_x, chunk_y, block_types):
+        """세이브된 청크 상태 적용 (로드된 청크는 즉시 교체, 아니면 보관)"""
+        key = (chunk_x, chunk_y)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            self.stored_chunks[key] = block_types
+            return
+        chunk.load_block_types(block_types)
+        chunk.edited = True
+        chunk.generated = True
+        self.generated_chunks.add(key)
+    
+    def snapshot_chunks(self, min_chunk_x, min_chunk_y, max_chunk_x, max_chunk_y):
+        """청크 범위의 읽기 전용 스냅샷 (작업 스레드에 넘겨 잠금 없이 읽기)"""
+        chunks = self.chunks.copy()  # 메인 스레드가 청크를 추가/제거해도 안전하도록 복사
+        snapshots = {}
+        for chunk_x in range(min_chunk_x, max_chunk_x + 1):
+            for chunk_y in range(min_chunk_y, max_chunk_y + 1):
+                chunk = chunks.get((chunk_x, chunk_y))
+                if chunk:
+                    snapshots[(chunk_x, chunk_y)] = chunk.snapshot()
+        return WorldSnapshot(self.chunk_size, snapshots)
+    
+    def snapshot_around(self, x, y, chunk_radius):
+        """월드 좌표 주변 chunk_radius 청크 범위의 스냅샷"""
+        center_x = get_chunk_coord(x, self.chunk_size * self.block_size)
+        center_y = get_chunk_coord(y, self.chunk_size * self.block_size)
+        return self.snapshot_chunks(center_x - chunk_radius, center_y - chunk_radius,
+                                    center_x + chunk_radius, center_y + chunk_radius)
+    
+    def get_chunk_revision(self, chunk_x, chunk_y):
+        """로드된 청크의 현재 revision (로드되지 않았으면 None)"""
+        chunk = self.chunks.get((chunk_x, chunk_y))
+        return chunk.revision if chunk else None
+    
+    def is_snapshot_current(self, snapshot):
+        """스냅샷 이후 해당 청크들이 바뀌지 않았는지 (작업 결과를 반영해도 되는지)"""
+        for key, chunk_snapshot in snapshot.chunks.items():
+            chunk = self.chunks.get(key)
+            if chunk is None or chunk.revision != chunk_snapshot.revision:
+                return False
+        return True
+    
+    def get_edited_chunk_sources(self):
+        """수정된 청크 전체 반환 - 로드된 청크는 Chunk, 보관된 청크는 블록 타입 dict"""
+        sources = dict(self.stored_chunks)
+        for key, chunk in self.chunks.items():
+            if chunk.edited:
+                sources[key] = chunk
+        return sources
     
     def find_ground_y(self, x, player_bottom, height):
         """플레이어 발 아래 블록 위에 정확히 서도록 Y 좌표 찾기 - 최적화된 버전"""
@@ -859,43 +1133,145 @@ class World:
         
         return False
     
+    def is_solid_block_at(self, block_x, block_y):
+        """블록 인덱스에 통과 불가 블록이 있는지 (로드되지 않은 청크는 빈 칸)"""
+        chunk_size = self.chunk_size
+        chunk = self.chunks.get((block_x // chunk_size, block_y // chunk_size))
+        if not chunk:
+            return False
+        block = chunk.blocks.get((block_x % chunk_size, block_y % chunk_size))
+        return block is not None and block.is_solid
+    
+    def sweep_aabb(self, x, y, width, height, dx, dy):
+        """연속 충돌 처리 - AABB를 X축, Y축 순서로 이동시키며 지나가는 타일 줄을 모두 검사
+        
+        이동 거리와 상관없이 블록을 통과하지 않음 (축마다 충돌 검사 1회)
+        Returns:
+            (new_x, new_y, on_ground, hit_ceiling, hit_wall)
+        """
+        block_size = self.block_size
+        eps = 1e-6
+        is_solid = self.is_solid_block_at
+        hit_wall = False
+        on_ground = False
+        hit_ceiling = False
+        
+        # X축 이동
+        new_x = x + dx
+        if dx != 0:
+            top_row = int(y // block_size)
+            bottom_row = int((y + height - eps) // block_size)
+            if dx > 0:
+                start_col = int((x + width - eps) // block_size) + 1
+                end_col = int((x + width + dx - eps) // block_size)
+                col_step = 1
+            else:
+                start_col = int(x // block_size) - 1
+                end_col = int((x + dx) // block_size)
+                col_step = -1
+            for col in range(start_col, end_col + col_step, col_step):
+                if any(is_solid(col, row) for row in range(top_row, bottom_row + 1)):
+                    # 처음 막히는 열 바로 앞에서 정지
+                    new_x = col * block_size - width if dx > 0 else (col + 1) * block_size
+                    hit_wall = True
+                    break
+        
+        # Y축 이동 (X축 이동 후 위치 기준)
+        left_col = int(new_x // block_size)
+        right_col = int((new_x + width - eps) // block_size)
+        new_y = y + dy
+        if dy != 0:
+            if dy > 0:
+                start_row = int((y + height - eps) // block_size) + 1
+                end_row = int((y + height + dy - eps) // block_size)
+                row_step = 1
+            else:
+                start_row = int(y // block_size) - 1
+                end_row = int((y + dy) // block_size)
+                row_step = -1
+            for row in range(start_row, end_row + row_step, row_step):
+                if any(is_solid(col, row) for col in range(left_col, right_col + 1)):
+                    if dy > 0:
+                        new_y = row * block_size - height
+                        on_ground = True
+                    else:
+                        new_y = (row + 1) * block_size
+                        hit_ceiling = True
+                    break
+        
+        # 정지 상태에서도 발이 블록 윗면에 딱 붙어 있으면 바닥으로 판정
+        if not on_ground and dy >= 0:
+            bottom = new_y + height
+            if abs(bottom - round(bottom / block_size) * block_size) < 0.01:
+                below_row = int(round(bottom / block_size))
+                on_ground = any(is_solid(col, below_row) for col in range(left_col, right_col + 1))
+        
+        return new_x, new_y, on_ground, hit_ceiling, hit_wall
+    
     def check_portal_collision(self, player_x, player_y, player_width, player_height):
-        """포탈과 플레이어의 충돌 검사 (더 넓은 범위로 검사)"""
+        """포탈과 플레이어의 충돌 검사 (청크 포탈 인덱스 사용)"""
         # 플레이어 중심점
         player_center_x = player_x + player_width // 2
         player_center_y = player_y + player_height // 2
         
-        # 플레이어 주변 청크 범위 계산 (더 넓은 범위)
-        search_range = 2  # 2청크 범위까지 검사
-        min_chunk_x = get_chunk_coord(player_x - self.chunk_size * self.block_size * search_range, self.chunk_size * self.block_size)
-        max_chunk_x = get_chunk_coord(player_x + player_width + self.chunk_size * self.block_size * search_range, self.chunk_size * self.block_size)
-        min_chunk_y = get_chunk_coord(player_y - self.chunk_size * self.block_size * search_range, self.chunk_size * self.block_size)
-        max_chunk_y = get_chunk_coord(player_y + player_height + self.chunk_size * self.block_size * search_range, self.chunk_size * self.block_size)
-        
-        # 주변 청크의 포탈 블록 검사
+        # 포탈 블록 크기의 1.5배 범위 내에 있으면 충돌 - 그 범위에 걸치는 청크만 검사
+        collision_range = self.block_size * 1.5
+        collision_range_sq = collision_range * collision_range
+        chunk_pixels = self.chunk_size * self.block_size
+        min_chunk_x = get_chunk_coord(player_center_x - collision_range - self.block_size, chunk_pixels)
+        max_chunk_x = get_chunk_coord(player_center_x + collision_range, chunk_pixels)
+        min_chunk_y = get_chunk_coord(player_center_y - collision_range - self.block_size, chunk_pixels)
+        max_chunk_y = get_chunk_coord(player_center_y + collision_range, chunk_pixels)
+        
+        # 주변 청크의 포탈 인덱스만 검사
+        half_block = self.block_size // 2
         for chunk_x in range(min_chunk_x, max_chunk_x + 1):
             for chunk_y in range(min_chunk_y, max_chunk_y + 1):
                 chunk = self.chunks.get((chunk_x, chunk_y))
-                if chunk:
-                    for block in chunk.blocks.values():
-                        if block.block_type == 'portal':
-                            # 포탈 중심점
-                            portal_center_x = block.x + block.width // 2
-                            portal_center_y = block.y + block.height // 2
-                            
-                            # 플레이어 중심점과 포탈 중심점 사이의 거리
-                            dx = player_center_x - portal_center_x
-                            dy = player_center_y - portal_center_y
-                            distance = (dx * dx + dy * dy) ** 0.5
-                            
-                            # 포탈 블록 크기의 1.5배 범위 내에 있으면 충돌
-                            collision_range = max(block.width, block.height) * 1.5
-                            
-                            if distance <= collision_range:
-                                return True
+                if not chunk or not chunk.type_index['portal']:
+                    continue
+                chunk_world_x = chunk.get_world_x()
+                chunk_world_y = chunk.get_world_y()
+                for local_x, local_y in chunk.type_index['portal']:
+                    # 플레이어 중심점과 포탈 중심점 사이의 거리 (제곱으로 비교)
+                    dx = player_center_x - (chunk_world_x + local_x * self.block_size + half_block)
+                    dy = player_center_y - (chunk_world_y + local_y * self.block_size + half_block)
+                    if dx * dx + dy * dy <= collision_range_sq:
+                        return True
         
         return False
     
+    def find_nearest_block(self, x, y, block_type, chunk_radius=2):
+        """월드 좌표에서 가장 가까운 block_type 블록 찾기 - (block, block_x, block_y) 또는 None
+        
+        INDEXED_BLOCK_TYPES는 청크 타입 인덱스만 확인하고, 그 외 타입은 청크 블록을 순회
+        """
+        chunk_pixels = self.chunk_size * self.block_size
+        center_chunk_x = get_chunk_coord(x, chunk_pixels)
+        center_chunk_y = get_chunk_coord(y, chunk_pixels)
+        half_block = self.block_size / 2
+        
+        best = None
+        best_distance_sq = None
+        for chunk_x in range(center_chunk_x - chunk_radius, center_chunk_x + chunk_radius + 1):
+            for chunk_y in range(center_chunk_y - chunk_radius, center_chunk_y + chunk_radius + 1):
+                chunk = self.chunks.get((chunk_x, chunk_y))
+                if not chunk:
+                    continue
+                if block_type in chunk.type_index:
+                    positions = chunk.type_index[block_type]
+                else:
+                    positions = [pos for pos, block in chunk.blocks.items() if block.block_type == block_type]
+                for local_x, local_y in positions:
+                    block = chunk.blocks[(local_x, local_y)]
+                    dx = block.x + half_block - x
+                    dy = block.y + half_block - y
+                    distance_sq = dx * dx + dy * dy
+                    if best_distance_sq is None or distance_sq < best_distance_sq:
+                        best_distance_sq = distance_sq
+                        best = (block, chunk_x * self.chunk_size + local_x, chunk_y * self.chunk_size + local_y)
+        return best
+    
     def check_on_ground(self, x, y, width, height):
         """바닥에 닿았는지 확인 - 최적화된 버전"""
         # 플레이어 발 아래에 블록이 있는지 확인
@@ -932,6 +1308,126 @@ class World:
         
         return False
     
+    def read_region(self, x0, y0, x1, y1, solid_only=False):
+        """블록 인덱스 사각형 [x0, x1) x [y0, y1)의 타일 ID를 한 번에 읽기
+        
+        청크 경계를 넘어 이어 붙인 bytearray 반환 (행 우선, index = (y - y0) * (x1 - x0) + (x - x0)).
+        빈 칸과 로드되지 않은 청크는 0. solid_only=True면 통과 불가 블록만 1인 마스크
+        """
+        width = max(0, x1 - x0)
+        height = max(0, y1 - y0)
+        region = bytearray(width * height)
+        if not width or not height:
+            return region
+        
+        chunk_size = self.chunk_size
+        min_chunk_x, max_chunk_x = x0 // chunk_size, (x1 - 1) // chunk_size
+        min_chunk_y, max_chunk_y = y0 // chunk_size, (y1 - 1) // chunk_size
+        for chunk_x in range(min_chunk_x, max_chunk_x + 1):
+            base_x = chunk_x * chunk_size - x0
+            for chunk_y in range(min_chunk_y, max_chunk_y + 1):
+                chunk = self.chunks.get((chunk_x, chunk_y))
+                if not chunk:
+                    continue
+                base_y = chunk_y * chunk_size - y0
+                # 청크 전체가 사각형 안에 있으면 경계 검사 생략
+                inside = (base_x >= 0 and base_x + chunk_size <= width and
+                          base_y >= 0 and base_y + chunk_size <= height)
+                for (local_x, local_y), block in chunk.blocks.items():
+                    # 청크 범위 밖 좌표로 들어간 블록(나무 생성 등)은 get_block_at처럼 무시
+                    if not (0 <= local_x < chunk_size and 0 <= local_y < chunk_size):
+                        continue
+                    column = base_x + local_x
+                    row = base_y + local_y
+                    if not inside and not (0 <= column < width and 0 <= row < height):
+                        continue
+                    if solid_only:
+                        if block.is_solid:
+                            region[row * width + column] = 1
+                    else:
+                        region[row * width + column] = block.type_id
+        return region
+    
+    def read_solid_region(self, x0, y0, x1, y1):
+        """read_region의 통과 불가 마스크 버전 (1 = 통과 불가, 0 = 빈 칸/물)"""
+        return self.read_region(x0, y0, x1, y1, solid_only=True)
+    
+    def raycast(self, origin, direction, max_distance):
+        """타일 격자 DDA 레이캐스트 - 광선이 지나는 칸만 검사
+        
+        Args:
+            origin: 시작 월드 좌표 (x, y)
+            direction: 방향 벡터 (dx, dy) - 정규화하지 않아도 됨
+            max_distance: 최대 거리 (픽셀)
+        Returns:
+            (block, block_x, block_y, face) 또는 None
+            face는 맞은 면의 법선 (예: (-1, 0)은 블록의 왼쪽 면), 시작 칸이 막혀 있으면 (0, 0)
+        """
+        origin_x, origin_y = origin
+        dir_x, dir_y = direction
+        length = math.hypot(dir_x, dir_y)
+        if length == 0:
+            return None
+        dir_x /= length
+        dir_y /= length
+        
+        block_size = self.block_size
+        chunk_size = self.chunk_size
+        block_x = int(origin_x // block_size)
+        block_y = int(origin_y // block_size)
+        
+        step_x = 1 if dir_x > 0 else -1
+        step_y = 1 if dir_y > 0 else -1
+        # 다음 세로/가로 격자선까지의 거리, 한 칸을 지나는 데 필요한 거리
+        if dir_x != 0:
+            next_x = (block_x + (1 if step_x > 0 else 0)) * block_size
+            t_max_x = (next_x - origin_x) / dir_x
+            t_delta_x = block_size / abs(dir_x)
+        else:
+            t_max_x = t_delta_x = float('inf')
+        if dir_y != 0:
+            next_y = (block_y + (1 if step_y > 0 else 0)) * block_size
+            t_max_y = (next_y - origin_y) / dir_y
+            t_delta_y = block_size / abs(dir_y)
+        else:
+            t_max_y = t_delta_y = float('inf')
+        
+        face = (0, 0)
+        chunk_key = None
+        chunk = None
+        distance = 0.0
+        while distance <= max_distance:
+            # 같은 청크 안에서는 청크 조회 생략
+            key = (block_x // chunk_size, block_y // chunk_size)
+            if key != chunk_key:
+                chunk_key = key
+                chunk = self.chunks.get(key)
+            if chunk:
+                block = chunk.blocks.get((block_x % chunk_size, block_y % chunk_size))
+                if block and block.is_solid:
+                    return block, block_x, block_y, face
+            
+            if t_max_x < t_max_y:
+                distance = t_max_x
+                t_max_x += t_delta_x
+                block_x += step_x
+                face = (-step_x, 0)
+            else:
+                distance = t_max_y
+                t_max_y += t_delta_y
+                block_y += step_y
+                face = (0, -step_y)
+        return None
+    
+    def has_line_of_sight(self, x0, y0, x1, y1):
+        """두 월드 좌표 사이에 통과 불가 블록이 없는지"""
+        dx = x1 - x0
+        dy = y1 - y0
+        distance = math.hypot(dx, dy)
+        if distance == 0:
+            return True
+        return self.raycast((x0, y0), (dx, dy), distance) is None
+    
     def get_block_at(self, block_x, block_y):
         """블록 인덱스에서 블록 가져오기 (block_x, block_y는 블록 인덱스)"""
         # 블록 인덱스를 청크 좌표로 변환
@@ -978,7 +1474,10 @@ class World:
         
         block = chunk.get_block(local_x, local_y)
         if block:
+            self.mark_chunk_edited(chunk)
             chunk.remove_block(local_x, local_y)
+            if self.journal:
+                self.journal.log_remove(block_x, block_y)
             return block
         return None
     
@@ -1038,10 +1537,51 @@ class World:
         world_y = chunk.get_world_y() + local_y * self.block_size
         block = Block(world_x, world_y, block_type, self.block_size)
         block.is_natural = False
-        chunk.blocks[(local_x, local_y)] = block
+        self.mark_chunk_edited(chunk)
+        chunk.put_block(local_x, local_y, block)
+        if self.journal:
+            self.journal.log_place(block_x, block_y, block_type)
         
         return True
     
+    def mark_chunk_edited(self, chunk):
+        """청크를 수정됨으로 표시 - 처음 수정될 때는 수정 전 블록 전체를 저널에 기록
+        
+        메인 세이브에 없는 청크도 저널 재실행 시 생성기를 다시 돌리지 않고 플레이어가 본 지형 그대로 복원
+        """
+        if chunk.edited:
+            return
+        chunk.edited = True
+        if self.journal:
+            self.journal.log_chunk(chunk.chunk_x, chunk.chunk_y, chunk.snapshot().block_types)
+    
+    def set_block_at(self, block_x, block_y, block_type):
+        """블록 직접 설정 (저널 재실행용, 설치 조건 검사 없음) - block_type이 None이면 제거
+        
+        청크 지형은 세이브나 저널의 청크 레코드에서만 가져옴 (생성기는 호출하지 않음, 없으면 ValueError)
+        """
+        chunk_x, local_x = divmod(block_x, self.chunk_size)
+        chunk_y, local_y = divmod(block_y, self.chunk_size)
+        key = (chunk_x, chunk_y)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            block_types = self.stored_chunks.get(key)
+            if block_types is None:
+                raise ValueError(f"no saved state for chunk {key}")
+            block_types = dict(block_types)  # 보관된 상태는 읽기 전용 (세이브 스냅샷이 그대로 참조)
+            if block_type is None:
+                block_types.pop((local_x, local_y), None)
+            else:
+                block_types[(local_x, local_y)] = block_type
+            self.stored_chunks[key] = block_types
+            return
+        if block_type is None:
+            chunk.remove_block(local_x, local_y)
+        else:
+            chunk.add_block(local_x, local_y, block_type)
+            chunk.blocks[(local_x, local_y)].is_natural = False
+        chunk.edited = True
+    
     def draw(self, screen, camera_x, camera_y, dt=0.0):
         """월드 그리기 - 최적화된 버전"""
         # 화면에 보이는 청크만 그리기 (더 좁은 범위로 최적화)
@@ -1055,9 +1595,13 @@ class World:
         min_chunk_y = get_chunk_coord(camera_y - margin, self.chunk_size * self.block_size)
         max_chunk_y = get_chunk_coord(camera_y + screen_height + margin, self.chunk_size * self.block_size)
         
+        # 모든 청크의 블록을 모아서 blits 한 번으로 그리기 (블록 스프라이트는 아틀라스에서)
+        blits = []
+        sprites = {}
         for chunk_x in range(min_chunk_x, max_chunk_x + 1):
             for chunk_y in range(min_chunk_y, max_chunk_y + 1):
                 chunk = self.chunks.get((chunk_x, chunk_y))
                 if chunk:
-                    chunk.draw(screen, camera_x, camera_y, dt)
+                    chunk.collect_blits(blits, sprites, camera_x, camera_y, screen_width, screen_height, dt)
+        screen.blits(blits, doreturn=False)
 